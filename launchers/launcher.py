@@ -14,6 +14,15 @@
 # limitations under the License.
 # ===============================================================================
 import os
+import sys
+
+if '--profile-startup' in sys.argv:
+    # start profiling before anything else is imported. the profile is written to the log directory once the
+    # application is initialized
+    sys.argv.remove('--profile-startup')
+    from pychron.core.codetools.startup_profiler import startup_profiler
+
+    startup_profiler.start()
 
 from helpers import entry_point
 
@@ -0,0 +1,181 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= standard library imports ========================
+# only the standard library is used so the profiler can be started before anything else is imported
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from importlib.abc import MetaPathFinder
+
+
+# ============= local library imports  ==========================
+
+
+class _TimedLoader(object):
+    """
+    wraps a module loader and records how long executing the module takes
+    """
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self._profiler.import_timer(module.__name__):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+
+class _ImportFinder(MetaPathFinder):
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        # ask the other finders for the spec. guard against finding our own spec again
+        if getattr(self._local, 'finding', False):
+            return
+
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return
+        finally:
+            self._local.finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+class StartupProfiler(object):
+    """
+    records the time taken to import each module and to construct, load and start each plugin.
+
+    import times are measured like ``python -X importtime``. the cumulative time of a module includes the modules it
+    imports, the self time does not. use ``dump`` to write the report
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.imports = []
+        self.timings = []
+
+        self._finder = None
+        self._start = None
+        self._local = threading.local()
+
+    def start(self):
+        if self._finder is None:
+            self._finder = _ImportFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+        self._start = time.perf_counter()
+        self.enabled = True
+
+    def stop(self):
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+        self.enabled = False
+
+    @property
+    def elapsed(self):
+        if self._start is not None:
+            return time.perf_counter() - self._start
+
+    @contextmanager
+    def timeit(self, kind, name):
+        """
+        record the duration of the block as ``kind`` for ``name``, e.g. ('start', 'PipelinePlugin')
+        """
+        if not self.enabled:
+            yield
+            return
+
+        st = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append((kind, name, time.perf_counter() - st))
+
+    @contextmanager
+    def import_timer(self, name):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        # [name, children time]
+        frame = [name, 0]
+        record = [name, len(stack), 0, 0]
+        self.imports.append(record)
+        stack.append(frame)
+        st = time.perf_counter()
+        try:
+            yield
+        finally:
+            et = time.perf_counter() - st
+            stack.pop()
+            if stack:
+                stack[-1][1] += et
+
+            record[2] = et - frame[1]
+            record[3] = et
+
+    def dump(self, path):
+        """
+        write the plugin timings and the import times to ``path``
+        """
+        with open(path, 'w') as wfile:
+            wfile.write('# startup profile {}\n'.format(datetime.now().isoformat()))
+            if self._start is not None:
+                wfile.write('# elapsed {:0.3f} s\n'.format(self.elapsed))
+
+            wfile.write('\n# plugins\n')
+            wfile.write('# {:<10s} {:>10s}  name\n'.format('kind', 'time (ms)'))
+            for kind, name, et in self.timings:
+                wfile.write('{:<12s} {:>10.1f}  {}\n'.format(kind, et * 1000, name))
+
+            wfile.write('\n# imports. cumulative includes the modules imported by the module\n')
+            wfile.write('# {:>10s} {:>16s}  module\n'.format('self (ms)', 'cumulative (ms)'))
+            for name, depth, st, ct in self.imports:
+                wfile.write('{:>12.1f} {:>16.1f}  {}{}\n'.format(st * 1000, ct * 1000, '  ' * depth, name))
+
+        return path
+
+
+startup_profiler = StartupProfiler()
+
+# ============= EOF =============================================
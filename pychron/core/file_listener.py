@@ -30,18 +30,21 @@ class FileListener(object):
     _check_callback = None
     _alive = False
     _freq = None
+    _observer = None
 
-    def __init__(self, path, callback=None, check=None, freq=1):
+    def __init__(self, path, callback=None, check=None, freq=1, use_observer=False):
         """
             two methods for check if the file has changed
             1. check=None
-                a file has changed if its modified time is different from the original modified time
+                a file has changed if its modified time or size is different from the original
             2. check=callable
                 use a callable to compare files
                 e.g experiment_set uses check_for_mods which compares the sha digests of the file contents
 
             freq= in hertz... sleep period =1/freq
 
+            use_observer=True. use watchdog to get file system notifications (inotify, FSEvents, ...) instead of
+            polling. falls back to polling if watchdog is not installed
 
             remember to call stop() to stop checking the file for changes
         """
@@ -52,29 +55,79 @@ class FileListener(object):
 
         self._alive = True
         if os.path.isfile(self._path):
+            if use_observer and check is None and self._start_observer():
+                return
+
+            self._ostat = self._stat()
             t = Thread(target=self._listen)
+            t.daemon = True
             t.start()
 
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def observing(self):
+        return self._observer is not None
+
     @property
     def otime(self):
         return os.stat(self._path).st_mtime
 
     def stop(self):
         self._alive = False
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    def _start_observer(self):
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return
+
+        path = os.path.abspath(self._path)
+        listener = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # editors often save by writing a temporary file and moving it onto path
+                if path in (os.path.abspath(event.src_path),
+                            os.path.abspath(getattr(event, 'dest_path', '') or '')):
+                    if listener._alive:
+                        listener._callback()
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(Handler(), os.path.dirname(path))
+        observer.start()
+        self._observer = observer
+        return True
+
+    def _stat(self):
+        st = os.stat(self._path)
+        return st.st_mtime, st.st_size
 
     def _listen(self):
-        self._otime = self.otime
         while self._alive:
             time.sleep(1 / self._freq)
-            if self._check():
+            if self._alive and self._check():
                 self._callback()
-                self._otime = self.otime
+                try:
+                    self._ostat = self._stat()
+                except OSError:
+                    pass
 
     def _check(self):
         if self._check_callback:
             return self._check_callback()
         else:
-            return self.otime != self._otime
+            try:
+                return self._stat() != self._ostat
+            except OSError:
+                return False
 
 
 # ============= EOF =============================================
@@ -20,6 +20,10 @@
 import base64
 import struct
 
+from numpy import dtype, frombuffer, asarray, column_stack
+
+BYTEORDER_MAP = {'>': '>', '<': '<', '!': '>', '=': '=', '@': '='}
+
 
 def format_blob(blob):
     return base64.b64decode(blob)
@@ -33,6 +37,24 @@ def encode_blob(blob):
         return base64.b64encode(blob).decode('utf-8')
 
 
+def get_dtype(fmt):
+    """
+    convert a homogeneous struct format e.g. ">ff" to a numpy dtype
+
+    @param fmt: struct format string
+    @return: (dtype, number of columns) or (None, 0) if ``fmt`` cannot be represented by a single dtype
+    """
+    byteorder = '='
+    if fmt and fmt[0] in BYTEORDER_MAP:
+        byteorder = BYTEORDER_MAP[fmt[0]]
+        fmt = fmt[1:]
+
+    if fmt and fmt[0] in 'fd' and fmt == fmt[0] * len(fmt):
+        return dtype('{}{}'.format(byteorder, fmt[0])), len(fmt)
+
+    return None, 0
+
+
 def pack(fmt, data):
     """
     data should be something like [(x0,y0),(x1,y1), (xN,yN)]
@@ -40,11 +62,46 @@ def pack(fmt, data):
     @param data:
     @return:
     """
-    # if len(args) > 1:
-    #     args = zip(args)
-    # b = b''
+    dt, ncols = get_dtype(fmt)
+    if dt is None:
+        return b''.join([struct.pack(fmt, *datum) for datum in data])
+
+    data = asarray(data, dtype=float)
+    if not data.size:
+        return b''
+
+    return data.reshape(-1, ncols).astype(dt).tobytes()
+
+
+def pack_arrays(fmt, *columns):
+    """
+    pack parallel columns e.g. pack_arrays('>ff', xs, ys). equivalent to pack(fmt, zip(xs, ys))
+    """
+    dt, ncols = get_dtype(fmt)
+    if dt is None or ncols != len(columns):
+        return pack(fmt, zip(*columns))
 
-    return b''.join([struct.pack(fmt, *datum) for datum in data])
+    n = min(len(c) for c in columns)
+    return column_stack([asarray(c[:n], dtype=float) for c in columns]).astype(dt).tobytes()
+
+
+def unpack_array(blob, fmt='>ff', decode=False):
+    """
+    zero-copy unpack of ``blob`` into a (ncols, npoints) array.
+
+    incomplete trailing points (truncated blobs) are dropped
+
+    @return: array or None if ``fmt`` is not supported
+    """
+    if decode:
+        blob = format_blob(blob)
+
+    dt, ncols = get_dtype(fmt)
+    if dt is None:
+        return
+
+    n = len(blob) // (dt.itemsize * ncols)
+    return frombuffer(blob, dtype=dt, count=n * ncols).reshape(n, ncols).T
 
 
 def unpack(blob, fmt='>ff', step=8, decode=False):
@@ -52,6 +109,10 @@ def unpack(blob, fmt='>ff', step=8, decode=False):
         blob = format_blob(blob)
 
     if blob:
+        arr = unpack_array(blob, fmt)
+        if arr is not None:
+            return list(zip(*arr.T.tolist()))
+
         try:
             return list(zip(*[struct.unpack(fmt, blob[i:i + step]) for i in range(0, len(blob), step)]))
         except struct.error:
@@ -65,6 +126,6 @@ def unpack(blob, fmt='>ff', step=8, decode=False):
             return list(zip(*ret))
 
     else:
-        return [[] for _ in fmt.count('f')]
+        return [[] for _ in range(len(fmt.strip('<>!=@')))]
 
 # ============= EOF =============================================
@@ -0,0 +1,98 @@
+import struct
+import unittest
+
+from numpy import linspace, array_equal
+
+from pychron.core.helpers.binpack import pack, unpack, unpack_array, pack_arrays, encode_blob, get_dtype
+
+
+def struct_pack(fmt, data):
+    return b''.join([struct.pack(fmt, *datum) for datum in data])
+
+
+def struct_unpack(blob, fmt='>ff', step=8):
+    ret = []
+    for i in range(0, len(blob), step):
+        try:
+            args = struct.unpack(fmt, blob[i:i + step])
+        except struct.error:
+            break
+        ret.append(args)
+    return list(zip(*ret))
+
+
+class BinpackTestCase(unittest.TestCase):
+    def setUp(self):
+        self.xs = linspace(0, 100, 1001)
+        self.ys = self.xs ** 0.5 + 1.123456789
+        self.data = list(zip(self.xs, self.ys))
+
+    def test_get_dtype(self):
+        dt, n = get_dtype('>ff')
+        self.assertEqual(dt.str, '>f4')
+        self.assertEqual(n, 2)
+
+        dt, n = get_dtype('<fff')
+        self.assertEqual(dt.str, '<f4')
+        self.assertEqual(n, 3)
+
+        dt, n = get_dtype('>fh')
+        self.assertIsNone(dt)
+
+    def test_pack(self):
+        for fmt in ('>ff', '<ff', '>dd'):
+            self.assertEqual(pack(fmt, self.data), struct_pack(fmt, self.data))
+
+    def test_pack_arrays(self):
+        self.assertEqual(pack_arrays('>ff', self.xs, self.ys), struct_pack('>ff', self.data))
+
+    def test_pack_arrays_unequal(self):
+        self.assertEqual(pack_arrays('>ff', self.xs, self.ys[:-10]), struct_pack('>ff', self.data[:-10]))
+
+    def test_pack_empty(self):
+        self.assertEqual(pack('>ff', []), b'')
+        self.assertEqual(pack_arrays('>ff', [], []), b'')
+
+    def test_pack_mixed(self):
+        data = [(1, 2.5), (3, 4.5)]
+        self.assertEqual(pack('>hf', data), struct_pack('>hf', data))
+
+    def test_unpack(self):
+        blob = struct_pack('>ff', self.data)
+        self.assertEqual(unpack(blob), struct_unpack(blob))
+
+    def test_unpack_decode(self):
+        blob = struct_pack('>ff', self.data)
+        self.assertEqual(unpack(encode_blob(blob), decode=True), struct_unpack(blob))
+
+    def test_unpack_truncated(self):
+        blob = struct_pack('>ff', self.data)[:-3]
+        self.assertEqual(unpack(blob), struct_unpack(blob))
+        self.assertEqual(len(unpack(blob)[0]), len(self.data) - 1)
+
+    def test_unpack_array(self):
+        blob = struct_pack('>ff', self.data)
+        xs, ys = unpack_array(blob)
+        exs, eys = struct_unpack(blob)
+        self.assertTrue(array_equal(xs, exs))
+        self.assertTrue(array_equal(ys, eys))
+
+    def test_unpack_array_truncated(self):
+        blob = struct_pack('>ff', self.data)[:-5]
+        xs, ys = unpack_array(blob)
+        exs, eys = struct_unpack(blob)
+        self.assertTrue(array_equal(xs, exs))
+        self.assertTrue(array_equal(ys, eys))
+
+    def test_unpack_empty(self):
+        self.assertEqual(unpack(b''), [[], []])
+
+    def test_roundtrip(self):
+        blob = pack_arrays('>ff', self.xs, self.ys)
+        xs, ys = unpack_array(blob)
+        self.assertTrue(array_equal(xs, self.xs.astype('>f4')))
+        self.assertTrue(array_equal(ys, self.ys.astype('>f4')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,6 +34,9 @@ class MeanRegressor(BaseRegressor):
     def fast_predict2(self, endog, exog):
         return full(exog.shape[0], endog.mean())
 
+    def fast_predict_batch(self, endogs, exog):
+        return self._fill_batch(endogs.mean(axis=1), exog)
+
     def calculate(self, filtering=False, **kw):
         # cxs, cys = self.pre_clean_ys, self.pre_clean_ys
         if not filtering:
@@ -143,6 +146,10 @@ sem={}
     def calculate_standard_error_fit(self):
         return self.std
 
+    def _fill_batch(self, means, exog):
+        npts = exog.shape[1] if exog.ndim == 3 else exog.shape[0]
+        return means[:, None].repeat(npts, axis=1)
+
     def _check_integrity(self, x, y):
         nx, ny = x.shape[0], y.shape[0]
         if not nx or not ny:
@@ -161,6 +168,10 @@ class WeightedMeanRegressor(MeanRegressor):
         mean = average(endog, weights=ws)
         return full(exog.shape[0], mean)
 
+    def fast_predict_batch(self, endogs, exog):
+        ws = self._get_weights()
+        return self._fill_batch(average(endogs, axis=1, weights=ws), exog)
+
     @property
     def se(self):
         """
@@ -16,13 +16,14 @@
 # ============= enthought library imports =======================
 import logging
 
-from numpy import asarray, column_stack, sqrt, dot, linalg, zeros_like, hstack, ones_like, array
+from numpy import asarray, column_stack, sqrt, dot, linalg, zeros_like, hstack, ones_like, array, einsum
 from statsmodels.api import OLS
 from traits.api import Int, Property
 
 # ============= local library imports  ==========================
 from pychron.core.helpers.fits import FITS
 from pychron.core.regression.base_regressor import BaseRegressor
+from pychron.core.stats.monte_carlo import predict_batch
 from pychron.pychron_constants import MSEM, SEM
 
 logger = logging.getLogger('Regressor')
@@ -79,6 +80,20 @@ class OLSRegressor(BaseRegressor):
 
         return dot(exog, beta)
 
+    def fast_predict_batch(self, endogs, exog):
+        """
+        fast_predict2 for many endogs at once. all trials share the pseudo-inverse so the fits are a single
+        matrix product
+
+        endogs: (ntrials, n)
+        exog: (npts, k) or (ntrials, npts, k)
+        """
+        if not hasattr(self, 'pinv_wexog'):
+            self.pinv_wexog = linalg.pinv(self._ols.wexog)
+        betas = dot(endogs, self.pinv_wexog.T)
+
+        return predict_batch(exog, betas)
+
     def calculate(self, filtering=False):
         cxs = self.clean_xs
         cys = self.clean_ys
@@ -188,16 +203,14 @@ class OLSRegressor(BaseRegressor):
         Xbar = xs.mean()
         n = float(xs.shape[0])
 
-        def calc_error(Xk):
-            a = 1 / n + (Xk - Xbar) ** 2 / ((xs - Xbar) ** 2).sum()
-            if error_calc == SEM:
-                var_Ypred = s * s * a
-            else:
-                var_Ypred = s * s * (1 + a)
-
-            return sqrt(var_Ypred)
+        x = asarray(x)
+        a = 1 / n + (x - Xbar) ** 2 / ((xs - Xbar) ** 2).sum()
+        if error_calc == SEM:
+            var_Ypred = s * s * a
+        else:
+            var_Ypred = s * s * (1 + a)
 
-        return [calc_error(xi) for xi in x]
+        return sqrt(var_Ypred)
 
     def predict_error_matrix(self, x, error_calc='SEM'):
         """
@@ -206,39 +219,31 @@ class OLSRegressor(BaseRegressor):
 
             Xk'=(1, x, x**2...x)
 
+            var(Y_hat_k) = Xk' C Xk is evaluated for all x at once as the row-wise quadratic form of the
+            design matrix
+
         """
         x = asarray(x)
+        if not self._result:
+            return zeros_like(x)
+
         sef = self.calculate_standard_error_fit()
 
         covarM = array(self.var_covar)
-        def calc_hat(xi):
-            Xk = self._get_X(xi).T
-            varY_hat = (Xk.T.dot(covarM).dot(Xk))
-            return varY_hat[0, 0]
+        X = self._get_X(x)
+        varY_hat = einsum('ij,jk,ik->i', X, covarM, X)
 
         error_calc = error_calc.lower()
         if error_calc == SEM.lower():
-            def func(xi):
-                varY_hat = calc_hat(xi)
-                return sef * sqrt(varY_hat)
+            e = sef * sqrt(varY_hat)
         elif error_calc == MSEM.lower():
             mswd = self.mswd
-
-            def func(xi):
-                varY_hat = calc_hat(xi)
-                m = mswd ** 0.5 if mswd > 1 else 1
-                return sef * sqrt(varY_hat) * m
+            m = mswd ** 0.5 if mswd > 1 else 1
+            e = sef * sqrt(varY_hat) * m
         else:
-            def func(xi):
-                varY_hat = calc_hat(xi)
-                return sqrt(sef ** 2 + sef ** 2 * varY_hat)
+            e = sqrt(sef ** 2 + sef ** 2 * varY_hat)
 
-        if not self._result:
-            return zeros_like(x)
-        else:
-            return [func(xi) for xi in x]
-            # func = calc_sem if error_calc == 'SEM' else calc_sd
-            # return [func(xi) for xi in x]
+        return e
 
     def predict_error_al(self, x, error_calc='sem'):
         """
@@ -374,6 +379,18 @@ class MultipleLinearRegressor(OLSRegressor):
         # use fast_predict instead
         return self.fast_predict(endog, pexog, **kw)
 
+    def fast_predict_batch(self, endogs, exog):
+        """
+        batched equivalent of fast_predict. endogs are whitened and fit with the model's pseudo-inverse
+        """
+        ols = self._ols
+        pinv_wexog = getattr(ols, 'pinv_wexog', None)
+        if pinv_wexog is None:
+            pinv_wexog = linalg.pinv(ols.wexog)
+
+        betas = dot(pinv_wexog, ols.whiten(asarray(endogs).T)).T
+        return predict_batch(exog, betas)
+
     def _get_X(self, xs=None):
         if xs is None:
             xs = self.clean_xs
@@ -0,0 +1,129 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import zeros, arange, asarray, power, dot, hypot, vstack, column_stack
+from numpy.linalg import inv, qr, LinAlgError
+
+# ============= local library imports  ==========================
+from pychron.pychron_constants import SEM
+
+MAX_DEGREE = 3
+# columns of the design matrix, 1, x, x**2, x**3, followed by y
+NCOLS = MAX_DEGREE + 2
+
+
+class RunningRegressor(object):
+    """
+    ordinary least squares intercepts from a running QR factorization of the cubic design matrix augmented with y.
+
+    adding a point is O(1). it is rotated into the triangular factor with Givens rotations, so the fit can be
+    updated on every count instead of being refit from all the data. the factor of a lower degree fit is the
+    leading block of the cubic factor, and the residual sum of squares is accumulated from the rotated rows. the
+    normal equations are never formed, so precision is not lost for large intensities with little noise.
+
+    y is measured from the first y and x is divided by ``scale`` to keep the factor well conditioned for typical
+    intensities and measurement times. the intercept at x=0 does not depend on either.
+
+    errors match ``PolynomialRegressor`` (degree>0) and ``MeanRegressor`` (degree=0) for the SEM and SD error types.
+    there is no outlier filtering or point exclusion
+    """
+
+    def __init__(self, scale=100.):
+        self.scale = float(scale)
+        self.reset()
+
+    def reset(self):
+        self.n = 0
+        self._y0 = None
+        self._r = zeros((NCOLS, NCOLS))
+
+    def add(self, x, y):
+        if self._y0 is None:
+            self._y0 = y
+
+        row = zeros(NCOLS)
+        row[:-1] = power(x / self.scale, arange(MAX_DEGREE + 1))
+        row[-1] = y - self._y0
+
+        r = self._r
+        for k in range(NCOLS):
+            b = row[k]
+            if b:
+                a = r[k, k]
+                h = hypot(a, b)
+                c, s = a / h, b / h
+                rk = r[k, k:].copy()
+                r[k, k:] = c * rk + s * row[k:]
+                row[k:] = c * row[k:] - s * rk
+
+        self.n += 1
+
+    def add_many(self, xs, ys):
+        xs = asarray(xs, dtype=float)
+        ys = asarray(ys, dtype=float)
+        if not xs.shape[0]:
+            return
+
+        if self._y0 is None:
+            self._y0 = ys[0]
+
+        rows = column_stack((power((xs / self.scale)[:, None], arange(MAX_DEGREE + 1)), ys - self._y0))
+        self._r = qr(vstack((self._r, rows)), mode='r')[:NCOLS]
+        self.n += xs.shape[0]
+
+    def intercept(self, degree=1, error_calc=SEM):
+        """
+        return the value and error at x=0 of a fit of ``degree``, 0 is the mean.
+
+        return None if there are too few points, the fit is singular, or ``error_calc`` is not SEM or SD
+        """
+        error_calc = (error_calc or SEM).lower()
+        if error_calc not in (SEM.lower(), 'sd') or degree > MAX_DEGREE:
+            return
+
+        n = self.n
+        q = degree + 1
+        if n <= q:
+            return
+
+        r = self._r
+        try:
+            ri = inv(r[:q, :q])
+        except LinAlgError:
+            return
+
+        beta = dot(ri, r[:q, -1])
+        # the rotated y entries not explained by the first q columns are the residuals of this fit
+        ssr = dot(r[q:, -1], r[q:, -1])
+        # (X'X)^-1[0, 0] of this fit
+        c00 = dot(ri[0], ri[0])
+        v = beta[0] + self._y0
+
+        sef2 = ssr / (n - q)
+        if not degree:
+            var = sef2
+            if error_calc != 'sd':
+                var /= n
+        elif error_calc == 'sd':
+            var = sef2 * (1 + c00)
+        else:
+            var = sef2 * c00
+
+        return v, var ** 0.5
+
+# ============= EOF =============================================
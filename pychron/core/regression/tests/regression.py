@@ -19,14 +19,17 @@
 # ============= standard library imports ========================
 from unittest import TestCase
 
-from numpy import linspace, polyval
+from numpy import linspace, polyval, array, allclose, sin, random
 
 # ============= local library imports  ==========================
 from pychron.core.regression.least_squares_regressor import ExponentialRegressor
 from pychron.core.regression.mean_regressor import MeanRegressor  # , WeightedMeanRegressor
 from pychron.core.regression.new_york_regressor import ReedYorkRegressor, NewYorkRegressor
 from pychron.core.regression.ols_regressor import OLSRegressor
+from pychron.core.regression.running_regressor import RunningRegressor
 # from pychron.core.regression.york_regressor import YorkRegressor
+from pychron.core.helpers.fits import fit_to_degree
+from pychron.pychron_constants import SEM, MSEM
 from pychron.core.regression.tests.standard_data import mean_data, filter_data, ols_data, pearson, pre_truncated_data, \
     expo_data, expo_data_linear
 
@@ -121,6 +124,110 @@ class OLSRegressionTest2(RegressionTestCase, TestCase):
                              self.solution['coefficients'])
 
 
+class OLSPredictErrorTest(TestCase):
+    def setUp(self):
+        xs = linspace(0, 100, 50)
+        ys = polyval([0.002, 1.13, 5.14], xs) + sin(xs) * 2
+        self.reg = OLSRegressor(xs=xs, ys=ys, yserr=xs * 0 + 0.5, fit='parabolic')
+        self.reg.calculate()
+        self.rx = linspace(-10, 110, 37)
+
+    def _point_errors(self, error_calc):
+        reg = self.reg
+        sef = reg.calculate_standard_error_fit()
+        cv = array(reg.var_covar)
+        m = reg.mswd ** 0.5 if reg.mswd > 1 else 1
+
+        es = []
+        for xi in self.rx:
+            Xk = reg.get_exog(xi)
+            v = Xk.dot(cv).dot(Xk.T)[0, 0]
+            if error_calc == SEM:
+                e = sef * v ** 0.5
+            elif error_calc == MSEM:
+                e = sef * v ** 0.5 * m
+            else:
+                e = (sef ** 2 + sef ** 2 * v) ** 0.5
+            es.append(e)
+        return es
+
+    def test_sem(self):
+        self.assertTrue(allclose(self.reg.predict_error_matrix(self.rx, SEM), self._point_errors(SEM)))
+
+    def test_msem(self):
+        self.assertTrue(allclose(self.reg.predict_error_matrix(self.rx, MSEM), self._point_errors(MSEM)))
+
+    def test_sd(self):
+        self.assertTrue(allclose(self.reg.predict_error_matrix(self.rx, 'SD'), self._point_errors('SD')))
+
+    def test_single(self):
+        e = self.reg.predict_error(self.rx[0], error_calc=SEM)
+        self.assertAlmostEqual(e, self._point_errors(SEM)[0])
+
+    def test_algebraic(self):
+        reg = OLSRegressor(xs=self.reg.xs, ys=self.reg.ys, fit='linear')
+        reg.calculate()
+        es = reg.predict_error_algebraic(self.rx)
+        self.assertTrue(allclose(es, reg.predict_error_matrix(self.rx, SEM)))
+
+
+class RunningRegressorTest(TestCase):
+    def setUp(self):
+        # a high intensity, low noise signal
+        self.xs = xs = linspace(5, 400, 200)
+        self.ys = 40 * polyval([2e-8, -1e-4, 1], xs) + random.RandomState(1).normal(0, 1e-5, 200)
+
+        self.reg = RunningRegressor()
+        for x, y in zip(xs, self.ys):
+            self.reg.add(x, y)
+
+    def _assert_close(self, a, b, rtol):
+        self.assertLess(abs(a / b - 1), rtol)
+
+    def _assert_fit(self, fit, error_calc):
+        reg = OLSRegressor(xs=self.xs, ys=self.ys, fit=fit)
+        reg.calculate()
+        v, e = self.reg.intercept(fit_to_degree(fit), error_calc)
+        self._assert_close(v, reg.predict(0), 1e-12)
+        self._assert_close(e, reg.predict_error(0, error_calc=error_calc), 1e-5)
+
+    def test_linear(self):
+        self._assert_fit('linear', SEM)
+
+    def test_parabolic(self):
+        self._assert_fit('parabolic', SEM)
+
+    def test_cubic(self):
+        self._assert_fit('cubic', SEM)
+
+    def test_sd(self):
+        self._assert_fit('parabolic', 'SD')
+
+    def test_large_offset(self):
+        self.ys = 1e4 + self.ys * 1e2
+        self.reg = RunningRegressor()
+        self.reg.add_many(self.xs, self.ys)
+        for fit in ('linear', 'parabolic', 'cubic'):
+            self._assert_fit(fit, SEM)
+
+    def test_mean(self):
+        reg = MeanRegressor(xs=self.xs, ys=self.ys)
+        reg.calculate()
+        v, e = self.reg.intercept(0, SEM)
+        self._assert_close(v, reg.predict(0), 1e-12)
+        self._assert_close(e, reg.predict_error(0, error_calc=SEM), 1e-8)
+
+    def test_add_many(self):
+        reg = RunningRegressor()
+        reg.add_many(self.xs, self.ys)
+        self.assertEqual(reg.n, self.reg.n)
+        self.assertTrue(allclose(reg.intercept(2), self.reg.intercept(2)))
+
+    def test_unsupported(self):
+        self.assertIsNone(self.reg.intercept(1, MSEM))
+        self.assertIsNone(RunningRegressor().intercept(1))
+
+
 class FilterOLSRegressionTest(RegressionTestCase, TestCase):
     reg_klass = OLSRegressor
 
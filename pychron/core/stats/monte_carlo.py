@@ -17,39 +17,63 @@
 # ============= enthought library imports =======================
 # ============= standard library imports ========================
 
-from numpy import zeros, percentile, array, random, abs as nabs, column_stack
-from scipy.stats import norm
+from numpy import zeros, percentile, random, abs as nabs, column_stack, dot, einsum, asarray
 
 
 # ============= local library imports  ==========================
 
+def predict_batch(exog, betas):
+    """
+    exog: (npts, k) shared by all trials or (ntrials, npts, k)
+    betas: (ntrials, k)
+
+    return (ntrials, npts)
+    """
+    if exog.ndim == 3:
+        return einsum('tpk,tk->tp', exog, betas)
+    return dot(betas, exog.T)
+
+
 class MonteCarloEstimator(object):
+    """
+    trials are drawn and solved in chunks of ``chunk_size`` so memory stays bounded for large ntrials.
+    regressors that implement ``fast_predict_batch`` solve a whole chunk at once, otherwise each trial is
+    passed to ``fast_predict2``
 
-    def __init__(self, ntrials, regressor, seed=None):
+    every estimate draws from a new generator seeded with ``seed`` so repeated estimates are reproducible
+    """
+
+    def __init__(self, ntrials, regressor, seed=None, chunk_size=1000):
         self.regressor = regressor
         self.ntrials = ntrials
         self.seed = seed
+        self.chunk_size = chunk_size
+
+    def _make_rng(self):
+        return random.default_rng(self.seed)
 
     def _calculate(self, nominal_ys, ps):
         res = nominal_ys - ps
         pct = (15.87, 84.13)
 
-        a, b = array([percentile(ri, pct) for ri in res.T]).T
+        a, b = percentile(res, pct, axis=0)
         a, b = nabs(a), nabs(b)
         return (a + b) * 0.5
 
-    def _get_dist(self, n, npts):
-        if self.seed:
-            random.seed(self.seed)
+    def _chunks(self):
+        ntrials, step = self.ntrials, max(1, self.chunk_size)
+        for s in range(0, ntrials, step):
+            yield s, min(s + step, ntrials)
 
-        ndist = norm()
-        ntrials = self.ntrials
+    def _estimate(self, pts, pexog, ys=None, yserr=None, rng=None):
+        """
+        pexog: prediction exog shared by all trials or a callable that takes (start, end) and returns the
+        (end - start, npts, k) prediction exog for those trials
+        rng: generator for this estimate. a new one is seeded if not supplied
+        """
+        if rng is None:
+            rng = self._make_rng()
 
-        ga = ndist.rvs((ntrials, n))
-        ps = zeros((ntrials, npts))
-        return ndist, ga, ps
-
-    def _estimate(self, pts, pexog, ys=None, yserr=None):
         reg = self.regressor
         nominal_ys = reg.predict(pts)
 
@@ -60,17 +84,18 @@ class MonteCarloEstimator(object):
 
         n, npts = len(ys), len(pts)
 
-        ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-        pred = reg.fast_predict2
-        yp = ys + yserr * ga
+        ps = zeros((self.ntrials, npts))
+        batch = getattr(reg, 'fast_predict_batch', None)
+        for s, e in self._chunks():
+            yp = ys + yserr * rng.standard_normal((e - s, n))
+            ep = asarray(pexog(s, e) if callable(pexog) else pexog)
 
-        if hasattr(pexog, '__call__'):
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog(i))
-        else:
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog)
+            if batch is not None:
+                ps[s:e] = batch(yp, ep)
+            else:
+                pred = reg.fast_predict2
+                for i, yi in enumerate(yp):
+                    ps[s + i] = pred(yi, ep[i] if ep.ndim == 3 else ep)
 
         return nominal_ys, self._calculate(nominal_ys, ps)
 
@@ -78,6 +103,7 @@ class MonteCarloEstimator(object):
 class RegressionEstimator(MonteCarloEstimator):
     def estimate(self, pts):
         reg = self.regressor
+        pts = asarray(pts)
         pexog = reg.get_exog(pts)
 
         return self._estimate(pts, pexog, ys=reg.clean_ys, yserr=reg.clean_yserr)
@@ -87,22 +113,17 @@ class FluxEstimator(MonteCarloEstimator):
     def estimate_position_err(self, pts, error):
         reg = self.regressor
         ox, oy = pts.T
+        npts = len(pts)
+        rng = self._make_rng()
 
-        n, npts = len(reg.ys), len(pts)
-
-        ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-
-        pgax = ndist.rvs((ntrials, npts))
-        pgay = ndist.rvs((ntrials, npts))
-
-        pgax *= error
-        pgay *= error
-
-        def get_pexog(i):
-            return reg.get_exog(column_stack((ox + pgax[i], oy + pgay[i])))
+        def get_pexog(s, e):
+            m = e - s
+            px = ox + rng.standard_normal((m, npts)) * error
+            py = oy + rng.standard_normal((m, npts)) * error
+            exog = reg.get_exog(column_stack((px.ravel(), py.ravel())))
+            return exog.reshape(m, npts, -1)
 
-        return self._estimate(pts, get_pexog, yserr=0)
+        return self._estimate(pts, get_pexog, yserr=0, rng=rng)
 
     def estimate(self, pts):
 
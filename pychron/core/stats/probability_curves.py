@@ -17,33 +17,211 @@
 # ============= enthought library imports =======================
 
 # ============= standard library imports ========================
-from numpy import linspace, zeros, exp, pi, full
+from collections import OrderedDict
+from threading import Lock
 
+from numpy import linspace, zeros, exp, pi, asarray, sqrt, log, maximum, hstack, unique, diff, \
+    minimum, flatnonzero, newaxis
 
 # ============= local library imports  ==========================
 
-def cumulative_probability(ages, errors, xmi, xma, n=100):
-    x = linspace(xmi, xma, n)
+# maximum number of gaussian evaluations held in memory at once
+CHUNK_SIZE = 2 ** 20
+
+
+def _valid(ages, errors):
+    ages = asarray(ages, dtype=float)
+    errors = asarray(errors, dtype=float)
+    mask = (abs(ages) >= 1e-10) & (abs(errors) >= 1e-10)
+    return ages[mask], errors[mask]
+
+
+def _evaluate(ages, errors, x):
+    """
+    sum of the normal distributions ages+/-errors evaluated at x
+    """
+    n = len(x)
     probs = zeros(n)
+    if not len(ages):
+        return probs
 
-    for ai, ei in zip(ages, errors):
-        if abs(ai) < 1e-10 or abs(ei) < 1e-10:
-            continue
+    step = max(1, CHUNK_SIZE // n)
+    for i in range(0, len(ages), step):
+        ai = ages[i:i + step, newaxis]
+        es2 = 2 * errors[i:i + step, newaxis] ** 2
 
         # calculate probability curve for ai+/-ei
         # p=1/(2*pi*sigma2) *exp (-(x-u)**2)/(2*sigma2)
         # see http://en.wikipedia.org/wiki/Normal_distribution
-        ds = (x-full(n, ai)) ** 2
-        es2 = full(n, 2 * ei * ei)
-        gs = (es2 * pi) ** -0.5 * exp(-ds / es2)
+        gs = (es2 * pi) ** -0.5 * exp(-(x - ai) ** 2 / es2)
 
         # cumulate probabilities
-        # numpy element_wise addition
-        probs += gs
+        probs += gs.sum(axis=0)
+
+    return probs
+
+
+def _refine(ages, errors, x, probs, npts):
+    """
+    add ``npts`` points on either side of each local maximum so peaks are not flattened by the grid
+    """
+    d = diff(probs)
+    peaks = flatnonzero((hstack(([1], d)) > 0) & (hstack((d, [-1])) <= 0))
+    if not len(peaks):
+        return x, probs
+
+    lo = x[maximum(peaks - 1, 0)]
+    hi = x[minimum(peaks + 1, len(x) - 1)]
+    extra = hstack([linspace(l, h, 2 * npts + 1) for l, h in zip(lo, hi)])
+    extra = unique(extra)
+
+    x = hstack((x, extra))
+    probs = hstack((probs, _evaluate(ages, errors, extra)))
+    x, idx = unique(x, return_index=True)
+    return x, probs[idx]
+
+
+class CurveCache(object):
+    """
+    least recently used cache of probability curves keyed on ages, errors and limits.
+
+    replotting with only styling changes reuses the curves instead of recalculating them
+    """
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._cache = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            try:
+                v = self._cache.pop(key)
+            except KeyError:
+                self.misses += 1
+                return
+
+            self._cache[key] = v
+            self.hits += 1
+            return v
+
+    def update(self, key, value):
+        with self._lock:
+            self._cache.pop(key, None)
+            self._cache[key] = value
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+curve_cache = CurveCache()
+
+
+def _key(*args):
+    return tuple(a.tobytes() if hasattr(a, 'tobytes') else a for a in args)
+
+
+def cumulative_probability(ages, errors, xmi, xma, n=100, refine=0, use_cache=True):
+    """
+    sum of the normal distributions ages+/-errors evaluated at ``n`` points between xmi and xma.
+
+    ages or errors less than 1e-10 are ignored.
+
+    :param refine: add ``refine`` points on either side of each peak. the returned x is no longer evenly spaced
+    :param use_cache: return a copy of a previously calculated curve with the same arguments
+    :return: x, probs
+    """
+    ages, errors = _valid(ages, errors)
+
+    key = None
+    if use_cache:
+        key = _key(ages, errors, xmi, xma, n, refine)
+        r = curve_cache.get(key)
+        if r is not None:
+            x, probs = r
+            return x.copy(), probs.copy()
+
+    x = linspace(xmi, xma, n)
+    probs = _evaluate(ages, errors, x)
+    if refine:
+        x, probs = _refine(ages, errors, x, probs, refine)
+
+    if key is not None:
+        curve_cache.update(key, (x.copy(), probs.copy()))
 
     return x, probs
 
 
+def asymptotic_limits(ages, errors, tol=0.1, n=100, use_cache=True):
+    """
+    find the limits where the cumulative probability falls to ``tol`` x the maximum probability.
+
+    left of every age the curve only increases and right of every age it only decreases, so the limit on
+    each side lies between the outermost age and the outermost age -/+ k*error. k is chosen so each gaussian
+    is below tol*max/(number of ages) and the exact limit is found by bisection between those bounds.
+
+    :param tol: fraction of the maximum probability
+    :param n: number of points used to estimate the maximum probability
+    :param use_cache: return previously calculated limits for the same arguments
+    :return: xmi, xma
+    """
+    ages, errors = _valid(ages, errors)
+    if not len(ages):
+        return None, None
+
+    key = None
+    if use_cache:
+        key = _key('limits', ages, errors, tol, n)
+        r = curve_cache.get(key)
+        if r is not None:
+            return r
+
+    lo, hi = ages.min(), ages.max()
+    k = 3
+    _, probs = cumulative_probability(ages, errors, (ages - k * errors).min(), (ages + k * errors).max(), n=n,
+                                      use_cache=False)
+    threshold = tol * probs.max()
+
+    # distance at which each gaussian is less than threshold/N
+    norm = (2 * pi * errors ** 2) ** -0.5
+    arg = norm * len(ages) / threshold
+    ks = sqrt(2 * log(maximum(arg, 1)))
+
+    x1 = _bisect(ages, errors, threshold, (ages - ks * errors).min(), lo)
+    x2 = _bisect(ages, errors, threshold, (ages + ks * errors).max(), hi)
+
+    if key is not None:
+        curve_cache.update(key, (x1, x2))
+    return x1, x2
+
+
+def _bisect(ages, errors, threshold, outer, inner, tol=1e-6, max_iter=60):
+    """
+    return the point between ``outer`` and ``inner`` where the curve crosses ``threshold``
+    """
+    f = lambda xi: _evaluate(ages, errors, asarray([xi]))[0]
+    if f(inner) < threshold:
+        return inner
+
+    width = abs(inner - outer)
+    for _ in range(max_iter):
+        mid = (outer + inner) / 2.
+        if f(mid) < threshold:
+            outer = mid
+        else:
+            inner = mid
+
+        if abs(inner - outer) < tol * width:
+            break
+
+    return outer
+
+
 def kernel_density(ages, errors, xmi, xma, n=100):
     from scipy.stats.kde import gaussian_kde
 
@@ -0,0 +1,90 @@
+import unittest
+
+from numpy import array, linspace, random, allclose, column_stack, ones
+
+from pychron.core.regression.flux_regressor import PlaneFluxRegressor
+from pychron.core.regression.mean_regressor import WeightedMeanRegressor
+from pychron.core.regression.ols_regressor import OLSRegressor
+from pychron.core.stats.monte_carlo import RegressionEstimator, FluxEstimator
+
+
+class MonteCarloTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.default_rng(1)
+        xs = linspace(0, 10, 12)
+        self.ys = 2 + 0.5 * xs + rng.normal(0, 0.1, 12)
+        self.yserr = ones(12) * 0.1
+        self.endogs = self.ys + self.yserr * rng.standard_normal((50, 12))
+
+        self.ols = OLSRegressor(xs=xs, ys=self.ys, yserr=self.yserr, fit='linear')
+        self.ols.calculate()
+
+        pts = column_stack((rng.uniform(-1, 1, 12), rng.uniform(-1, 1, 12)))
+        self.plane = PlaneFluxRegressor(xs=pts, ys=self.ys, yserr=self.yserr * (1 + xs), use_weighted_fit=True)
+        self.plane.calculate()
+
+    def test_ols_batch(self):
+        reg = self.ols
+        exog = reg.get_exog(array([1, 5, 20]))
+        ps = reg.fast_predict_batch(self.endogs, exog)
+        for p, yi in zip(ps, self.endogs):
+            self.assertTrue(allclose(p, reg.fast_predict2(yi, exog)))
+
+    def test_plane_batch(self):
+        reg = self.plane
+        exog = reg.get_exog([(0, 0), (0.5, 0.5)])
+        ps = reg.fast_predict_batch(self.endogs, exog)
+        for p, yi in zip(ps, self.endogs):
+            self.assertTrue(allclose(p, reg.fast_predict2(yi, exog)))
+
+    def test_plane_batch_exog(self):
+        reg = self.plane
+        exogs = random.default_rng(2).uniform(-1, 1, (50, 3, 2))
+        pexogs = reg.get_exog(exogs.reshape(-1, 2)).reshape(50, 3, -1)
+        ps = reg.fast_predict_batch(self.endogs, pexogs)
+        for p, yi, pi in zip(ps, self.endogs, pexogs):
+            self.assertTrue(allclose(p, reg.fast_predict2(yi, pi)))
+
+    def test_weighted_mean_batch(self):
+        reg = WeightedMeanRegressor(ys=self.ys, yserr=self.yserr, xs=linspace(0, 10, 12))
+        ps = reg.fast_predict_batch(self.endogs, reg.get_exog(linspace(0, 1, 4)))
+        self.assertEqual(ps.shape, (50, 4))
+        for p, yi in zip(ps, self.endogs):
+            self.assertTrue(allclose(p, reg.fast_predict2(yi, linspace(0, 1, 4))))
+
+    def test_seed(self):
+        a = RegressionEstimator(1000, self.ols, seed=10).estimate([1, 5])[1]
+        b = RegressionEstimator(1000, self.ols, seed=10).estimate([1, 5])[1]
+        self.assertTrue(allclose(a, b))
+
+    def test_repeated_estimate(self):
+        est = RegressionEstimator(1000, self.ols, seed=10)
+        a = est.estimate([1, 5])[1]
+        b = est.estimate([1, 5])[1]
+        self.assertTrue(allclose(a, b))
+
+        fe = FluxEstimator(500, self.plane, seed=3)
+        pts = column_stack((linspace(-1, 1, 5), linspace(-1, 1, 5)))
+        self.assertTrue(allclose(fe.estimate_position_err(pts, 0.01)[1],
+                                 fe.estimate_position_err(pts, 0.01)[1]))
+
+    def test_chunks(self):
+        a = RegressionEstimator(1000, self.ols, seed=10).estimate([1, 5])[1]
+        b = RegressionEstimator(1000, self.ols, seed=10, chunk_size=7).estimate([1, 5])[1]
+        self.assertTrue(allclose(a, b))
+
+    def test_ols_error(self):
+        # x=5 is the mean x so the propagated error is sigma/n**0.5
+        _, es = RegressionEstimator(10000, self.ols, seed=10).estimate([5])
+        self.assertAlmostEqual(es[0], 0.1 / 12 ** 0.5, 3)
+
+    def test_position_error(self):
+        pts = column_stack((linspace(-1, 1, 5), linspace(-1, 1, 5)))
+        fe = FluxEstimator(2000, self.plane, seed=3, chunk_size=300)
+        noms, es = fe.estimate_position_err(pts, 0.01)
+        self.assertEqual(es.shape, (5,))
+        self.assertTrue(allclose(noms, self.plane.predict(pts)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from numpy import linspace, zeros, exp, pi, allclose, diff, random
+
+from pychron.core.stats.probability_curves import cumulative_probability, asymptotic_limits, curve_cache
+
+
+def loop_cumulative_probability(ages, errors, xmi, xma, n=100):
+    x = linspace(xmi, xma, n)
+    probs = zeros(n)
+    for ai, ei in zip(ages, errors):
+        if abs(ai) < 1e-10 or abs(ei) < 1e-10:
+            continue
+        es2 = 2 * ei * ei
+        probs += (es2 * pi) ** -0.5 * exp(-(x - ai) ** 2 / es2)
+    return x, probs
+
+
+class ProbabilityCurvesTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.RandomState(7)
+        self.ages = rng.uniform(10, 500, 300)
+        self.errors = rng.uniform(0.5, 5, 300)
+        curve_cache.clear()
+        curve_cache.hits = curve_cache.misses = 0
+
+    def test_equivalence(self):
+        x, p = cumulative_probability(self.ages, self.errors, 0, 600, n=500)
+        ex, ep = loop_cumulative_probability(self.ages, self.errors, 0, 600, n=500)
+        self.assertTrue(allclose(x, ex))
+        self.assertTrue(allclose(p, ep))
+
+    def test_skip_zero(self):
+        x, p = cumulative_probability([10, 0, 20], [1, 1, 0], 0, 30, n=50)
+        ex, ep = loop_cumulative_probability([10], [1], 0, 30, n=50)
+        self.assertTrue(allclose(p, ep))
+
+    def test_empty(self):
+        x, p = cumulative_probability([], [], 0, 30, n=50)
+        self.assertEqual(p.sum(), 0)
+        self.assertEqual(asymptotic_limits([], []), (None, None))
+
+    def test_cache(self):
+        a = cumulative_probability(self.ages, self.errors, 0, 600, n=500)
+        a[1][:] = 0
+        b = cumulative_probability(self.ages, self.errors, 0, 600, n=500)
+        self.assertEqual(curve_cache.hits, 1)
+        self.assertGreater(b[1].max(), 0)
+
+    def test_cache_key(self):
+        cumulative_probability(self.ages, self.errors, 0, 600, n=500)
+        errors = self.errors.copy()
+        errors[0] *= 2
+        cumulative_probability(self.ages, errors, 0, 600, n=500)
+        self.assertEqual(curve_cache.hits, 0)
+
+    def test_asymptotic_limits(self):
+        tol = 0.1
+        x1, x2 = asymptotic_limits([10, 20], [1, 2], tol=tol, n=500)
+        _, p = loop_cumulative_probability([10, 20], [1, 2], x1, x2, n=500)
+        self.assertAlmostEqual(p[0], tol * p.max(), 3)
+        self.assertAlmostEqual(p[-1], tol * p.max(), 3)
+
+    def test_asymptotic_limits_many(self):
+        tol = 0.05
+        x1, x2 = asymptotic_limits(self.ages, self.errors, tol=tol, n=500)
+        _, p = cumulative_probability(self.ages, self.errors, x1, x2, n=500)
+        self.assertLessEqual(p[0], tol * p.max() * 1.01)
+        self.assertLessEqual(p[-1], tol * p.max() * 1.01)
+        self.assertLessEqual(x1, self.ages.min())
+        self.assertGreaterEqual(x2, self.ages.max())
+
+    def test_refine(self):
+        x, p = cumulative_probability([10, 20], [0.05, 0.05], 0, 30, n=50)
+        rx, rp = cumulative_probability([10, 20], [0.05, 0.05], 0, 30, n=50, refine=10)
+        self.assertTrue((diff(rx) > 0).all())
+        self.assertGreater(len(rx), len(x))
+        self.assertGreater(rp.max(), p.max())
+
+
+if __name__ == '__main__':
+    unittest.main()
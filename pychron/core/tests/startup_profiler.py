@@ -0,0 +1,75 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pychron.core.codetools.startup_profiler import StartupProfiler
+
+
+class StartupProfilerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        with open(os.path.join(self.root, 'profiled_parent.py'), 'w') as wfile:
+            wfile.write('import time\nimport profiled_child\ntime.sleep(0.02)\n')
+        with open(os.path.join(self.root, 'profiled_child.py'), 'w') as wfile:
+            wfile.write('import time\ntime.sleep(0.05)\n')
+
+        sys.path.insert(0, self.root)
+        self.profiler = StartupProfiler()
+
+    def tearDown(self):
+        self.profiler.stop()
+        sys.path.remove(self.root)
+        for m in ('profiled_parent', 'profiled_child'):
+            sys.modules.pop(m, None)
+        shutil.rmtree(self.root)
+
+    def test_imports(self):
+        self.profiler.start()
+        import profiled_parent
+        self.profiler.stop()
+
+        records = {name: (depth, st, ct) for name, depth, st, ct in self.profiler.imports}
+        pdepth, pself, pcum = records['profiled_parent']
+        cdepth, cself, ccum = records['profiled_child']
+
+        self.assertEqual(cdepth, pdepth + 1)
+        self.assertGreaterEqual(ccum, 0.05)
+        self.assertGreaterEqual(pcum, pself + ccum)
+        self.assertLess(pself, ccum)
+
+    def test_stop(self):
+        self.profiler.start()
+        self.profiler.stop()
+        import profiled_child
+
+        self.assertEqual(self.profiler.imports, [])
+        self.assertFalse(self.profiler.enabled)
+
+    def test_timeit(self):
+        with self.profiler.timeit('start', 'DisabledPlugin'):
+            pass
+
+        self.profiler.start()
+        with self.profiler.timeit('start', 'FooPlugin'):
+            pass
+
+        self.assertEqual([(k, n) for k, n, _ in self.profiler.timings], [('start', 'FooPlugin')])
+
+    def test_dump(self):
+        self.profiler.start()
+        with self.profiler.timeit('start', 'FooPlugin'):
+            import profiled_parent
+
+        path = self.profiler.dump(os.path.join(self.root, 'profile.txt'))
+        with open(path, 'r') as rfile:
+            lines = rfile.read().splitlines()
+
+        self.assertTrue(any(l.startswith('start') and l.endswith('FooPlugin') for l in lines))
+        self.assertTrue(any(l.endswith('  profiled_parent') for l in lines))
+        self.assertTrue(any(l.endswith('    profiled_child') for l in lines))
+
+
+if __name__ == '__main__':
+    unittest.main()
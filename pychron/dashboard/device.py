@@ -33,6 +33,7 @@ from pychron.dashboard.conditional import DashboardConditional
 from pychron.dashboard.process_value import ProcessValue
 from pychron.globals import globalv
 from pychron.graph.stream_graph import StreamStackedGraph
+from pychron.hardware.core.communicators.scheduler import status_polling
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.loggable import Loggable
 from pychron.paths import paths
@@ -93,7 +94,10 @@ class DashboardDevice(Loggable):
             elif dt > value.period:
                 self._trigger(value)
 
-    def _trigger(self, value, **kw):
+    def read_value(self, value, **kw):
+        """
+            read ``value`` from the hardware device. returns None if the read failed
+        """
         try:
             self.debug('triggering value device={} value={} func={}'.format(self.hardware_device.name,
                                                                             value.name,
@@ -101,12 +105,12 @@ class DashboardDevice(Loggable):
             nv = None
             func = getattr(self.hardware_device, value.func_name)
             if func is not None:
-                nv = func(**kw)
+                with status_polling():
+                    nv = func(**kw)
 
             if nv is None and globalv.dashboard_simulation:
                 nv = random.random()
-            if nv is not None:
-                self._push_value(value, nv)
+            return nv
         except BaseException:
             import traceback
 
@@ -114,6 +118,18 @@ class DashboardDevice(Loggable):
             self.debug(traceback.format_exc())
             # value.use_pv = False
 
+    def push_value(self, value, nv):
+        if nv is not None:
+            self._push_value(value, nv)
+
+    def _trigger(self, value, **kw):
+        try:
+            self.push_value(value, self.read_value(value, **kw))
+        except BaseException:
+            import traceback
+
+            self.debug(traceback.format_exc())
+
     def add_value(self, name, tag, func_name, period, enabled, threshold, units, timeout, record, bindname):
         pv = ProcessValue(name=name,
                           tag=tag,
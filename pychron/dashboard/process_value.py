@@ -48,6 +48,11 @@ class ProcessValue(HasTraits):
     record = Bool(False)
     display_name = Property
 
+    # poll metrics
+    nmissed = Int
+    ntimeouts = Int
+    last_duration = Float
+
     def is_different(self, v):
         ret = None
         ct = time.time()
@@ -76,6 +81,9 @@ class ProcessValue(HasTraits):
                                       Readonly('period')),
                                HGroup(Readonly('last_time_str'),
                                       Readonly('last_value')),
+                               HGroup(Readonly('nmissed', label='Missed'),
+                                      Readonly('ntimeouts', label='Timeouts'),
+                                      Readonly('last_duration', label='Duration (s)')),
                                VGroup(UItem('conditionals', editor=ListEditor(editor=InstanceEditor(),
                                                                               style='custom',
                                                                               mutable=False)),
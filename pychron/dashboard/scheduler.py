@@ -0,0 +1,242 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import heapq
+import itertools
+import time
+import traceback
+from queue import Queue
+from threading import Thread, Event
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+
+_STOP = object()
+
+
+def communicator_key(device):
+    """
+    key identifying the physical connection used by ``device``.
+
+    devices that talk to the same host/port or serial port share a key and are read by the same worker
+    """
+    comm = getattr(device, 'communicator', None)
+    if comm is None:
+        return 'device', id(device)
+
+    host = getattr(comm, 'host', None)
+    port = getattr(comm, 'port', None)
+    if host is not None or port is not None:
+        return comm.__class__.__name__, host, port
+
+    return 'communicator', id(comm)
+
+
+class PollGroup(object):
+    """
+    reads the batches submitted for one communicator on its own thread. exceptions are logged to ``logger``
+    """
+
+    def __init__(self, key, logger=None):
+        self.key = key
+        self.logger = logger
+        self.batch = None
+        self.started = 0
+        self.timed_out = False
+
+        self._queue = Queue()
+        self._thread = Thread(target=self._run, name='DashboardPoll-{}'.format(key))
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def busy(self):
+        return self.batch is not None
+
+    def submit(self, batch):
+        self.batch = batch
+        self.started = time.time()
+        self.timed_out = False
+        self._queue.put(batch)
+
+    def stop(self):
+        self._queue.put(_STOP)
+
+    def _run(self):
+        while 1:
+            batch = self._queue.get()
+            if batch is _STOP:
+                break
+
+            try:
+                self._read(batch)
+            finally:
+                self.batch = None
+
+    def _read(self, batch):
+        # values on the same device read with the same function share one reading
+        readings = {}
+        for device, value, kw in batch:
+            try:
+                k = id(device), value.func_name
+                if k not in readings:
+                    st = time.time()
+                    readings[k] = device.read_value(value, **kw)
+                    value.last_duration = time.time() - st
+
+                device.push_value(value, readings[k])
+            except BaseException:
+                if self.logger:
+                    self.logger.warning('poll of {} failed'.format(value.tag))
+                    self.logger.debug(traceback.format_exc())
+
+
+class DashboardPollScheduler(Loggable):
+    """
+    poll every ``ProcessValue`` on its own period.
+
+    due values are kept in a priority queue ordered by the time they are next due. values whose devices share a
+    communicator are read together, in one batch, by a worker dedicated to that communicator so a slow or
+    unresponsive device only delays the values that have to wait for the same connection.
+
+    a batch still running after ``timeout`` seconds is counted as a timeout for each of its values. while a
+    communicator is busy, values due on it are skipped and counted as missed. values read more than
+    ``tolerance`` seconds after they were due are also counted as missed
+    """
+
+    def __init__(self, devices, timeout=5, tolerance=1, on_change_period=1, *args, **kw):
+        super(DashboardPollScheduler, self).__init__(*args, **kw)
+        self.devices = devices
+        self.timeout = timeout
+        self.tolerance = tolerance
+        self.on_change_period = on_change_period
+
+        self._heap = []
+        self._seq = itertools.count()
+        self._groups = {}
+        self._stop_evt = Event()
+        self._thread = None
+
+    def start(self):
+        self._stop_evt.clear()
+        now = time.time()
+        for device in self.devices:
+            for value in device.values:
+                self._schedule(now, device, value)
+
+        self._thread = Thread(target=self._run, name='DashboardScheduler')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop_evt.set()
+        if self._thread is not None:
+            self._thread.join(1)
+            self._thread = None
+
+        for g in self._groups.values():
+            g.stop()
+        self._groups = {}
+
+    def report(self):
+        return {value.tag: {'missed': value.nmissed,
+                            'timeouts': value.ntimeouts,
+                            'duration': value.last_duration}
+                for device in self.devices for value in device.values}
+
+    def poll(self, now=None):
+        """
+        dispatch every value due at ``now``.
+
+        returns the time the next value is due
+        """
+        if now is None:
+            now = time.time()
+
+        self._check_timeouts()
+
+        batches = {}
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            due, _, device, value = heapq.heappop(heap)
+            period = self._get_period(value)
+            nxt = due + period
+            if nxt <= now:
+                nxt = now + period
+            self._schedule(nxt, device, value)
+
+            if not (device.use and value.enabled):
+                continue
+
+            kw = {}
+            if value.period == 'on_change':
+                if not value.timeout or now - value.last_time <= value.timeout:
+                    continue
+                self.debug('Force trigger. timeout={}'.format(value.timeout))
+                kw['force'] = True
+
+            if now - due > self.tolerance:
+                value.nmissed += 1
+
+            key = communicator_key(device.hardware_device)
+            batches.setdefault(key, []).append((device, value, kw))
+
+        for key, batch in batches.items():
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = PollGroup(key, self)
+
+            if group.busy:
+                for _, value, _ in batch:
+                    value.nmissed += 1
+            else:
+                group.submit(batch)
+
+        if heap:
+            return heap[0][0]
+
+    # private
+    def _run(self):
+        evt = self._stop_evt
+        while not evt.is_set():
+            nxt = self.poll()
+            wait = self.on_change_period if nxt is None else nxt - time.time()
+            if wait > 0:
+                evt.wait(wait)
+
+    def _check_timeouts(self):
+        now = time.time()
+        for group in self._groups.values():
+            batch = group.batch
+            if batch and not group.timed_out and now - group.started > self.timeout:
+                group.timed_out = True
+                for device, value, _ in batch:
+                    value.ntimeouts += 1
+                self.warning('poll of {} timed out after {}s'.format(', '.join(v.tag for _, v, _ in batch),
+                                                                     self.timeout))
+
+    def _get_period(self, value):
+        period = value.period
+        if period == 'on_change':
+            period = self.on_change_period
+        return max(period, 0.1)
+
+    def _schedule(self, due, device, value):
+        heapq.heappush(self._heap, (due, next(self._seq), device, value))
+
+# ============= EOF =============================================
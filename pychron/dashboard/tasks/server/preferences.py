@@ -14,7 +14,7 @@
 # limitations under the License.
 # ===============================================================================
 
-from traits.api import Bool
+from traits.api import Bool, Float
 from traitsui.api import View, Item
 from apptools.preferences.preferences_helper import PreferencesHelper
 from envisage.ui.tasks.preferences_pane import PreferencesPane
@@ -25,6 +25,7 @@ class DashboardServerPreferences(PreferencesHelper):
     preferences_path = 'pychron.dashboard.server'
 
     notifier_enabled = Bool
+    poll_timeout = Float(5)
 
 
 class DashboardServerPreferencesPane(PreferencesPane):
@@ -32,7 +33,9 @@ class DashboardServerPreferencesPane(PreferencesPane):
     model_factory = DashboardServerPreferences
 
     def traits_view(self):
-        v = View(Item('notifier_enabled'))
+        v = View(Item('notifier_enabled'),
+                 Item('poll_timeout', label='Poll Timeout (s)',
+                      tooltip='Count a device read as timed out if it takes longer than this'))
 
         return v
 # ============= EOF =============================================
@@ -0,0 +1,169 @@
+import time
+import unittest
+from threading import Event
+
+from pychron.dashboard.scheduler import DashboardPollScheduler, communicator_key
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+
+class Communicator(object):
+    def __init__(self, host='localhost', port=8000):
+        self.host = host
+        self.port = port
+
+
+class HardwareDevice(object):
+    def __init__(self, communicator=None):
+        self.communicator = communicator
+
+
+class Value(object):
+    def __init__(self, tag, period, func_name='get'):
+        self.tag = tag
+        self.period = period
+        self.func_name = func_name
+        self.enabled = True
+        self.timeout = 0
+        self.last_time = 0
+        self.nmissed = 0
+        self.ntimeouts = 0
+        self.last_duration = 0
+
+
+class Device(object):
+    def __init__(self, values, communicator=None, block=None):
+        self.use = True
+        self.values = values
+        self.hardware_device = HardwareDevice(communicator)
+        self.reads = []
+        self.pushed = []
+        self.block = block
+
+    def read_value(self, value, **kw):
+        if self.block is not None:
+            self.block.wait(2)
+        self.reads.append(value.tag)
+        return 1
+
+    def push_value(self, value, nv):
+        self.pushed.append(value.tag)
+
+
+class FailingDevice(Device):
+    def push_value(self, value, nv):
+        if value.tag == 'a':
+            raise ValueError('push failed')
+        super(FailingDevice, self).push_value(value, nv)
+
+
+class DashboardPollSchedulerTestCase(unittest.TestCase):
+    def _wait(self, scheduler):
+        st = time.time()
+        while any(g.busy for g in scheduler._groups.values()) and time.time() - st < 2:
+            time.sleep(0.001)
+
+    def setUp(self):
+        self.scheduler = None
+
+    def tearDown(self):
+        if self.scheduler:
+            self.scheduler.stop()
+
+    def _scheduler(self, devices, **kw):
+        self.scheduler = s = DashboardPollScheduler(devices, **kw)
+        for d in devices:
+            for v in d.values:
+                s._schedule(0, d, v)
+        return s
+
+    def test_own_period(self):
+        dev = Device([Value('a', 1), Value('b', 5, func_name='get_b')])
+        s = self._scheduler([dev])
+        for now in range(11):
+            s.poll(now)
+            self._wait(s)
+
+        self.assertEqual(dev.reads.count('a'), 11)
+        self.assertEqual(dev.reads.count('b'), 3)
+
+    def test_next_due(self):
+        dev = Device([Value('a', 1), Value('b', 5, func_name='get_b')])
+        s = self._scheduler([dev])
+        self.assertEqual(s.poll(0), 1)
+
+    def test_coalesce(self):
+        dev = Device([Value('a', 1), Value('b', 1)])
+        s = self._scheduler([dev])
+        s.poll(0)
+        self._wait(s)
+        self.assertListEqual(dev.reads, ['a'])
+        self.assertListEqual(dev.pushed, ['a', 'b'])
+
+    def test_shared_communicator(self):
+        a = HardwareDevice(Communicator())
+        b = HardwareDevice(Communicator())
+        c = HardwareDevice(Communicator(port=8001))
+        self.assertEqual(communicator_key(a), communicator_key(b))
+        self.assertNotEqual(communicator_key(a), communicator_key(c))
+
+    def test_slow_device(self):
+        block = Event()
+        slow = Device([Value('slow', 1)], communicator=Communicator(port=1), block=block)
+        fast = Device([Value('fast', 1)], communicator=Communicator(port=2))
+        s = self._scheduler([slow, fast], timeout=0)
+        try:
+            s.poll(0)
+            self._wait_for(fast, 1)
+            s.poll(1)
+            self._wait_for(fast, 2)
+
+            # slow is still reading so its value was skipped
+            self.assertListEqual(slow.reads, [])
+            self.assertEqual(slow.values[0].nmissed, 1)
+            self.assertEqual(slow.values[0].ntimeouts, 1)
+            self.assertEqual(fast.values[0].nmissed, 0)
+        finally:
+            block.set()
+
+        self._wait(s)
+        self.assertListEqual(slow.reads, ['slow'])
+
+    def test_late(self):
+        dev = Device([Value('a', 1)])
+        s = self._scheduler([dev], tolerance=1)
+        s.poll(5)
+        self.assertEqual(dev.values[0].nmissed, 1)
+
+    def test_disabled(self):
+        dev = Device([Value('a', 1)])
+        dev.use = False
+        s = self._scheduler([dev])
+        s.poll(0)
+        self._wait(s)
+        self.assertListEqual(dev.reads, [])
+
+    def test_push_exception(self):
+        dev = FailingDevice([Value('a', 1), Value('b', 1, func_name='get_b')])
+        s = self._scheduler([dev])
+        s.poll(0)
+        self._wait(s)
+        self.assertListEqual(dev.pushed, ['b'])
+
+        # the worker survives and the communicator is polled again
+        self.assertFalse(any(g.busy for g in s._groups.values()))
+        s.poll(1)
+        self._wait(s)
+        self.assertListEqual(dev.pushed, ['b', 'b'])
+
+    def _wait_for(self, dev, n):
+        st = time.time()
+        while len(dev.pushed) < n and time.time() - st < 2:
+            time.sleep(0.001)
+        self.assertEqual(len(dev.pushed), n)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,52 +13,159 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
-from datetime import datetime
+import time
+from collections import OrderedDict
+from threading import RLock
+
+ENTRY_OVERHEAD = 4096
+
+
+def analysis_nbytes(an):
+    """
+    approximate memory footprint of an analysis. The raw isotope arrays dominate so only they are
+    counted plus a fixed overhead per analysis
+    """
+    n = ENTRY_OVERHEAD
+    isotopes = getattr(an, 'isotopes', None)
+    if isotopes:
+        for iso in isotopes.values():
+            for m in (iso, getattr(iso, 'baseline', None), getattr(iso, 'sniff', None)):
+                if m is not None:
+                    for attr in ('xs', 'ys'):
+                        n += getattr(getattr(m, attr, None), 'nbytes', 0)
+    return n
 
 
 class DVCCache(object):
-    def __init__(self, max_size=1000):
-        self._cache = {}
+    """
+    LRU cache of analyses keyed by uuid.
+
+    entries are kept in access order so lookups, insertions and evictions are O(1). The cache is bounded by
+    number of entries (``max_size``) and optionally by the approximate number of bytes (``max_bytes``).
+    Entries not accessed within ``ttl`` seconds are expired.
+    """
+
+    def __init__(self, max_size=1000, max_bytes=0, ttl=60 * 15, sizeof=analysis_nbytes):
+        self._cache = OrderedDict()
+        self._lock = RLock()
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._nbytes = 0
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
 
     def clear(self):
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._nbytes = 0
 
     def clean(self):
-        t = 60 * 15  # 15 minutes
-        now = datetime.now()
-        remove = (k for k, v in self._cache.items()
-                  if (now - v['date_accessed']).total_seconds() > t)
+        """
+        remove expired entries. entries are in access order so stop at the first unexpired entry
+        """
+        if not self.ttl:
+            return
+
+        oldest = time.time() - self.ttl
+        cache = self._cache
+        with self._lock:
+            while cache:
+                key, entry = next(iter(cache.items()))
+                if entry['date_accessed'] > oldest:
+                    break
 
-        for k in remove:
-            del self._cache[k]
+                self._pop(key)
+                self.expirations += 1
 
     def report(self):
-        return len(self._cache)
+        return {'size': len(self._cache),
+                'nbytes': self._nbytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations}
 
     def get(self, item):
-        obj = self._cache.get(item)
-        if obj:
-            obj['date_accessed'] = datetime.now()
-            return obj['value']
+        with self._lock:
+            entry = self._cache.get(item)
+            if entry is not None:
+                if self.ttl and time.time() - entry['date_accessed'] > self.ttl:
+                    self._pop(item)
+                    self.expirations += 1
+                else:
+                    self.hits += 1
+                    entry['date_accessed'] = time.time()
+                    self._cache.move_to_end(item)
+
+                    # raw data may have been loaded since the entry was added
+                    self._resize(entry)
+                    self._evict()
+                    return entry['value']
+
+            self.misses += 1
 
     def update(self, key, value):
-        if key not in self._cache and len(self._cache) > self.max_size:
-            self.remove_oldest()
+        with self._lock:
+            if key in self._cache:
+                self._pop(key)
 
-        self._cache[key] = {'date_accessed': datetime.now(),
-                            'value': value}
+            entry = {'date_accessed': time.time(),
+                     'value': value,
+                     'nbytes': 0}
+            self._cache[key] = entry
+            self._resize(entry)
+            self._evict()
+
+    def remove(self, key):
+        """
+        invalidate ``key``. return True if ``key`` was cached
+        """
+        with self._lock:
+            if key in self._cache:
+                self._pop(key)
+                self.invalidations += 1
+                return True
 
     def remove_oldest(self):
         """
-                Remove the entry that has the oldest accessed date
+                Remove the least recently accessed entry
         """
-        oldest_entry = None
-        for key in self._cache:
-            if oldest_entry is None:
-                oldest_entry = key
-            elif self._cache[key]['date_accessed'] < self._cache[oldest_entry]['date_accessed']:
-                oldest_entry = key
-
-        self._cache.pop(oldest_entry)
+        with self._lock:
+            if self._cache:
+                key = next(iter(self._cache))
+                self._pop(key)
+                self.evictions += 1
+
+    def __contains__(self, item):
+        return item in self._cache
+
+    # private
+    def _resize(self, entry):
+        if self._sizeof:
+            n = self._sizeof(entry['value'])
+            self._nbytes += n - entry['nbytes']
+            entry['nbytes'] = n
+
+    def _evict(self):
+        """
+        evict least recently used entries until the cache is within bounds. the most recent entry is always kept
+        """
+        cache = self._cache
+        while len(cache) > 1 and (len(cache) > self.max_size or (self.max_bytes and self._nbytes > self.max_bytes)):
+            self.remove_oldest()
+
+    def _pop(self, key):
+        entry = self._cache.pop(key)
+        self._nbytes -= entry['nbytes']
+        return entry
+
 # ============= EOF =============================================
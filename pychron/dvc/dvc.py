@@ -17,9 +17,11 @@
 import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
+from threading import current_thread, main_thread
 
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
@@ -32,6 +34,7 @@ from pychron.core.helpers.filetools import remove_extension, list_subdirectories
 from pychron.core.helpers.iterfuncs import groupby_key, groupby_repo
 from pychron.core.i_datastore import IDatastore
 from pychron.core.progress import progress_loader, progress_iterator, open_progress
+from pychron.core.ui.gui import invoke_in_main_thread
 from pychron.dvc import dvc_dump, dvc_load, analysis_path, repository_path, AnalysisNotAnvailableError, PATH_MODIFIERS, \
     USE_GIT_TAGGING
 from pychron.dvc.cache import DVCCache
@@ -39,7 +42,9 @@ from pychron.dvc.defaults import TRIGA, HOLDER_24_SPOKES, LASER221, LASER65
 from pychron.dvc.dvc_analysis import DVCAnalysis
 from pychron.dvc.dvc_database import DVCDatabase
 from pychron.dvc.func import find_interpreted_age_path, GitSessionCTX, push_repositories, make_interpreted_age_dict
-from pychron.dvc.meta_repo import MetaRepo, get_frozen_flux, get_frozen_productions
+from pychron.dvc.meta_repo import MetaRepo, get_frozen_productions
+from pychron.dvc.persistent_cache import PersistentFileCache
+from pychron.dvc.raw_data import RAW_DATA_EXTENSION, convert_repository_raw_data
 from pychron.dvc.tasks.dvc_preferences import DVCConnectionItem
 from pychron.dvc.util import Tag, DVCInterpretedAge
 from pychron.envisage.browser.record_views import InterpretedAgeRecordView
@@ -51,6 +56,8 @@ from pychron.git_archive.views import StatusView
 from pychron.globals import globalv
 from pychron.loggable import Loggable
 from pychron.paths import paths, r_mkdir
+from pychron.processing.arar_constants import ArArConstants
+from pychron.processing.batch_age import calculate_analyses
 from pychron.processing.interpreted_age import InterpretedAge
 from pychron.pychron_constants import RATIO_KEYS, INTERFERENCE_KEYS, STARTUP_MESSAGE_POSITION
 
@@ -86,9 +93,17 @@ class DVC(Loggable):
     use_cocktail_irradiation = Str
     use_cache = Bool
     max_cache_size = Int
+    max_cache_memory = Int
+    use_persistent_cache = Bool
+    analysis_loader_workers = Int
+    repository_sync_workers = Int
+    repository_sync_timeout = Int
+    repository_sync_freshness = Int
     irradiation_prefix = Str
 
     _cache = None
+    _file_cache = None
+    _repository_sync_times = None
     _uuid_runid_cache = {}
 
     def __init__(self, bind=True, *args, **kw):
@@ -148,11 +163,13 @@ class DVC(Loggable):
 
         os.remove(sp)
 
-        for modifier in ('baselines', 'blanks', 'extraction',
-                         'intercepts', 'icfactors', 'peakcenter', '.data'):
-            sp = analysis_path(src_id, repo_identifier, modifier=modifier, root=root)
+        for modifier, ext in (('baselines', '.json'), ('blanks', '.json'), ('extraction', '.json'),
+                              ('intercepts', '.json'), ('icfactors', '.json'), ('peakcenter', '.json'),
+                              ('.data', '.json'), ('.data', RAW_DATA_EXTENSION)):
+            sp = analysis_path(src_id, repo_identifier, modifier=modifier, root=root, extension=ext)
 
-            dp = analysis_path(dest_id, repo_identifier, modifier=modifier, root=root, mode='w', is_temp=True)
+            dp = analysis_path(dest_id, repo_identifier, modifier=modifier, root=root, extension=ext,
+                               mode='w', is_temp=True)
 
             if sp and os.path.isfile(sp):
                 self.debug('{}>>{}'.format(sp, dp))
@@ -161,6 +178,25 @@ class DVC(Loggable):
 
         return temps
 
+    def convert_raw_data(self, repository_identifier, to_binary=True, remove=False, commit=False):
+        """
+        convert the raw data (.data) files in a repository between the json and binary formats.
+        The original files are kept unless ``remove`` is True.
+
+        """
+        root = repository_path(repository_identifier)
+        self.info('converting raw data. repository={} to_binary={}'.format(repository_identifier, to_binary))
+        converted = convert_repository_raw_data(root, to_binary=to_binary, remove=remove)
+        self.info('converted {} raw data files'.format(len(converted)))
+
+        if commit and converted:
+            ps = [dest for src, dest in converted]
+            if remove:
+                ps.extend([src for src, dest in converted])
+            self.repository_add_paths(repository_identifier, ps)
+            self.repository_commit(repository_identifier, '<COLLECTION> converted raw data format')
+        return converted
+
     def generate_currents(self):
         if not self.update_currents_enabled:
             self.information_dialog('You must enable "Current Values" in Preferences/DVC')
@@ -515,6 +551,7 @@ class DVC(Loggable):
         self.debug('manual edit {} {} {}'.format(runid, repository_identifier, modifier))
         self.debug('values {}'.format(values))
         self.debug('errors {}'.format(errors))
+        self._invalidate_cache(runid)
         path = analysis_path(runid, repository_identifier, modifier=modifier)
         obj = dvc_load(path)
 
@@ -531,6 +568,7 @@ class DVC(Loggable):
         return path
 
     def revert_manual_edits(self, analysis, repository_identifier):
+        self._invalidate_cache(analysis)
         ps = []
         for mod in ('intercepts', 'blanks', 'baselines', 'icfactors'):
             path = analysis_path(analysis, repository_identifier, modifier=mod)
@@ -587,6 +625,10 @@ class DVC(Loggable):
 
         mod_repositories = []
         for expid, ais in groupby_repo(ans):
+            ais = list(ais)
+            for ai in ais:
+                self._invalidate_cache(ai)
+
             ps = [analysis_path(x, x.repository_identifier, modifier=modifier) for x in ais for modifier in modifiers]
             if self.repository_add_paths(expid, ps):
                 self.repository_commit(expid, msg)
@@ -608,8 +650,7 @@ class DVC(Loggable):
         if dets:
             self.info('Delete existing icfactors for {}'.format(ai))
             ai.delete_icfactors(dets)
-            if self._cache:
-                self._cache.remove(ai.uiid)
+            self._invalidate_cache(ai)
 
             self._update_current_age(ai)
 
@@ -621,24 +662,21 @@ class DVC(Loggable):
                 self.info('Saving icfactors for {}'.format(ai))
                 ai.dump_icfactors(dets, fits, refs, reviewed=True)
 
-        if self._cache:
-            self._cache.remove(ai.uiid)
+        self._invalidate_cache(ai)
         self._update_current_age(ai)
 
     def save_blanks(self, ai, keys, refs):
         if keys:
             self.info('Saving blanks for {}'.format(ai))
             ai.dump_blanks(keys, refs, reviewed=True)
-            if self._cache:
-                self._cache.remove(ai.uiid)
+            self._invalidate_cache(ai)
 
             self._update_current_blanks(ai, keys)
 
     def save_defined_equilibration(self, ai, keys):
         if keys:
             self.info('Saving equilibration for {}'.format(ai))
-            if self._cache:
-                self._cache.remove(ai.uiid)
+            self._invalidate_cache(ai)
 
             self._update_current(ai, keys)
             return ai.dump_equilibration(keys, reviewed=True)
@@ -647,8 +685,7 @@ class DVC(Loggable):
         if keys:
             self.info('Saving fits for {}'.format(ai))
             ai.dump_fits(keys, reviewed=True)
-            if self._cache:
-                self._cache.remove(ai.uiid)
+            self._invalidate_cache(ai)
 
             self._update_current(ai, keys)
 
@@ -742,7 +779,7 @@ class DVC(Loggable):
 
         return ias
 
-    def find_flux_monitors(self, irradiation, levels, sample, make_records=True):
+    def find_flux_monitors(self, irradiation, levels, sample, make_records=True, calculate_f_only=False):
         db = self.db
         with db.session_ctx():
             ans = db.get_flux_monitor_analyses(irradiation, levels, sample)
@@ -750,7 +787,7 @@ class DVC(Loggable):
                 a.bind()
 
             if make_records:
-                ans = self.make_analyses(ans)
+                ans = self.make_analyses(ans, calculate_f_only=calculate_f_only)
             return ans
 
     def find_references_by_load(self, load, atypes, make_records=True, **kw):
@@ -811,6 +848,13 @@ class DVC(Loggable):
         if a:
             return a[0]
 
+    def invalidate_cache(self, uuids):
+        """
+        remove analyses from the cache so they are reloaded by the next ``make_analyses``
+        """
+        for uuid in uuids:
+            self._invalidate_cache(uuid)
+
     def make_analyses(self, records, calculate_f_only=False, reload=False, quick=False, use_progress=True):
         if not records:
             return []
@@ -835,14 +879,6 @@ class DVC(Loggable):
 
             records = nrecords
 
-        def func(xi, prog, i, n):
-            if prog:
-                prog.change_message('Syncing repository= {}'.format(xi))
-            try:
-                self.sync_repo(xi, use_progress=False)
-            except BaseException:
-                pass
-
         bad_records = [r for r in records if r.repository_identifier is None]
         if bad_records:
             self.warning_dialog('Missing Repository Associations. Contact an expert!'
@@ -859,11 +895,7 @@ class DVC(Loggable):
 
         exps = {r.repository_identifier for r in records}
 
-        if use_progress:
-            progress_iterator(exps, func, threshold=1)
-        else:
-            for ei in exps:
-                self.sync_repo(ei, use_progress=False)
+        self.sync_repositories(exps, use_progress=use_progress)
         try:
             branches = {ei: get_repository_branch(repository_path(ei)) for ei in exps}
         except NoSuchPathError:
@@ -876,62 +908,44 @@ class DVC(Loggable):
         frozen_fluxes = {}
         frozen_productions = {}
         meta_repo = self.meta_repo
-        use_cocktail_irradiation = self.use_cocktail_irradiation
+        meta_repo.file_cache.reset_counters()
         if not quick:
             for exp in exps:
                 ps = get_frozen_productions(exp)
                 frozen_productions.update(ps)
 
-            for r in records:
-                irrad = r.irradiation
-                if irrad != 'NoIrradiation':
-                    if irrad not in frozen_fluxes:
-                        frozen_fluxes[irrad] = get_frozen_flux(r.repository_identifier, r.irradiation)
-
-                    level = r.irradiation_level
-                    if irrad in fluxes:
-                        flux_levels = fluxes[irrad]
-                        prod_levels = productions[irrad]
-                    else:
-                        flux_levels = {}
-                        prod_levels = {}
-
-                    if level not in flux_levels:
-                        flux_levels[level] = meta_repo.get_flux_positions(irrad, level)
-                        prod_levels[level] = meta_repo.get_production(irrad, level)
-
-                    if irrad not in chronos:
-                        chronos[irrad] = meta_repo.get_chronology(irrad)
-
-                    if irrad not in fluxes:
-                        fluxes[irrad] = flux_levels
-                        productions[irrad] = prod_levels
-
-                if use_cocktail_irradiation and r.analysis_type == 'cocktail' and 'cocktail' not in chronos:
-                    cirr = meta_repo.get_cocktail_irradiation()
-                    chronos['cocktail'] = cirr.get('chronology')
-                    fluxes['cocktail'] = cirr.get('flux')
-
+            fluxes, productions, chronos, frozen_fluxes = meta_repo.prefetch(records,
+                                                                             self.use_cocktail_irradiation)
             sens = meta_repo.get_sensitivities()
+            self._prime_decay_factors(records, chronos)
 
-        def func(*args):
+        def func(*args, **kw):
+            # F is calculated for all the analyses at once after they are loaded
+            if calculate_f_only:
+                kw['calculate'] = False
             try:
                 return self._make_record(branches=branches, chronos=chronos, productions=productions,
                                          fluxes=fluxes, calculate_f_only=calculate_f_only, sens=sens,
                                          frozen_fluxes=frozen_fluxes, frozen_productions=frozen_productions,
                                          quick=quick,
-                                         reload=reload, *args)
+                                         reload=reload, *args, **kw)
             except BaseException:
                 record = args[0]
                 self.debug('make analysis exception: repo={}, record_id={}'.format(record.repository_identifier,
                                                                                    record.record_id))
                 self.debug_exception()
 
-        if use_progress:
+        nworkers = self.analysis_loader_workers
+        if nworkers > 1 and len(records) > 1:
+            ret = self._make_records_concurrent(records, func, nworkers, use_progress, calculate_f_only, quick)
+        elif use_progress:
             ret = progress_loader(records, func, threshold=1, step=25)
         else:
             ret = [func(r, None, 0, 0) for r in records]
 
+        if calculate_f_only and not quick:
+            self._calculate_f_batch([a for a in ret if a is not None])
+
         et = time.time() - st
 
         n = len(ret)
@@ -941,7 +955,13 @@ class DVC(Loggable):
         if self.use_cache:
             cache.clean()
             ret = cached_records + ret
+            self.debug('Analysis cache {}'.format(cache.report()))
 
+        if self._file_cache:
+            self._file_cache.flush()
+            self.debug('Persistent file cache {}'.format(self._file_cache.report()))
+
+        self.debug('Meta file cache {}'.format(meta_repo.file_cache.report()))
         return ret
 
     # repositories
@@ -1063,6 +1083,132 @@ class DVC(Loggable):
                         for ni in names:
                             self.debug('available repo== {}'.format(ni))
 
+    def sync_repositories(self, names, use_progress=True):
+        """
+        pull or clone many repositories.
+
+        Fetches and clones are run concurrently in a pool of ``repository_sync_workers`` threads, each fetch
+        is killed after ``repository_sync_timeout`` seconds. Merging fetched changes happens in the
+        calling thread because it may ask the user to accept the changes.
+        Repositories synced within the last ``repository_sync_freshness`` minutes are skipped.
+
+        :return: dict of repository name: status
+        """
+        report = {}
+        freshness = self.repository_sync_freshness * 60
+        if freshness:
+            sync_times = self._get_repository_sync_times()
+            now = time.time()
+            for ni in names:
+                if now - sync_times.get(ni, 0) < freshness:
+                    report[ni] = 'skipped'
+
+        names = sorted({ni for ni in names if ni not in report})
+        if not names:
+            return report
+
+        nworkers = self.repository_sync_workers
+        if nworkers <= 1:
+            def func(xi, prog, i, n):
+                if prog:
+                    prog.change_message('Syncing repository= {}'.format(xi))
+                try:
+                    report[xi] = 'synced' if self.sync_repo(xi, use_progress=False) else 'failed'
+                except BaseException:
+                    report[xi] = 'failed'
+
+            if use_progress:
+                progress_iterator(names, func, threshold=1)
+            else:
+                for ni in names:
+                    func(ni, None, 0, 0)
+        else:
+            self._sync_repositories_concurrent(names, nworkers, report, use_progress)
+
+        if freshness:
+            now = time.time()
+            for name, status in report.items():
+                if status in ('updated', 'current', 'cloned', 'synced'):
+                    sync_times[name] = now
+            self._dump_repository_sync_times()
+
+        self.info('Repository sync summary: {}'.format(', '.join('{}={}'.format(k, v)
+                                                                  for k, v in sorted(report.items()))))
+        return report
+
+    def _sync_repositories_concurrent(self, names, nworkers, report, use_progress):
+        timeout = self.repository_sync_timeout or None
+        exists = {ni: os.path.isdir(os.path.join(repository_path(ni), '.git')) for ni in names}
+
+        clones = [ni for ni in names if not exists[ni]]
+        service, remote_names = None, []
+        if clones:
+            service = self.application.get_service(IGitHost)
+            if service:
+                remote_names = self.remote_repository_names()
+
+        def fetch(name):
+            root = repository_path(name)
+            try:
+                if exists[name]:
+                    repo = GitRepoManager()
+                    repo.open_repo(root)
+                    if not repo.has_remote():
+                        return name, repo, 'local'
+
+                    if repo.fetch(timeout=timeout) is None:
+                        return name, repo, 'failed'
+                    return name, repo, 'fetched'
+                elif service and name in remote_names:
+                    service.clone_from(name, root, self.organization)
+                    return name, None, 'cloned'
+            except BaseException as e:
+                self.warning('Failed syncing repository {}. error={}'.format(name, e))
+                return name, None, 'failed'
+
+            # let sync_repo handle creating/reporting the missing repository
+            return name, None, None
+
+        prog = None
+        if use_progress:
+            prog = open_progress(len(names))
+
+        fetched = []
+        with ThreadPoolExecutor(max_workers=nworkers) as executor:
+            for name, repo, status in executor.map(fetch, names):
+                if prog:
+                    prog.change_message('Fetched repository= {}'.format(name))
+
+                if status == 'fetched':
+                    fetched.append((name, repo))
+                elif status is None:
+                    report[name] = 'synced' if self.sync_repo(name, use_progress=False) else 'failed'
+                else:
+                    report[name] = status
+
+        if prog:
+            prog.close()
+
+        for name, repo in fetched:
+            head = repo.get_head()
+            try:
+                repo.pull(use_progress=False, use_auto_pull=self.use_auto_pull, fetch=False)
+            except BaseException as e:
+                self.warning('Failed merging repository {}. error={}'.format(name, e))
+                report[name] = 'failed'
+                continue
+
+            report[name] = 'updated' if repo.get_head() != head else 'current'
+
+    def _get_repository_sync_times(self):
+        if self._repository_sync_times is None:
+            self._repository_sync_times = dvc_load(os.path.join(paths.appdata_dir, 'repository_sync_times.json'))
+        return self._repository_sync_times
+
+    def _dump_repository_sync_times(self):
+        if self._repository_sync_times is not None:
+            dvc_dump(self._repository_sync_times, os.path.join(paths.appdata_dir, 'repository_sync_times.json'))
+
     def rollback_repository(self, expid):
         repo = self._get_repository(expid)
 
@@ -1467,6 +1613,9 @@ class DVC(Loggable):
     def clear_cache(self):
         if self.use_cache:
             self._cache.clear()
+        if self._file_cache:
+            self._file_cache.clear()
+        self.meta_repo.file_cache.clear()
 
     # private
     def _update_current_blanks(self, ai, keys=None, dban=None, force=False, update_age=True, commit=True):
@@ -1622,9 +1771,98 @@ class DVC(Loggable):
             prog.change_message('Loading repository {}. {}/{}'.format(expid, i, n))
         self.sync_repo(expid)
 
+    def _make_records_concurrent(self, records, func, nworkers, use_progress, calculate_f_only, quick):
+        """
+        read and parse the analysis files in a pool of ``nworkers`` threads then calculate the ages in the
+        calling thread. The returned list is in the same order as ``records``
+        """
+        n = len(records)
+        prog = None
+        if use_progress:
+            prog = open_progress(n)
+
+        def load(r):
+            if prog and prog.canceled:
+                return
+            return func(r, None, 0, 0, calculate=False)
+
+        ret = []
+        lt = 0
+        with ThreadPoolExecutor(max_workers=nworkers) as executor:
+            for i, a in enumerate(executor.map(load, records)):
+                if prog:
+                    if prog.canceled:
+                        break
+
+                    # throttle progress updates. changing the message is expensive
+                    now = time.time()
+                    if now - lt > 0.25 or i == n - 1:
+                        lt = now
+                        prog.change_message('Loading analysis {}/{}'.format(i + 1, n), auto_increment=False)
+                        prog.update(i)
+                if a:
+                    ret.append(a)
+
+        if prog:
+            if prog.canceled:
+                prog.close()
+                return []
+            prog.close()
+
+        if not (quick or calculate_f_only):
+            for a in ret:
+                try:
+                    a.calculate_age()
+                except BaseException:
+                    self.debug('calculate age exception: record_id={}'.format(a.record_id))
+                    self.debug_exception()
+
+        return ret
+
+    def _prime_decay_factors(self, records, chronos):
+        """
+        calculate the decay factors of every record together, once per chronology. the analyses pick them up from
+        the chronology's memo in ``set_chronology``
+        """
+        timestamps = {}
+        for r in records:
+            key = r.irradiation
+            if r.analysis_type == 'cocktail' and 'cocktail' in chronos:
+                key = 'cocktail'
+
+            if chronos.get(key) and r.rundate:
+                timestamps.setdefault(key, []).append(r.rundate)
+
+        if timestamps:
+            arc = ArArConstants()
+            dc37, dc39 = nominal_value(arc.lambda_Ar37), nominal_value(arc.lambda_Ar39)
+            for key, ts in timestamps.items():
+                try:
+                    chronos[key].get_decay_factors_batch(ts, dc37, dc39)
+                except BaseException:
+                    self.debug('prime decay factors exception: chronology={}'.format(key))
+                    self.debug_exception()
+
+    def _calculate_f_batch(self, ans):
+        """
+        calculate F for all ``ans`` at once with the float based batch calculator. analyses with correlated inputs
+        are calculated individually by ``calculate_analyses``
+        """
+        try:
+            calculate_analyses(ans, calculate_f_only=True)
+        except BaseException:
+            self.debug('batch calculate f exception. calculating individually')
+            self.debug_exception()
+            for a in ans:
+                try:
+                    a.calculate_f()
+                except BaseException:
+                    self.debug('calculate f exception: record_id={}'.format(a.record_id))
+                    self.debug_exception()
+
     def _make_record(self, record, prog, i, n, productions=None, chronos=None, branches=None, fluxes=None, sens=None,
                      frozen_fluxes=None, frozen_productions=None,
-                     calculate_f_only=False, reload=False, quick=False):
+                     calculate_f_only=False, reload=False, quick=False, calculate=True):
         meta_repo = self.meta_repo
         if prog:
             # this accounts for ~85% of the time!!!
@@ -1655,14 +1893,17 @@ class DVC(Loggable):
             uuid = record.uuid
 
             try:
-                a = DVCAnalysis(uuid, rid, expid)
+                a = DVCAnalysis(uuid, rid, expid, file_cache=self._file_cache)
             except AnalysisNotAnvailableError:
 
                 try:
-                    a = DVCAnalysis(uuid, rid, expid)
+                    a = DVCAnalysis(uuid, rid, expid, file_cache=self._file_cache)
                 except AnalysisNotAnvailableError:
-                    self.warning_dialog('Analysis {} not in repository {}. '
-                                        'You many need to pull changes'.format(rid, expid))
+                    msg = 'Analysis {} not in repository {}. You many need to pull changes'.format(rid, expid)
+                    if current_thread() is main_thread():
+                        self.warning_dialog(msg)
+                    else:
+                        invoke_in_main_thread(self.warning_dialog, msg)
                     return
 
             a.group_id = record.group_id
@@ -1755,15 +1996,27 @@ class DVC(Loggable):
                             except KeyError:
                                 pass
 
-                if calculate_f_only:
-                    a.calculate_f()
-                else:
-                    a.calculate_age()
+                if calculate:
+                    if calculate_f_only:
+                        a.calculate_f()
+                    else:
+                        a.calculate_age()
 
-        if self._cache:
+        # analyses without ages are not cached so they are never returned to a caller that needs the ages
+        if self._cache and not calculate_f_only:
             self._cache.update(record.uuid, a)
         return a
 
+    def _invalidate_cache(self, ai):
+        """
+        remove an analysis from the cache after its files have been modified so a stale analysis is never served
+
+        :param ai: analysis or uuid
+        """
+        if self._cache:
+            key = ai if isinstance(ai, str) else ai.uuid
+            self._cache.remove(key)
+
     def _get_repository(self, repository_identifier, as_current=True):
         if isinstance(repository_identifier, GitRepoManager):
             repo = repository_identifier
@@ -1794,6 +2047,12 @@ class DVC(Loggable):
         bind_preference(self, 'use_cocktail_irradiation', '{}.use_cocktail_irradiation'.format(prefid))
         bind_preference(self, 'use_cache', '{}.use_cache'.format(prefid))
         bind_preference(self, 'max_cache_size', '{}.max_cache_size'.format(prefid))
+        bind_preference(self, 'max_cache_memory', '{}.max_cache_memory'.format(prefid))
+        bind_preference(self, 'use_persistent_cache', '{}.use_persistent_cache'.format(prefid))
+        bind_preference(self, 'analysis_loader_workers', '{}.analysis_loader_workers'.format(prefid))
+        bind_preference(self, 'repository_sync_workers', '{}.repository_sync_workers'.format(prefid))
+        bind_preference(self, 'repository_sync_timeout', '{}.repository_sync_timeout'.format(prefid))
+        bind_preference(self, 'repository_sync_freshness', '{}.repository_sync_freshness'.format(prefid))
         bind_preference(self, 'update_currents_enabled', '{}.update_currents_enabled'.format(prefid))
         bind_preference(self, 'use_auto_pull', '{}.use_auto_pull'.format(prefid))
 
@@ -1801,6 +2060,8 @@ class DVC(Loggable):
         bind_preference(self, 'irradiation_prefix', '{}.irradiation_prefix'.format(prefid))
         if self.use_cache:
             self._use_cache_changed()
+        if self.use_persistent_cache:
+            self._use_persistent_cache_changed()
 
     def _max_cache_size_changed(self, new):
         if new:
@@ -1811,9 +2072,26 @@ class DVC(Loggable):
         else:
             self.use_cache = False
 
+    def _max_cache_memory_changed(self, new):
+        if self._cache:
+            self._cache.max_bytes = new * 1024 ** 2
+
+    def _use_persistent_cache_changed(self):
+        if self._file_cache:
+            self._file_cache.close()
+            self._file_cache = None
+
+        if self.use_persistent_cache:
+            p = os.path.join(paths.appdata_dir, 'dvc_file_cache.sqlite')
+            try:
+                self._file_cache = PersistentFileCache(p)
+            except BaseException as e:
+                self.warning('Failed to open persistent cache {}. error={}'.format(p, e))
+
     def _use_cache_changed(self):
         if self.use_cache:
-            self._cache = DVCCache(max_size=self.max_cache_size)
+            self._cache = DVCCache(max_size=self.max_cache_size,
+                                   max_bytes=self.max_cache_memory * 1024 ** 2)
         else:
             self._cache = None
 
@@ -18,19 +18,19 @@
 # ============= standard library imports ========================
 import datetime
 import os
-import time
 from operator import itemgetter
 
 from uncertainties import ufloat, std_dev, nominal_value
 
-from pychron.core.helpers.binpack import unpack, format_blob, encode_blob
+from pychron.core.helpers.binpack import unpack
 from pychron.core.helpers.datetime_tools import make_timef
 from pychron.core.helpers.filetools import add_extension
 from pychron.core.helpers.iterfuncs import partition
 from pychron.core.helpers.strtools import to_csv_str
-from pychron.dvc import USE_GIT_TAGGING
+from pychron.dvc import USE_GIT_TAGGING, DATA
 from pychron.dvc import dvc_dump, dvc_load, analysis_path, make_ref_list, get_spec_sha, get_masses, repository_path, \
     AnalysisNotAnvailableError
+from pychron.dvc.raw_data import open_raw_data, dump_raw_data, RAW_DATA_EXTENSION
 from pychron.experiment.utilities.environmentals import set_environmentals
 from pychron.experiment.utilities.runid import make_aliquot_step, make_step
 from pychron.processing.analyses.analysis import Analysis
@@ -64,10 +64,12 @@ class TIsotope:
 class DVCAnalysis(Analysis):
     production_obj = None
     chronology_obj = None
+    file_cache = None
     use_repository_suffix = False
 
-    def __init__(self, uuid, record_id, repository_identifier, *args, **kw):
+    def __init__(self, uuid, record_id, repository_identifier, file_cache=None, *args, **kw):
         super(DVCAnalysis, self).__init__(*args, **kw)
+        self.file_cache = file_cache
         self.record_id = record_id
         path = analysis_path((uuid, record_id), repository_identifier)
         self.repository_identifier = repository_identifier
@@ -82,7 +84,7 @@ class DVCAnalysis(Analysis):
 
         ep = os.path.join(root, 'extraction', '{}.extr{}'.format(head, ext))
         if os.path.isfile(ep):
-            jd = dvc_load(ep)
+            jd = self._load_json(ep)
 
             self.load_extraction(jd)
 
@@ -90,7 +92,7 @@ class DVCAnalysis(Analysis):
             self.warning('Invalid analysis. RunID="{}". No extraction file {}'.format(record_id, ep))
 
         if os.path.isfile(path):
-            jd = dvc_load(path)
+            jd = self._load_json(path)
             self.load_spectrometer_parameters(jd.get('spec_sha'))
             self.load_environmentals(jd.get('environmental'))
 
@@ -192,7 +194,7 @@ class DVCAnalysis(Analysis):
             path = self._analysis_path(modifier=modifier)
             if path:
                 if os.path.isfile(path):
-                    jd = dvc_load(path)
+                    jd = self._load_json(path)
                     if jd:
                         func = getattr(self, '_load_{}'.format(modifier))
                         try:
@@ -224,13 +226,13 @@ class DVCAnalysis(Analysis):
         return jd
 
     def load_raw_data(self, keys=None, n_only=False, use_name_pairs=True):
-        path = self._analysis_path(modifier='.data')
+        with self._open_raw_data() as rd:
+            self._load_raw_data(rd, keys, n_only, use_name_pairs)
 
-        jd = dvc_load(path)
-
-        signals = jd.get('signals', [])
-        baselines = jd.get('baselines', [])
-        sniffs = jd.get('sniffs', [])
+    def _load_raw_data(self, rd, keys, n_only, use_name_pairs):
+        signals = rd.signals
+        baselines = rd.baselines
+        sniffs = rd.sniffs
 
         for sd in signals:
             isok = sd.get('isotope')
@@ -250,16 +252,16 @@ class DVCAnalysis(Analysis):
             if not iso:
                 continue
 
-            blob = sd.get('blob')
+            blob = rd.get_blob(sd)
             if blob:
-                iso.unpack_data(format_blob(blob), n_only)
+                iso.unpack_data(blob, n_only)
 
             # det = sd['detector']
             bd = next((b for b in baselines if b.get('detector') == det), None)
             if bd:
-                blob = bd.get('blob')
+                blob = rd.get_blob(bd)
                 if blob:
-                    iso.baseline.unpack_data(format_blob(blob), n_only)
+                    iso.baseline.unpack_data(blob, n_only)
 
         # loop thru keys to make sure none were missed this can happen when only loading baseline
         if keys:
@@ -268,9 +270,9 @@ class DVCAnalysis(Analysis):
                 if bd:
                     for iso in self.itervalues():
                         if iso.detector == k:
-                            blob = bd.get('blob')
+                            blob = rd.get_blob(bd)
                             if blob:
-                                iso.baseline.unpack_data(format_blob(blob), n_only)
+                                iso.baseline.unpack_data(blob, n_only)
 
         for sn in sniffs:
             isok = sn.get('isotope')
@@ -285,11 +287,7 @@ class DVCAnalysis(Analysis):
             if keys and key not in keys and isok not in keys:
                 continue
 
-            data = None
-            blob = sn.get('blob')
-            if blob:
-                data = format_blob(blob)
-
+            data = rd.get_blob(sn)
             for iso in self.itervalues():
                 if iso.detector == det:
                     iso.sniff.unpack_data(data, n_only)
@@ -303,28 +301,15 @@ class DVCAnalysis(Analysis):
     def set_chronology(self, chron):
         analts = self.rundate
 
-        def convert_days(x):
-            return x.total_seconds() / (60. * 60 * 24)
-
-        doses = chron.get_doses()
-
-        def calc_ti(st, en):
-            t = st
-            if chron.use_irradiation_endtime:
-                t = en
-            return convert_days(analts - t)
+        self.irradiation_time = chron.irradiation_time
+        self.chron_segments = chron.get_chron_segments(analts, use_endtime=chron.use_irradiation_endtime)
 
-        segments = [(pwr, convert_days(en - st), calc_ti(st, en), st, en)
-                    for pwr, st, en in doses
-                    if st is not None and en is not None]
-        d_o = 0
-        if doses:
-            d_o = doses[0][1]
-        self.irradiation_time = time.mktime(d_o.timetuple()) if d_o else 0
-
-        self.chron_segments = segments
-        # self.chron_dosages = doses
-        self.calculate_decay_factors()
+        # only calculate decayfactors once. the chronology memoizes them for every analysis of the irradiation
+        if not self.ar39decayfactor:
+            arc = self.arar_constants
+            self.ar37decayfactor, self.ar39decayfactor = chron.get_decay_factors(analts,
+                                                                                 nominal_value(arc.lambda_Ar37),
+                                                                                 nominal_value(arc.lambda_Ar39))
 
     def set_fits(self, fitobjs):
         isos = self.isotopes
@@ -349,9 +334,10 @@ class DVCAnalysis(Analysis):
         dvc_dump(meta, self.meta_path)
 
     def dump_equilibration(self, keys, reviewed=False):
-        path = self._analysis_path(modifier='.data')
+        with self._open_raw_data() as rd:
+            jd = rd.to_dict()
+            path = rd.path
 
-        jd = dvc_load(path)
         endianness = jd['format'][0]
 
         nsignals = []
@@ -365,7 +351,7 @@ class DVCAnalysis(Analysis):
                     if existing == 'sniffs':
                         iso = iso.sniff
 
-                    sblob = encode_blob(iso.pack(endianness, as_hex=False))
+                    sblob = iso.pack(endianness, as_hex=False)
                     new.append({'isotope': iso.name, 'blob': sblob, 'detector': iso.detector})
                 else:
                     new.append(sig)
@@ -378,12 +364,12 @@ class DVCAnalysis(Analysis):
                     if issniff:
                         iso = iso.sniff
 
-                    sblob = encode_blob(iso.pack(endianness, as_hex=False))
+                    sblob = iso.pack(endianness, as_hex=False)
                     new.append({'isotope': iso.name, 'blob': sblob, 'detector': iso.detector})
         jd['reviewed'] = reviewed
         jd['signals'] = nsignals
         jd['sniffs'] = nsniffs
-        dvc_dump(jd, path)
+        dump_raw_data(jd, path)
 
         return path
 
@@ -605,6 +591,20 @@ class DVCAnalysis(Analysis):
                     iso.ic_factor = ufloat(vv, ee, tag='{} IC'.format(iso.name))
                     iso.ic_factor_reviewed = r
 
+    def _open_raw_data(self):
+        """
+        use the binary raw data file if available otherwise fallback to json
+        """
+        path = self._analysis_path(modifier=DATA, extension=RAW_DATA_EXTENSION)
+        if path is None:
+            path = self._analysis_path(modifier=DATA)
+        return open_raw_data(path)
+
+    def _load_json(self, path):
+        if self.file_cache is not None:
+            return self.file_cache.load(path)
+        return dvc_load(path)
+
     def _get_json(self, modifier):
         path = self._analysis_path(modifier=modifier)
         jd = dvc_load(path)
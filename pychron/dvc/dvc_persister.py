@@ -28,7 +28,8 @@ from yaml import YAMLError
 
 from pychron.core.helpers.binpack import encode_blob, pack
 from pychron.core.yaml import yload
-from pychron.dvc import dvc_dump, analysis_path, repository_path, NPATH_MODIFIERS
+from pychron.dvc import dvc_dump, analysis_path, repository_path, NPATH_MODIFIERS, DATA
+from pychron.dvc.raw_data import dump_raw_data, RAW_DATA_EXTENSION
 from pychron.experiment.automated_run.persistence import BasePersister
 from pychron.git_archive.repo_manager import GitRepoManager
 from pychron.paths import paths
@@ -55,6 +56,7 @@ class DVCPersister(BasePersister):
     dvc = Instance(DVC_PROTOCOL)
     use_isotope_classifier = Bool(False)
     use_uuid_path_name = Bool(True)
+    use_binary_raw_data = Bool(False)
     # isotope_classifier = Instance(IsotopeClassifier, ())
     stage_files = Bool(True)
     default_principal_investigator = Str
@@ -67,6 +69,7 @@ class DVCPersister(BasePersister):
         super(DVCPersister, self).__init__(*args, **kw)
         if bind:
             bind_preference(self, 'use_uuid_path_name', 'pychron.experiment.use_uuid_path_name')
+            bind_preference(self, 'use_binary_raw_data', 'pychron.dvc.experiment.use_binary_raw_data')
 
         self._load_arar_mapping()
 
@@ -238,6 +241,7 @@ class DVCPersister(BasePersister):
                     ar.smart_pull(accept_their=True)
 
                     paths = [spec_path, ] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]
+                    paths.append(self._make_path(modifier=DATA, extension=RAW_DATA_EXTENSION))
 
                     for p in paths:
                         if os.path.isfile(p):
@@ -497,8 +501,8 @@ class DVCPersister(BasePersister):
             clf = self.application.get_service('pychron.classifier.isotope_classifier.IsotopeClassifier')
 
         for key, iso in per_spec.isotope_group.items():
-            sblob = encode_blob(iso.pack(endianness, as_hex=False))
-            snblob = encode_blob(iso.sniff.pack(endianness, as_hex=False))
+            sblob = iso.pack(endianness, as_hex=False)
+            snblob = iso.sniff.pack(endianness, as_hex=False)
 
             for ss, blob in ((signals, sblob), (sniffs, snblob)):
                 d = {'isotope': iso.name, 'detector': iso.detector, 'blob': blob}
@@ -517,7 +521,7 @@ class DVCPersister(BasePersister):
             isos[key] = isod
 
             if iso.detector not in dets:
-                bblob = encode_blob(iso.baseline.pack(endianness, as_hex=False))
+                bblob = iso.baseline.pack(endianness, as_hex=False)
                 baselines.append({'detector': iso.detector, 'blob': bblob})
                 dets[iso.detector] = {'deflection': per_spec.defl_dict.get(iso.detector),
                                       'gain': per_spec.gains.get(iso.detector)}
@@ -619,13 +623,13 @@ class DVCPersister(BasePersister):
         p = self._make_path(modifier='icfactors')
         dvc_dump(icfactors, p)
 
-        # dump runid.data.json
-        p = self._make_path(modifier='.data')
+        # dump runid.dat.json or runid.dat.bin
+        ext = RAW_DATA_EXTENSION if self.use_binary_raw_data else '.json'
+        p = self._make_path(modifier=DATA, extension=ext)
         data = {'commit': hexsha,
-                'encoding': 'base64',
                 'format': '{}ff'.format(endianness),
                 'signals': signals, 'baselines': baselines, 'sniffs': sniffs}
-        dvc_dump(data, p)
+        dump_raw_data(data, p)
 
     def _save_macrochron(self, obj):
         pass
@@ -18,11 +18,15 @@ import os
 import time
 from datetime import datetime
 
+from numpy import array, subtract
 from uncertainties import ufloat, std_dev
 
 from pychron.dvc import dvc_dump
+from pychron.processing.argon_calculations import calculate_arar_decay_factors_vectorized
 from pychron.pychron_constants import INTERFERENCE_KEYS, RATIO_KEYS
 
+DAY = 60. * 60 * 24
+
 
 class MetaObjectException(BaseException):
     def __init__(self, msg):
@@ -58,17 +62,26 @@ class Gains(MetaObject):
 
 
 class Chronology(MetaObject):
+    """
+    the irradiation doses. the doses are parsed once and kept as arrays so the decay factors for any number of
+    analyses can be calculated together.
+
+    decay factors are memoized by (analysis timestamp, lambdas, use_irradiation_endtime). the chronology is
+    shared by every analysis of the irradiation so an analysis loaded again, or a second analysis with the same
+    timestamp, does not recalculate them
+    """
     _doses = None
     duration = 0
     use_irradiation_endtime = False
 
     def __init__(self, *args, **kw):
         self._doses = []
+        self._set_arrays()
         super(Chronology, self).__init__(*args, **kw)
 
     @classmethod
     def from_lines(cls, lines):
-        c = cls(new=False)
+        c = cls(new=True)
         c._load(lines)
         return c
 
@@ -91,14 +104,61 @@ class Chronology(MetaObject):
             self._doses.append((float(power), start, end))
 
         self.duration = d / 3600.
+        self._set_arrays()
+
+    def _set_arrays(self):
+        # times are kept in seconds from the start of the first dose so the differences are exact
+        doses = self._doses
+        self._reference = doses[0][1] if doses else datetime(1970, 1, 1)
+        self._powers = array([p for p, _, _ in doses], dtype=float)
+        self._starts = array([self._seconds(st) for _, st, _ in doses], dtype=float)
+        self._ends = array([self._seconds(en) for _, _, en in doses], dtype=float)
+        self._durations = (self._ends - self._starts) / DAY
+
+        self._irradiation_time = time.mktime(doses[0][1].timetuple()) if doses else 0
+        self._decay_factors = {}
 
     def get_doses(self):
         return self._doses
 
-    def get_chron_segments(self, analts):
+    def get_chron_segments(self, analts, use_endtime=False):
         convert_days = lambda x: x.total_seconds() / (60. * 60 * 24)
 
-        return [(p, convert_days(en - st), convert_days(analts - st), st, en) for p, st, en in self._doses]
+        return [(p, convert_days(en - st), convert_days(analts - (en if use_endtime else st)), st, en)
+                for p, st, en in self._doses]
+
+    def get_decay_factors(self, analts, dc37, dc39):
+        """
+        return the Ar37 and Ar39 decay factors for an analysis run at ``analts``
+        """
+        key = (analts, dc37, dc39, self.use_irradiation_endtime)
+        try:
+            return self._decay_factors[key]
+        except KeyError:
+            return self.get_decay_factors_batch((analts,), dc37, dc39)[0]
+
+    def get_decay_factors_batch(self, timestamps, dc37, dc39):
+        """
+        return a list of (df37, df39) for every timestamp in ``timestamps``.
+
+        the factors for timestamps that are not already memoized are calculated together
+        """
+        cache = self._decay_factors
+        endtime = self.use_irradiation_endtime
+
+        missing = list({ts for ts in timestamps if (ts, dc37, dc39, endtime) not in cache})
+        if missing:
+            ref = self._ends if endtime else self._starts
+            ts = array([self._seconds(t) for t in missing], dtype=float)
+            dts = subtract.outer(ts, ref) / DAY
+            df37s, df39s = calculate_arar_decay_factors_vectorized(dc37, dc39, self._powers, self._durations, dts)
+            for t, df37, df39 in zip(missing, df37s, df39s):
+                cache[(t, dc37, dc39, endtime)] = (float(df37), float(df39))
+
+        return [cache[(ts, dc37, dc39, endtime)] for ts in timestamps]
+
+    def _seconds(self, d):
+        return (d - self._reference).total_seconds()
 
     @property
     def total_duration_seconds(self):
@@ -109,11 +169,7 @@ class Chronology(MetaObject):
 
     @property
     def irradiation_time(self):
-        try:
-            d_o = self._doses[0][1]
-            return time.mktime(d_o.timetuple())
-        except IndexError:
-            return 0
+        return self._irradiation_time
 
     @property
     def start_date(self):
@@ -15,7 +15,9 @@
 # ===============================================================================
 import os
 import shutil
+from copy import copy
 from datetime import datetime
+from threading import RLock
 
 from traits.api import Bool
 from uncertainties import ufloat
@@ -75,6 +77,14 @@ def gain_path(name):
     return p
 
 
+def load_sensitivity(path):
+    obj = dvc_load(path)
+    for r in obj:
+        if r['create_date']:
+            r['create_date'] = datetime.strptime(r['create_date'], DATE_FORMAT)
+    return obj
+
+
 def get_frozen_productions(repo):
     prods = {}
     for name, path in list_frozen_productions(repo):
@@ -83,20 +93,120 @@ def get_frozen_productions(repo):
     return prods
 
 
-def get_frozen_flux(repo, irradiation):
+def load_frozen_flux(path):
+    fd = dvc_load(path)
+    for fi in fd.values():
+        fi['j'] = ufloat(*fi['j'], tag='J')
+    return fd
+
+
+def get_frozen_flux(repo, irradiation, file_cache=None):
     path = repository_path(repo, '{}.json'.format(irradiation))
 
     fd = {}
     if path:
-        fd = dvc_load(path)
-        for fi in fd.values():
-            fi['j'] = ufloat(*fi['j'], tag='J')
+        if file_cache is not None:
+            fd = file_cache.load(path, load_frozen_flux)
+        else:
+            fd = load_frozen_flux(path)
     return fd
 
 
+class MetaFileCache(object):
+    """
+    read-through cache of parsed meta files.
+
+    Entries are keyed by path and the loader used to parse the file, and are validated against the file's
+    modification time and size so edits to the working tree, e.g. a pull or a saved flux, are picked up on
+    the next load. Parsed objects are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._lock = RLock()
+        self._cache = {}
+        self.hits = 0
+        self.reads = 0
+
+    def load(self, path, loader=dvc_load, tag=None):
+        try:
+            st = os.stat(path)
+        except OSError:
+            with self._lock:
+                self.reads += 1
+            return loader(path)
+
+        key = (path, tag or getattr(loader, '__name__', None))
+        stamp = st.st_mtime_ns, st.st_size
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] == stamp:
+                self.hits += 1
+                return entry[1]
+
+        obj = loader(path)
+        with self._lock:
+            self.reads += 1
+            self._cache[key] = (stamp, obj)
+        return obj
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def reset_counters(self):
+        with self._lock:
+            self.hits = 0
+            self.reads = 0
+
+    def report(self):
+        with self._lock:
+            return {'size': len(self._cache), 'hits': self.hits, 'reads': self.reads}
+
+
 class MetaRepo(GitRepoManager):
     clear_cache = Bool
 
+    def __init__(self, *args, **kw):
+        super(MetaRepo, self).__init__(*args, **kw)
+        self.file_cache = MetaFileCache()
+
+    def prefetch(self, records, use_cocktail_irradiation=False):
+        """
+        load the flux positions, production and chronology for every irradiation level referenced by
+        ``records``. each file is read at most once
+
+        :return: fluxes, productions, chronos, frozen_fluxes
+        """
+        fluxes = {}
+        productions = {}
+        chronos = {}
+        frozen_fluxes = {}
+
+        for r in records:
+            irrad = r.irradiation
+            if irrad and irrad != 'NoIrradiation':
+                if irrad not in frozen_fluxes:
+                    frozen_fluxes[irrad] = get_frozen_flux(r.repository_identifier, irrad,
+                                                           file_cache=self.file_cache)
+
+                flux_levels = fluxes.setdefault(irrad, {})
+                prod_levels = productions.setdefault(irrad, {})
+
+                level = r.irradiation_level
+                if level not in flux_levels:
+                    flux_levels[level] = self.get_flux_positions(irrad, level)
+                    prod_levels[level] = self.get_production(irrad, level)
+
+                if irrad not in chronos:
+                    chronos[irrad] = self.get_chronology(irrad)
+
+            if use_cocktail_irradiation and r.analysis_type == 'cocktail' and 'cocktail' not in chronos:
+                cirr = self.get_cocktail_irradiation()
+                chronos['cocktail'] = cirr.get('chronology')
+                fluxes['cocktail'] = cirr.get('flux')
+
+        return fluxes, productions, chronos, frozen_fluxes
+
     def get_monitor_info(self, irrad, level):
         age, decay = NULL_STR, NULL_STR
         positions = self._get_level_positions(irrad, level)
@@ -144,7 +254,7 @@ class MetaRepo(GitRepoManager):
     def update_level_monitor(self, irradiation, level, monitor_name, monitor_material, monitor_age, lambda_k):
         path = self.get_level_path(irradiation, level)
         obj = dvc_load(path)
-        positions = self._get_level_positions(irradiation, level)
+        positions = self._extract_positions(obj)
 
         options = {'monitor_name': monitor_name,
                    'monitor_material': monitor_material,
@@ -226,7 +336,7 @@ class MetaRepo(GitRepoManager):
     def set_identifier(self, irradiation, level, pos, identifier):
         p = self.get_level_path(irradiation, level)
         jd = dvc_load(p)
-        positions = self._get_level_positions(irradiation, level)
+        positions = self._extract_positions(jd)
 
         d = next((p for p in positions if p['position'] == pos), None)
         if d:
@@ -536,12 +646,7 @@ class MetaRepo(GitRepoManager):
             if p.endswith('.sens.json'):
                 name = p.split('.')[0]
                 p = os.path.join(root, p)
-                obj = dvc_load(p)
-
-                for r in obj:
-                    if r['create_date']:
-                        r['create_date'] = datetime.strptime(r['create_date'], DATE_FORMAT)
-                specs[name] = obj
+                specs[name] = self.file_cache.load(p, load_sensitivity)
 
         return specs
 
@@ -564,12 +669,14 @@ class MetaRepo(GitRepoManager):
     # @cached('clear_cache')
     def get_production(self, irrad, level, allow_null=False, **kw):
         path = os.path.join(paths.meta_root, irrad, 'productions.json')
-        obj = dvc_load(path)
+        obj = self.file_cache.load(path)
 
         pname = obj.get(level, '')
         p = os.path.join(paths.meta_root, irrad, 'productions', add_extension(pname, ext='.json'))
 
-        ip = Production(p, allow_null=allow_null)
+        # the cached production is shared. callers get their own copy so they can modify it
+        ip = copy(self.file_cache.load(p, lambda x: Production(x, allow_null=allow_null),
+                                       tag=('production', allow_null)))
         # print 'new production id={}, name={}, irrad={}, level={}'.format(id(ip), pname, irrad, level)
         return pname, ip
 
@@ -577,7 +684,11 @@ class MetaRepo(GitRepoManager):
     def get_chronology(self, name, allow_null=False, **kw):
         chron = None
         try:
-            chron = irradiation_chronology(name, allow_null=allow_null)
+            p = os.path.join(paths.meta_root, name, 'chronology.txt')
+            # a copy of the cached chronology so the preference is not set on every caller's chronology.
+            # the copies share the parsed doses and the memoized decay factors
+            chron = copy(self.file_cache.load(p, lambda x: Chronology(x, allow_null=allow_null),
+                                              tag=('chronology', allow_null)))
             if self.application:
                 chron.use_irradiation_endtime = self.application.get_boolean_preference(
                     'pychron.arar.constants.use_irradiation_endtime', False)
@@ -603,7 +714,10 @@ class MetaRepo(GitRepoManager):
     # private
     def _get_level_positions(self, irrad, level):
         p = self.get_level_path(irrad, level)
-        obj = dvc_load(p)
+        obj = self.file_cache.load(p)
+        return self._extract_positions(obj)
+
+    def _extract_positions(self, obj):
         if isinstance(obj, list):
             positions = obj
         else:
@@ -0,0 +1,110 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import pickle
+import sqlite3
+from threading import RLock
+
+# ============= local library imports  ==========================
+from pychron.dvc import dvc_load
+
+SCHEMA = '''CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY,
+                                              mtime_ns INTEGER,
+                                              size INTEGER,
+                                              data BLOB)'''
+
+
+class PersistentFileCache(object):
+    """
+    on-disk cache of parsed DVC json files.
+
+    Entries are keyed by path and validated against the file's modification time and size, the same
+    test git uses to decide if a working tree file changed. Files that changed, e.g. after a pull or a
+    fit was saved, are re-read and the entry replaced. Unchanged files are unpickled instead of parsed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = RLock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+
+    def load(self, path, loader=dvc_load):
+        try:
+            st = os.stat(path)
+        except (OSError, TypeError):
+            return loader(path)
+
+        # only the database is locked. parsing and pickling run concurrently in the loader's workers
+        with self._lock:
+            row = self._conn.execute('SELECT mtime_ns, size, data FROM files WHERE path=?', (path,)).fetchone()
+
+        if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+            try:
+                obj = pickle.loads(row[2])
+            except (pickle.UnpicklingError, EOFError, TypeError):
+                pass
+            else:
+                with self._lock:
+                    self.hits += 1
+                return obj
+
+        obj = loader(path)
+        data = sqlite3.Binary(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self.misses += 1
+            self._conn.execute('INSERT OR REPLACE INTO files (path, mtime_ns, size, data) VALUES (?,?,?,?)',
+                               (path, st.st_mtime_ns, st.st_size, data))
+            self._dirty = True
+        return obj
+
+    def flush(self):
+        with self._lock:
+            if self._dirty:
+                self._conn.commit()
+                self._dirty = False
+
+    def remove(self, path):
+        with self._lock:
+            self._conn.execute('DELETE FROM files WHERE path=?', (path,))
+            self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM files')
+            self._conn.commit()
+            self._dirty = False
+            self._conn.execute('VACUUM')
+
+    def report(self):
+        with self._lock:
+            n = self._conn.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+        return {'size': n, 'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+# ============= EOF =============================================
@@ -0,0 +1,260 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+Raw signal data (the ".data" modifier) can be stored in two formats
+
+    json    runid.dat.json. pretty-printed json, each blob base64 encoded
+    binary  runid.dat.bin. small json index header followed by the raw blobs
+
+binary layout
+
+    MAGIC | uint32 header length | header | blob 0 | blob 1 | ... | blob N
+
+the header is a json document::
+
+    {'version': 1, 'commit': <sha>, 'format': '>ff',
+     'signals': [{'isotope':, 'detector':, 'offset':, 'nbytes':}, ...],
+     'baselines': [...],
+     'sniffs': [...]}
+
+offsets are relative to the end of the header. blobs are the same packed (x, y) float32 pairs
+used by the json format so either format can be converted to the other without loss.
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import struct
+
+# ============= local library imports  ==========================
+from pychron import json
+from pychron.core.helpers.binpack import format_blob, encode_blob
+from pychron.dvc import dvc_load, dvc_dump
+
+RAW_DATA_EXTENSION = '.bin'
+JSON_DATA_EXTENSION = '.json'
+
+MAGIC = b'PCDVCRAW'
+VERSION = 1
+SECTIONS = ('signals', 'baselines', 'sniffs')
+
+
+class BaseRawData(object):
+    """
+    common interface for reading raw data. ``signals``, ``baselines`` and ``sniffs`` are lists of
+    index dicts. Use ``get_blob`` to retrieve the packed data for an entry
+    """
+    path = None
+    commit = None
+    fmt = '>ff'
+
+    def __init__(self, path):
+        self.path = path
+        self.attrs = {}
+        self.signals = []
+        self.baselines = []
+        self.sniffs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        pass
+
+    def get_blob(self, entry):
+        raise NotImplementedError
+
+    def to_dict(self):
+        """
+        return a dict with the same structure as the json format but with the blobs decoded
+        """
+        d = dict(self.attrs)
+        d.update(commit=self.commit, format=self.fmt)
+        for section in SECTIONS:
+            d[section] = [self._decoded_entry(e) for e in getattr(self, section)]
+        return d
+
+    def _load(self, jd):
+        self.commit = jd.get('commit')
+        self.fmt = jd.get('format', self.fmt)
+        for section in SECTIONS:
+            setattr(self, section, jd.get(section, []))
+
+        self.attrs = {k: v for k, v in jd.items() if k not in SECTIONS + ('commit', 'format', 'encoding', 'version')}
+
+    def _decoded_entry(self, entry):
+        d = {k: v for k, v in entry.items() if k not in ('blob', 'offset', 'nbytes')}
+        d['blob'] = self.get_blob(entry)
+        return d
+
+
+class JSONRawData(BaseRawData):
+    def __init__(self, path):
+        super(JSONRawData, self).__init__(path)
+
+        jd = dvc_load(path) if path else {}
+        self._load(jd)
+
+    def get_blob(self, entry):
+        blob = entry.get('blob')
+        if blob:
+            return format_blob(blob)
+
+
+class BinaryRawData(BaseRawData):
+    """
+    only the header is read on open. blobs are read on demand
+    """
+    _rfile = None
+    _data_offset = 0
+
+    def __init__(self, path):
+        super(BinaryRawData, self).__init__(path)
+        self._rfile = open(path, 'rb')
+        self._read_header()
+
+    def close(self):
+        if self._rfile:
+            self._rfile.close()
+            self._rfile = None
+
+    def get_blob(self, entry):
+        nbytes = entry.get('nbytes')
+        if nbytes:
+            self._rfile.seek(self._data_offset + entry['offset'])
+            return self._rfile.read(nbytes)
+
+    def _read_header(self):
+        rfile = self._rfile
+        magic = rfile.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError('Invalid raw data file. {}'.format(self.path))
+
+        n, = struct.unpack('>I', rfile.read(4))
+        header = json.loads(rfile.read(n).decode('utf-8'))
+        self._data_offset = len(MAGIC) + 4 + n
+
+        self._load(header)
+
+
+def open_raw_data(path):
+    """
+    return the appropriate reader for ``path``.
+    """
+    if path and path.endswith(RAW_DATA_EXTENSION):
+        return BinaryRawData(path)
+    return JSONRawData(path)
+
+
+def dump_raw_data(obj, path):
+    """
+    write ``obj`` to ``path``. ``obj`` has the same structure as the json format but blobs are raw bytes.
+    The format is selected by the extension of ``path``
+    """
+    if path.endswith(RAW_DATA_EXTENSION):
+        dump_binary_raw_data(obj, path)
+    else:
+        jd = {k: v for k, v in obj.items() if k not in SECTIONS}
+        jd.update(encoding='base64', format=obj.get('format', '>ff'))
+        for section in SECTIONS:
+            entries = []
+            for e in obj.get(section, []):
+                e = dict(e)
+                e['blob'] = encode_blob(e.get('blob'))
+                entries.append(e)
+            jd[section] = entries
+
+        dvc_dump(jd, path)
+
+
+def dump_binary_raw_data(obj, path):
+    header = {k: v for k, v in obj.items() if k not in SECTIONS}
+    header.update(version=VERSION, format=obj.get('format', '>ff'))
+
+    blobs = []
+    offset = 0
+    for section in SECTIONS:
+        entries = []
+        for e in obj.get(section, []):
+            blob = e.get('blob') or b''
+            if isinstance(blob, str):
+                blob = blob.encode('utf-8')
+
+            e = {k: v for k, v in e.items() if k != 'blob'}
+            e['offset'] = offset
+            e['nbytes'] = len(blob)
+            entries.append(e)
+
+            blobs.append(blob)
+            offset += len(blob)
+        header[section] = entries
+
+    header = json.dumps(header).encode('utf-8')
+    with open(path, 'wb') as wfile:
+        wfile.write(MAGIC)
+        wfile.write(struct.pack('>I', len(header)))
+        wfile.write(header)
+        for blob in blobs:
+            wfile.write(blob)
+
+
+def convert_raw_data(src, dest=None, remove=False):
+    """
+    convert a raw data file from one format to the other.
+
+    :param src: path to an existing raw data file
+    :param dest: destination path. defaults to ``src`` with the extension swapped
+    :param remove: remove ``src`` after a successful conversion
+    :return: ``dest``
+    """
+    head, ext = os.path.splitext(src)
+    if dest is None:
+        dest = '{}{}'.format(head, JSON_DATA_EXTENSION if ext == RAW_DATA_EXTENSION else RAW_DATA_EXTENSION)
+
+    with open_raw_data(src) as rd:
+        obj = rd.to_dict()
+
+    dump_raw_data(obj, dest)
+    if remove:
+        os.remove(src)
+    return dest
+
+
+def convert_repository_raw_data(root, to_binary=True, remove=False):
+    """
+    convert every raw data file in the repository at ``root``
+
+    :return: list of (src, dest) tuples
+    """
+    src_ext = JSON_DATA_EXTENSION if to_binary else RAW_DATA_EXTENSION
+    converted = []
+    for r, ds, fs in os.walk(root):
+        if '.git' in ds:
+            ds.remove('.git')
+
+        if os.path.basename(r) != '.data':
+            continue
+
+        for f in fs:
+            if f.endswith(src_ext):
+                src = os.path.join(r, f)
+                converted.append((src, convert_raw_data(src, remove=remove)))
+    return converted
+
+# ============= EOF =============================================
@@ -86,6 +86,12 @@ class DVCPreferences(BasePreferencesHelper):
     use_cocktail_irradiation = Bool
     use_cache = Bool
     max_cache_size = Int
+    max_cache_memory = Int
+    use_persistent_cache = Bool
+    analysis_loader_workers = Int
+    repository_sync_workers = Int
+    repository_sync_timeout = Int
+    repository_sync_freshness = Int
     update_currents_enabled = Bool
     use_auto_pull = Bool(True)
 
@@ -106,8 +112,26 @@ class DVCPreferencesPane(PreferencesPane):
                                                                                       'the official version.')),
                         BorderVGroup(Item('update_currents_enabled', label='Enabled'),
                                      label='Current Values'),
+                        BorderVGroup(Item('analysis_loader_workers', label='Workers',
+                                          tooltip='Number of threads used to read analysis files. '
+                                                  '0 or 1 loads analyses sequentially'),
+                                     HGroup(Item('repository_sync_workers', label='Sync Workers',
+                                                 tooltip='Number of repositories to fetch concurrently. '
+                                                         '0 or 1 syncs repositories sequentially'),
+                                            Item('repository_sync_timeout', label='Timeout (s)',
+                                                 tooltip='Kill a fetch/clone after this many seconds. 0 for no '
+                                                         'timeout'),
+                                            Item('repository_sync_freshness', label='Freshness (min)',
+                                                 tooltip='Skip repositories synced within this many minutes')),
+                                     label='Loading'),
                         BorderVGroup(HGroup(Item('use_cache', label='Enabled'),
-                                            Item('max_cache_size', label='Max Size')),
+                                            Item('max_cache_size', label='Max Size'),
+                                            Item('max_cache_memory', label='Max Memory (MB)',
+                                                 tooltip='Maximum approximate memory used by cached analyses. '
+                                                         '0 for no limit')),
+                                     Item('use_persistent_cache', label='Persistent',
+                                          tooltip='Keep parsed analysis files in an on-disk cache so unchanged '
+                                                  'analyses load faster in subsequent sessions'),
                                      label='Cache')))
         return v
 
@@ -115,6 +139,7 @@ class DVCPreferencesPane(PreferencesPane):
 class DVCExperimentPreferences(BasePreferencesHelper):
     preferences_path = 'pychron.dvc.experiment'
     use_dvc_persistence = Bool
+    use_binary_raw_data = Bool
 
 
 class DVCExperimentPreferencesPane(PreferencesPane):
@@ -123,6 +148,9 @@ class DVCExperimentPreferencesPane(PreferencesPane):
 
     def traits_view(self):
         v = View(BorderVGroup(Item('use_dvc_persistence', label='Use DVC Persistence'),
+                              Item('use_binary_raw_data', label='Binary Raw Data',
+                                   tooltip='Save the raw signal data (.data) in the compact binary format '
+                                           'instead of JSON'),
                               label='DVC'))
         return v
 
@@ -0,0 +1,89 @@
+import time
+import unittest
+
+from pychron.dvc.cache import DVCCache
+
+
+class DVCCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = DVCCache(max_size=3, sizeof=lambda x: x)
+
+    def test_get_miss(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_get_hit(self):
+        self.cache.update('a', 1)
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_evict_lru(self):
+        c = self.cache
+        for k in 'abc':
+            c.update(k, 1)
+
+        # touch a so b is the least recently used
+        c.get('a')
+        c.update('d', 1)
+
+        self.assertNotIn('b', c)
+        for k in 'acd':
+            self.assertIn(k, c)
+        self.assertEqual(c.evictions, 1)
+
+    def test_max_bytes(self):
+        c = self.cache
+        c.max_bytes = 10
+        c.update('a', 4)
+        c.update('b', 4)
+        c.update('c', 4)
+        self.assertNotIn('a', c)
+        self.assertEqual(c.report()['nbytes'], 8)
+
+    def test_keep_newest(self):
+        c = self.cache
+        c.max_bytes = 10
+        c.update('a', 20)
+        self.assertIn('a', c)
+
+    def test_replace(self):
+        c = self.cache
+        c.update('a', 4)
+        c.update('a', 5)
+        self.assertEqual(c.report()['nbytes'], 5)
+        self.assertEqual(c.report()['size'], 1)
+
+    def test_remove(self):
+        c = self.cache
+        c.update('a', 4)
+        self.assertTrue(c.remove('a'))
+        self.assertFalse(c.remove('a'))
+        self.assertIsNone(c.get('a'))
+        self.assertEqual(c.invalidations, 1)
+        self.assertEqual(c.report()['nbytes'], 0)
+
+    def test_ttl(self):
+        c = self.cache
+        c.ttl = 0.01
+        c.update('a', 1)
+        time.sleep(0.02)
+        c.update('b', 1)
+        c.clean()
+        self.assertNotIn('a', c)
+        self.assertIn('b', c)
+        self.assertEqual(c.expirations, 1)
+
+    def test_ttl_get(self):
+        c = self.cache
+        c.ttl = 0.01
+        c.update('a', 1)
+        time.sleep(0.02)
+        self.assertIsNone(c.get('a'))
+        self.assertEqual(c.expirations, 1)
+
+    def test_empty_cache_is_truthy(self):
+        self.assertTrue(self.cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
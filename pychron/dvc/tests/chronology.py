@@ -0,0 +1,72 @@
+import unittest
+from datetime import datetime, timedelta
+
+from pychron.dvc.meta_object import Chronology
+from pychron.processing.argon_calculations import calculate_arar_decay_factors
+
+DC37 = 0.01975
+DC39 = 7.068e-6
+
+LINES = ['1.0,2020-01-01 08:00:00,2020-01-01 20:00:00',
+         '0.5,2020-01-02 08:00:00,2020-01-03 08:00:00',
+         '1.0,2020-01-05 08:00:00,2020-01-05 14:30:00']
+
+
+class ChronologyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.chron = Chronology.from_lines(LINES)
+        st = datetime(2020, 2, 1, 9, 15, 0)
+        self.timestamps = [st + timedelta(hours=7 * i, seconds=i) for i in range(50)]
+
+    def _expected(self, analts, use_endtime=False):
+        segments = self.chron.get_chron_segments(analts, use_endtime=use_endtime)
+        return calculate_arar_decay_factors(DC37, DC39, segments)
+
+    def test_matches_segments(self):
+        for ts in self.timestamps:
+            df37, df39 = self.chron.get_decay_factors(ts, DC37, DC39)
+            e37, e39 = self._expected(ts)
+            self.assertAlmostEqual(df37, e37, delta=1e-10 * e37)
+            self.assertAlmostEqual(df39, e39, delta=1e-10 * e39)
+
+    def test_batch(self):
+        rs = self.chron.get_decay_factors_batch(self.timestamps, DC37, DC39)
+        self.assertEqual(len(rs), len(self.timestamps))
+        for ts, (df37, df39) in zip(self.timestamps, rs):
+            e37, e39 = self._expected(ts)
+            self.assertAlmostEqual(df37, e37, delta=1e-10 * e37)
+            self.assertAlmostEqual(df39, e39, delta=1e-10 * e39)
+
+    def test_endtime(self):
+        ts = self.timestamps[3]
+        a = self.chron.get_decay_factors(ts, DC37, DC39)
+        self.chron.use_irradiation_endtime = True
+        b = self.chron.get_decay_factors(ts, DC37, DC39)
+        self.assertNotEqual(a, b)
+        self.assertAlmostEqual(b[0], self._expected(ts, use_endtime=True)[0], delta=1e-10 * b[0])
+
+    def test_memoized(self):
+        self.chron.get_decay_factors_batch(self.timestamps, DC37, DC39)
+        self.assertEqual(len(self.chron._decay_factors), len(self.timestamps))
+
+        ts = self.timestamps[0]
+        self.assertIs(self.chron.get_decay_factors(ts, DC37, DC39),
+                      self.chron.get_decay_factors(ts, DC37, DC39))
+        self.assertEqual(len(self.chron._decay_factors), len(self.timestamps))
+
+        # different lambdas are a different key
+        self.chron.get_decay_factors(ts, DC37 * 1.01, DC39)
+        self.assertEqual(len(self.chron._decay_factors), len(self.timestamps) + 1)
+
+    def test_no_doses(self):
+        chron = Chronology.from_lines([])
+        self.assertEqual(chron.get_decay_factors(self.timestamps[0], DC37, DC39), (1.0, 1.0))
+        self.assertEqual(chron.irradiation_time, 0)
+
+    def test_irradiation_time(self):
+        self.assertAlmostEqual(self.chron.irradiation_time,
+                               datetime(2020, 1, 1, 8, 0, 0).timestamp())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.dvc import dvc_dump
+from pychron.dvc.meta_repo import MetaFileCache, MetaRepo, load_frozen_flux
+from pychron.paths import paths
+
+
+class MetaFileCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.cache = MetaFileCache()
+        self.path = os.path.join(self.root, 'A.json')
+        dvc_dump({'positions': [{'position': 1, 'j': 0.001}]}, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_read_once(self):
+        a = self.cache.load(self.path)
+        b = self.cache.load(self.path)
+        self.assertIs(a, b)
+        self.assertEqual(self.cache.reads, 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_modified(self):
+        self.cache.load(self.path)
+        dvc_dump({'positions': []}, self.path)
+        self.assertEqual(self.cache.load(self.path), {'positions': []})
+        self.assertEqual(self.cache.reads, 2)
+
+    def test_loader_key(self):
+        p = os.path.join(self.root, 'flux.json')
+        dvc_dump({'12345': {'j': [0.001, 0.00001]}}, p)
+
+        self.cache.load(p)
+        fd = self.cache.load(p, load_frozen_flux)
+        self.assertAlmostEqual(fd['12345']['j'].nominal_value, 0.001)
+        self.assertEqual(self.cache.reads, 2)
+
+    def test_missing(self):
+        p = os.path.join(self.root, 'B.json')
+        self.assertEqual(self.cache.load(p), {})
+        self.assertEqual(self.cache.load(p), {})
+        self.assertEqual(self.cache.reads, 2)
+        self.assertEqual(self.cache.report()['size'], 0)
+
+    def test_reset_counters(self):
+        self.cache.load(self.path)
+        self.cache.reset_counters()
+        self.assertEqual(self.cache.report(), {'size': 1, 'hits': 0, 'reads': 0})
+
+
+class EndtimeApplication(object):
+    def __init__(self, use_endtime):
+        self.use_endtime = use_endtime
+
+    def get_boolean_preference(self, name, default=None):
+        return self.use_endtime
+
+
+class MetaRepoCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self._meta_root = paths.meta_root
+        paths.meta_root = self.root
+
+        os.mkdir(os.path.join(self.root, 'NM-300'))
+        with open(os.path.join(self.root, 'NM-300', 'chronology.txt'), 'w') as wfile:
+            wfile.write('1.0,2020-01-01 08:00:00,2020-01-01 20:00:00\n')
+
+        self.repo = MetaRepo()
+
+    def tearDown(self):
+        paths.meta_root = self._meta_root
+        shutil.rmtree(self.root)
+
+    def test_chronology_copies(self):
+        self.repo.application = EndtimeApplication(True)
+        a = self.repo.get_chronology('NM-300')
+        self.repo.application = EndtimeApplication(False)
+        b = self.repo.get_chronology('NM-300')
+
+        self.assertIsNot(a, b)
+        self.assertTrue(a.use_irradiation_endtime)
+        self.assertFalse(b.use_irradiation_endtime)
+        self.assertEqual(self.repo.file_cache.reads, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
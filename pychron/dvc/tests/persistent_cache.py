@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+from threading import Barrier, Thread
+
+from pychron.dvc import dvc_dump, dvc_load
+from pychron.dvc.persistent_cache import PersistentFileCache
+
+
+class PersistentFileCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.cache = PersistentFileCache(os.path.join(self.root, 'cache.sqlite'))
+        self.path = os.path.join(self.root, 'a.json')
+        dvc_dump({'a': 1}, self.path)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.root)
+
+    def test_miss_then_hit(self):
+        self.assertEqual(self.cache.load(self.path), {'a': 1})
+        self.assertEqual(self.cache.load(self.path), {'a': 1})
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_hit_does_not_parse(self):
+        calls = []
+
+        def loader(p):
+            calls.append(p)
+            return dvc_load(p)
+
+        self.cache.load(self.path, loader)
+        self.cache.load(self.path, loader)
+        self.assertEqual(len(calls), 1)
+
+    def test_modified(self):
+        self.cache.load(self.path)
+        dvc_dump({'a': 2, 'b': 3}, self.path)
+        self.assertEqual(self.cache.load(self.path), {'a': 2, 'b': 3})
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_persist(self):
+        self.cache.load(self.path)
+        self.cache.close()
+
+        self.cache = PersistentFileCache(os.path.join(self.root, 'cache.sqlite'))
+        self.assertEqual(self.cache.load(self.path), {'a': 1})
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_missing_file(self):
+        self.assertEqual(self.cache.load(os.path.join(self.root, 'b.json')), {})
+
+    def test_returns_copy(self):
+        obj = self.cache.load(self.path)
+        obj['a'] = 10
+        self.assertEqual(self.cache.load(self.path), {'a': 1})
+
+    def test_concurrent_parse(self):
+        paths = [self.path, os.path.join(self.root, 'b.json')]
+        dvc_dump({'b': 1}, paths[1])
+
+        # both loaders must be running at the same time for the barrier to pass
+        barrier = Barrier(2, timeout=2)
+
+        def loader(p):
+            barrier.wait()
+            return dvc_load(p)
+
+        results = {}
+
+        def load(p):
+            results[p] = self.cache.load(p, loader)
+
+        ts = [Thread(target=load, args=(p,)) for p in paths]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+
+        self.assertEqual(results, {paths[0]: {'a': 1}, paths[1]: {'b': 1}})
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_clear(self):
+        self.cache.load(self.path)
+        self.cache.clear()
+        self.assertEqual(self.cache.report()['size'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+from pychron.dvc import dvc_load
+from pychron.dvc.raw_data import dump_raw_data, open_raw_data, convert_raw_data, convert_repository_raw_data, \
+    BinaryRawData, JSONRawData, RAW_DATA_EXTENSION
+
+
+def make_blob(n, offset=0):
+    return b''.join([struct.pack('>ff', i, i * 2 + offset) for i in range(n)])
+
+
+class RawDataTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.obj = {'commit': 'abcdef',
+                    'format': '>ff',
+                    'reviewed': True,
+                    'signals': [{'isotope': 'Ar40', 'detector': 'H1', 'blob': make_blob(10)},
+                                {'isotope': 'Ar39', 'detector': 'AX', 'blob': make_blob(5, 1)}],
+                    'baselines': [{'detector': 'H1', 'blob': make_blob(3, 2)},
+                                  {'detector': 'AX', 'blob': b''}],
+                    'sniffs': [{'isotope': 'Ar40', 'detector': 'H1', 'blob': make_blob(2, 3)}]}
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _path(self, ext):
+        return os.path.join(self.root, 'a.dat{}'.format(ext))
+
+    def _assert_equal(self, rd):
+        self.assertEqual(rd.commit, 'abcdef')
+        self.assertEqual(rd.fmt, '>ff')
+        for section in ('signals', 'baselines', 'sniffs'):
+            for e, ee in zip(getattr(rd, section), self.obj[section]):
+                self.assertEqual(rd.get_blob(e) or b'', ee['blob'])
+
+    def test_binary_roundtrip(self):
+        p = self._path(RAW_DATA_EXTENSION)
+        dump_raw_data(self.obj, p)
+        with open_raw_data(p) as rd:
+            self.assertIsInstance(rd, BinaryRawData)
+            self._assert_equal(rd)
+            self.assertEqual(rd.attrs, {'reviewed': True})
+
+    def test_binary_random_access(self):
+        p = self._path(RAW_DATA_EXTENSION)
+        dump_raw_data(self.obj, p)
+        with open_raw_data(p) as rd:
+            self.assertEqual(rd.get_blob(rd.sniffs[0]), self.obj['sniffs'][0]['blob'])
+            self.assertEqual(rd.get_blob(rd.signals[1]), self.obj['signals'][1]['blob'])
+
+    def test_json_roundtrip(self):
+        p = self._path('.json')
+        dump_raw_data(self.obj, p)
+        self.assertEqual(dvc_load(p)['encoding'], 'base64')
+        with open_raw_data(p) as rd:
+            self.assertIsInstance(rd, JSONRawData)
+            self._assert_equal(rd)
+
+    def test_missing_json(self):
+        with open_raw_data(None) as rd:
+            self.assertEqual(rd.signals, [])
+
+    def test_convert(self):
+        p = self._path('.json')
+        dump_raw_data(self.obj, p)
+        dest = convert_raw_data(p, remove=True)
+        self.assertEqual(dest, self._path(RAW_DATA_EXTENSION))
+        self.assertFalse(os.path.isfile(p))
+        with open_raw_data(dest) as rd:
+            self._assert_equal(rd)
+
+    def test_convert_repository(self):
+        d = os.path.join(self.root, 'repo', 'a', '.data')
+        os.makedirs(d)
+        p = os.path.join(d, 'a.dat.json')
+        dump_raw_data(self.obj, p)
+
+        converted = convert_repository_raw_data(os.path.join(self.root, 'repo'))
+        self.assertEqual(converted, [(p, os.path.join(d, 'a.dat.bin'))])
+
+
+if __name__ == '__main__':
+    unittest.main()
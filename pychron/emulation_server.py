@@ -27,11 +27,26 @@ import sys
 from threading import Thread
 
 
+class TCPServer(six.moves.socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+class ThreadingTCPServer(six.moves.socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
 class EmulationServer(object):
-    def __init__(self, host, port, emulator):
+    server = None
+
+    def __init__(self, host, port, emulator, threaded=False):
+        """
+        :param threaded: handle each connection in its own thread so several clients can be connected at once
+        """
         self.host = host
         self.port = port
         self.emulator = emulator
+        self.threaded = threaded
 
     def start(self, join=True):
         if not join:
@@ -42,7 +57,9 @@ class EmulationServer(object):
 
     def stop(self):
         self._alive = False
-        self.server.server_close()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
 
     def run(self, host=None, port=None):
         if host is None:
@@ -54,8 +71,8 @@ class EmulationServer(object):
             return
 
         print('serving on {}:{}'.format(host, port))
-        server = six.moves.socketserver.TCPServer((host, port), self.emulator)
-        server.allow_reuse_address = True
+        klass = ThreadingTCPServer if self.threaded else TCPServer
+        server = klass((host, port), self.emulator)
         self.server = server
 
         server.serve_forever()
@@ -24,9 +24,9 @@ set_qt()
 from traits.api import Any, Str
 # ============= standard library imports ========================
 import os
-import struct
 from numpy import array
 # ============= local library imports  ==========================
+from pychron.core.helpers.binpack import pack_arrays, unpack_array
 from pychron.core.helpers.filetools import pathtolist
 from pychron.loggable import Loggable
 from pychron.core.helpers.logger_setup import logging_setup
@@ -118,16 +118,15 @@ class MassSpecReverter(Loggable):
         bs = bsys.mean()
         cys = ys - bs
 
-        ncblob = ''.join([struct.pack('>f', v) for v in ys])
-        cblob = ''.join([struct.pack('>ff', y, x) for y, x in zip(cys, xs)])
+        ncblob = pack_arrays('>f', ys)
+        cblob = pack_arrays('>ff', cys, xs)
 
         return cblob, ncblob
 
     def _unpack_data(self, blob):
         endianness = '>'
-        sx, sy = list(zip(*[struct.unpack('{}ff'.format(endianness),
-                                     blob[i:i + 8]) for i in range(0, len(blob), 8)]))
-        return array(sx), array(sy)
+        sx, sy = unpack_array(blob, '{}ff'.format(endianness))
+        return array(sx, dtype=float), array(sy, dtype=float)
 
     def _get_analysis_from_source(self, rid):
         if rid.count('-') > 1:
@@ -18,12 +18,16 @@ import logging
 from operator import attrgetter
 
 from envisage.core_plugin import CorePlugin
+from envisage.plugin_activator import PluginActivator
 from pyface.message_dialog import warning
 
+from pychron.core.codetools.startup_profiler import startup_profiler
 from pychron.core.displays.gdisplays import gTraceDisplay
+from pychron.core.helpers.strtools import to_bool
 from pychron.envisage.initialization.initialization_parser import InitializationParser
 from pychron.envisage.key_bindings import update_key_bindings
 from pychron.envisage.tasks.base_plugin import BasePlugin
+from pychron.envisage.tasks.lazy_plugin import LazyPlugin
 from pychron.envisage.tasks.tasks_plugin import PychronTasksPlugin, myTasksPlugin
 from pychron.logger.tasks.logger_plugin import LoggerPlugin
 from pychron.user.tasks.plugin import UsersPlugin
@@ -113,6 +117,42 @@ PACKAGE_DICT = dict(
 
 )
 
+# plugins that are imported the first time one of their tasks or services is requested. everything the
+# application needs from the plugin at startup is declared here. a plugin is loaded eagerly if it is
+# configured with lazy="false" in the initialization file
+LAZY_PLUGINS = dict(
+    IGSNPlugin=dict(id='pychron.igsn.plugin',
+                    declared_services=['pychron.igsn.igsn_service.IGSNService'],
+                    declared_preferences_panes=['pychron.igsn.tasks.preferences.IGSNPreferencesPane'],
+                    declared_help_tips=['More information about IGSN is located at http://www.geosamples.org/']),
+    ImagePlugin=dict(id='pychron.image.plugin',
+                     name='Image',
+                     declared_tasks=[dict(id='pychron.image.sample_imager', name='Sample Imager')]),
+    MediaStoragePlugin=dict(id='pychron.media_storage.plugin',
+                            name='Media Storage',
+                            declared_services=['pychron.media_storage.manager.MediaStorageManager'],
+                            declared_preferences_panes=['pychron.media_storage.tasks.preferences.'
+                                                        'MediaStoragePreferencesPane'],
+                            declared_tasks=[dict(id='pychron.media_storage.task_factory',
+                                                 include_view_menu=False)]),
+    SparrowPlugin=dict(name='Sparrow',
+                       declared_services=['pychron.sparrow.sparrow.Sparrow'],
+                       declared_preferences_panes=['pychron.sparrow.tasks.preferences.SparrowPreferencesPane']),
+    VideoPlugin=dict(id='pychron.video',
+                     declared_extension_points=['pychron.video.sources'],
+                     declared_tasks=[dict(id='pychron.video', name='Video Display', task_group='hardware')]),
+)
+
+
+class ProfiledPluginActivator(PluginActivator):
+    """
+    records how long each plugin takes to start
+    """
+
+    def start_plugin(self, plugin):
+        with startup_profiler.timeit('start', plugin.id):
+            super(ProfiledPluginActivator, self).start_plugin(plugin)
+
 
 def get_module_name(klass):
     words = []
@@ -154,20 +194,27 @@ def get_klass(package, name):
     return klass
 
 
-def get_plugin(pname):
+def get_plugin(pname, lazy=True):
     klass = None
     if not pname.endswith('Plugin'):
         pname = '{}Plugin'.format(pname)
 
     if pname in PACKAGE_DICT:
         package = PACKAGE_DICT[pname]
-        klass = get_klass(package, pname)
+        if lazy and pname in LAZY_PLUGINS:
+            with startup_profiler.timeit('construct', pname):
+                return LazyPlugin(package=package, klass=pname, **LAZY_PLUGINS[pname])
+
+        with startup_profiler.timeit('import', pname):
+            klass = get_klass(package, pname)
     else:
         logger.warning('****** {} not a valid plugin name******'.format(pname),
                        extra={'threadName_': 'Launcher'})
 
     if klass is not None:
-        plugin = klass()
+        with startup_profiler.timeit('construct', pname):
+            plugin = klass()
+
         if isinstance(plugin, BasePlugin):
             check = plugin.check()
             if check is True:
@@ -188,10 +235,11 @@ def get_user_plugins():
 
     plugins = []
     ip = InitializationParser()
-    ps = ip.get_plugins()
+    ps = ip.get_plugins(element=True) or []
 
     core_added = False
-    for p in ps:
+    for elem in ps:
+        p = elem.text.strip()
         # if laser plugin add CoreLaserPlugin
         if p in ('FusionsCO2', 'FusionsDiode', 'ChromiumCO2', 'AblationCO2'):
 
@@ -206,7 +254,7 @@ def get_user_plugins():
                 core_added = True
                 plugins.append(plugin)
 
-        plugin = get_plugin(p)
+        plugin = get_plugin(p, lazy=to_bool(elem.get('lazy', 'true')))
         if plugin:
             plugins.append(plugin)
 
@@ -235,6 +283,10 @@ def app_factory(klass):
     plugins.extend(get_hardware_plugins())
     plugins.extend(get_user_plugins())
 
+    if startup_profiler.enabled:
+        for p in plugins:
+            p.activator = ProfiledPluginActivator()
+
     app = klass(plugins=plugins)
 
     # set key bindings
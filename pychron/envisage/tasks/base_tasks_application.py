@@ -17,6 +17,7 @@
 # ============= enthought library imports =======================
 import os
 import pickle
+from datetime import datetime
 
 from envisage.extension_point import ExtensionPoint
 from envisage.ui.tasks.task_window_event import VetoableTaskWindowEvent, TaskWindowEvent
@@ -25,6 +26,7 @@ from pyface.dialog import Dialog
 from pyface.tasks.task_window_layout import TaskWindowLayout
 from traits.api import List, Instance
 
+from pychron.core.codetools.startup_profiler import startup_profiler
 from pychron.core.helpers.strtools import to_bool
 from pychron.core.yaml import yload
 from pychron.envisage.view_util import open_view, close_views, report_view_stats
@@ -47,6 +49,9 @@ class BaseTasksApplication(TasksApplication, Loggable):
         self.init_logger()
 
     def _application_initialized_fired(self):
+        if startup_profiler.enabled:
+            self.dump_startup_profile()
+
         if globalv.use_startup_tests:
             self.do_startup_tests()
 
@@ -56,6 +61,12 @@ class BaseTasksApplication(TasksApplication, Loggable):
             testbot = TestBot(application=self)
             testbot.run()
 
+    def dump_startup_profile(self):
+        name = 'startup_profile_{}.txt'.format(datetime.now().strftime('%Y-%m-%d_%H%M%S'))
+        path = startup_profiler.dump(os.path.join(paths.log_dir, name))
+        startup_profiler.stop()
+        self.info('startup profile written to {}'.format(path))
+
     def do_startup_tests(self, force_show_results=False, **kw):
         st = StartupTester()
         for plugin in iter(self.plugin_manager):
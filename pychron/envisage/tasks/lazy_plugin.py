@@ -0,0 +1,192 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from envisage.extension_point import ExtensionPoint
+from envisage.ui.tasks.task_factory import TaskFactory
+from traits.api import Str, List, Any, Instance
+from traits.util.camel_case import camel_case_to_words
+
+# ============= standard library imports ========================
+from importlib import import_module
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.startup_profiler import startup_profiler
+from pychron.envisage.tasks.base_task_plugin import BaseTaskPlugin
+
+# contributions the stand-in declares itself. they are not copied from the plugin when it is loaded
+DECLARED = ('tasks', 'service_offers', 'preferences_panes', 'help_tips')
+
+
+def import_symbol(path):
+    """
+    return the object named by a dotted ``path`` e.g. "pychron.dvc.dvc.DVC"
+    """
+    module, name = path.rsplit('.', 1)
+    return getattr(import_module(module), name)
+
+
+def import_factory(path):
+    """
+    return a factory that imports ``path`` the first time it is called
+    """
+
+    def factory(*args, **kw):
+        return import_symbol(path)(*args, **kw)
+
+    return factory
+
+
+class LazyPlugin(BaseTaskPlugin):
+    """
+    stand-in for a plugin whose module is imported the first time one of its tasks or services is requested.
+
+    the tasks (TaskFactory traits without the factory), service protocols, preferences panes and help tips are
+    declared as dotted paths and strings so the plugin module is not imported at startup. when the plugin is loaded
+    its other contributions (menus, nodes, ...) are added to the application and it is started.
+
+    the plugin is not in the plugin manager so the ids of the extension points it offers must be declared, otherwise
+    the application does not know about them and the plugin's ExtensionPoint traits resolve to []
+    """
+    package = Str
+    klass = Str
+
+    declared_tasks = List
+    declared_services = List
+    declared_preferences_panes = List
+    declared_help_tips = List
+    declared_extension_points = List
+
+    plugin = Instance('envisage.plugin.Plugin')
+    _services = Any
+
+    def traits_init(self):
+        for eid in self.declared_extension_points:
+            self.add_trait(eid.replace('.', '_'), ExtensionPoint(List, id=eid))
+
+    def load(self):
+        """
+        import, construct and start the plugin. return None if the plugin could not be loaded
+        """
+        if self.plugin is None:
+            with startup_profiler.timeit('load', self.klass):
+                try:
+                    klass = import_symbol('{}.{}'.format(self.package, self.klass))
+                except (ImportError, AttributeError) as e:
+                    self.warning('failed loading {}. {}'.format(self.klass, e))
+                    return
+
+                plugin = klass()
+                plugin.application = self.application
+                # the activator is not used. depending on the envisage version it registers the plugin's
+                # service_offers, which are already offered by this stand-in
+                plugin.connect_extension_point_traits()
+                plugin.start()
+                self.plugin = plugin
+
+            self._add_contributions(plugin)
+
+        return self.plugin
+
+    def stop(self):
+        if self.plugin is not None:
+            self.plugin.stop()
+            self.plugin.disconnect_extension_point_traits()
+
+    def __getattr__(self, item):
+        # startup tests are methods of the plugin
+        if item.startswith('test_'):
+            plugin = self.load()
+            if plugin is not None:
+                return getattr(plugin, item)
+
+        raise AttributeError(item)
+
+    # private
+    def _add_contributions(self, plugin):
+        for name in plugin.trait_names(contributes_to=lambda x: x is not None):
+            if name in DECLARED:
+                continue
+
+            trait = plugin.trait(name)
+            if self.trait(name) is None:
+                self.add_trait(name, List(contributes_to=trait.contributes_to))
+
+            setattr(self, name, getattr(plugin, name))
+
+    def _create_task(self, tid, **traits):
+        plugin = self.load()
+        if plugin is not None:
+            factory = next((t for t in plugin.tasks if t.id == tid), None)
+            if factory is not None:
+                return factory.create(**traits)
+
+            self.warning('{} has no task "{}"'.format(self.klass, tid))
+
+    def _create_service(self, protocol):
+        plugin = self.load()
+        if plugin is not None:
+            for offer in plugin.service_offers:
+                p = offer.protocol
+                if not isinstance(p, str):
+                    p = '{}.{}'.format(p.__module__, p.__name__)
+
+                if p == protocol:
+                    obj = offer.factory
+                    if isinstance(obj, str):
+                        obj = import_symbol(obj)
+                    return obj(**offer.properties)
+
+            self.warning('{} does not offer "{}"'.format(self.klass, protocol))
+
+    def _task_factory(self, tid):
+        def factory(**traits):
+            return self._create_task(tid, **traits)
+
+        return factory
+
+    def _service_factory(self, protocol):
+        def factory(**properties):
+            return self._create_service(protocol)
+
+        return factory
+
+    def _id_default(self):
+        return '{}.{}'.format(self.package, self.klass)
+
+    def _name_default(self):
+        return camel_case_to_words(self.klass)
+
+    def _tasks_default(self):
+        return [TaskFactory(factory=self._task_factory(kw['id']), **kw) for kw in self.declared_tasks]
+
+    def _service_offers_default(self):
+        return [self.service_offer_factory(protocol=p, factory=self._service_factory(p))
+                for p in self.declared_services]
+
+    def _preferences_panes_default(self):
+        return [import_factory(p) for p in self.declared_preferences_panes]
+
+    def _help_tips_default(self):
+        return list(self.declared_help_tips)
+
+    def _task_extensions_default(self):
+        return []
+
+    def _available_task_extensions_default(self):
+        return []
+
+# ============= EOF =============================================
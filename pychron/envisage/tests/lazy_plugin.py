@@ -0,0 +1,145 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from envisage.api import Application, ExtensionPoint, Plugin
+from envisage.core_plugin import CorePlugin
+from traits.api import List
+
+from pychron.envisage.tasks.lazy_plugin import LazyPlugin
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+PLUGIN = '''
+from envisage.api import ExtensionPoint
+from envisage.ui.tasks.task_factory import TaskFactory
+from traits.api import List
+
+from pychron.envisage.tasks.base_task_plugin import BaseTaskPlugin
+
+
+class FixtureService(object):
+    def __init__(self, name=''):
+        self.name = name
+
+
+class FixtureTask(object):
+    def __init__(self, **kw):
+        self.traits = kw
+
+
+class FixturePlugin(BaseTaskPlugin):
+    id = 'pychron.fixture.plugin'
+    sources = ExtensionPoint(List, id='pychron.fixture.sources')
+    started = False
+
+    def start(self):
+        self.started = True
+
+    def test_fixture(self):
+        return 'Passed'
+
+    def _file_defaults_default(self):
+        return [('fixture', 'a: 1', False)]
+
+    def _service_offers_default(self):
+        return [self.service_offer_factory(protocol=FixtureService, factory=FixtureService,
+                                           properties={'name': 'fixture'})]
+
+    def _tasks_default(self):
+        return [TaskFactory(id='pychron.fixture.task', name='Fixture', factory=FixtureTask)]
+'''
+
+
+
+class FixtureApplication(Application):
+    def get_task_extensions(self, pid):
+        return []
+
+
+class HostPlugin(Plugin):
+    """
+    declares the extension points the tasks and pychron plugins provide
+    """
+    tasks = ExtensionPoint(List, id='envisage.ui.tasks.tasks')
+    file_defaults = ExtensionPoint(List, id='pychron.plugin.file_defaults')
+
+
+class SourcePlugin(Plugin):
+    """
+    contributes to an extension point offered by the lazy plugin
+    """
+    sources = List(['camera'], contributes_to='pychron.fixture.sources')
+
+
+MODULE = 'lazy_fixture_plugin'
+SERVICE = '{}.FixtureService'.format(MODULE)
+
+
+class LazyPluginTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        with open(os.path.join(self.root, '{}.py'.format(MODULE)), 'w') as wfile:
+            wfile.write(PLUGIN)
+
+        sys.path.insert(0, self.root)
+
+        self.plugin = LazyPlugin(package=MODULE, klass='FixturePlugin', id='pychron.fixture.plugin',
+                                 declared_services=[SERVICE],
+                                 declared_extension_points=['pychron.fixture.sources'],
+                                 declared_tasks=[dict(id='pychron.fixture.task', name='Fixture')])
+        self.app = FixtureApplication(id='pychron.fixture', home=self.root,
+                                      plugins=[CorePlugin(), HostPlugin(), SourcePlugin(), self.plugin])
+        self.app.start()
+
+    def tearDown(self):
+        self.app.stop()
+        sys.path.remove(self.root)
+        sys.modules.pop(MODULE, None)
+        shutil.rmtree(self.root)
+
+    def test_not_imported(self):
+        self.assertNotIn(MODULE, sys.modules)
+        self.assertIsNone(self.plugin.plugin)
+        self.assertEqual(self.plugin.name, 'Fixture Plugin')
+        self.assertEqual([t.id for t in self.app.get_extensions('envisage.ui.tasks.tasks')],
+                         ['pychron.fixture.task'])
+
+    def test_service(self):
+        service = self.app.get_service(SERVICE)
+        self.assertIn(MODULE, sys.modules)
+        self.assertEqual(service.name, 'fixture')
+        self.assertTrue(self.plugin.plugin.started)
+
+        # the plugin's own service_offers are not registered a second time
+        self.assertEqual(len(self.app.get_services(SERVICE)), 1)
+
+        # contributions that are not declared are added once the plugin is loaded
+        self.assertEqual(self.app.get_extensions('pychron.plugin.file_defaults'), [('fixture', 'a: 1', False)])
+
+    def test_extension_point(self):
+        plugin = self.plugin.load()
+        self.assertEqual(plugin.sources, ['camera'])
+
+    def test_task(self):
+        factory = self.app.get_extensions('envisage.ui.tasks.tasks')[0]
+        task = factory.create(foo=1)
+        self.assertEqual(task.traits, {'foo': 1})
+        self.assertIn(MODULE, sys.modules)
+
+    def test_startup_test(self):
+        self.assertEqual(self.plugin.test_fixture(), 'Passed')
+        with self.assertRaises(AttributeError):
+            self.plugin.foo
+
+    def test_missing_module(self):
+        plugin = LazyPlugin(package='lazy_fixture_missing', klass='FixturePlugin')
+        self.assertIsNone(plugin.load())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,7 @@ from apptools.preferences.preference_binding import bind_preference
 from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance
 
 from pychron.envisage.consoleable import Consoleable
+from pychron.experiment.automated_run.data_writer import QueuedDataWriter
 from pychron.pychron_constants import AR_AR, SIGNAL, BASELINE, WHIFF, SNIFF
 
 
@@ -59,10 +60,16 @@ class DataCollector(Consoleable):
 
     collection_kind = Enum((SNIFF, WHIFF, BASELINE, SIGNAL))
     refresh_age = False
+    incremental_age = True
+    age_tolerance = 1e-4
     _data = None
     _temp_conds = None
     _result = None
-    _queue = None
+    _writer = None
+
+    use_queued_writer = True
+    writer_flush_period = 1.0
+    writer_flush_count = 50
 
     err_message = Str
     no_intensity_threshold = 100
@@ -113,7 +120,14 @@ class DataCollector(Consoleable):
 
         self._alive = True
 
-        self._measure()
+        incremental = self._use_incremental_age()
+        if incremental:
+            self.isotope_group.set_incremental(True)
+        try:
+            self._measure()
+        finally:
+            if incremental:
+                self.isotope_group.set_incremental(False)
 
         tt = time.time() - self.starttime
         self.debug('estimated time: {:0.3f} actual time: :{:0.3f}'.format(et, tt))
@@ -134,59 +148,65 @@ class DataCollector(Consoleable):
 
         self._evt = evt = Event()
 
-        # self._queue = q = Queue()
-        # def writefunc():
-        #     writer = self.data_writer
-        #     while not q.empty() or not evt.wait(10):
-        #         dets = self.detectors
-        #         while not q.empty():
-        #             x, keys, signals = q.get()
-        #             writer(dets, x, keys, signals)
-        #
-        # # only write to file every 10 seconds and not on main thread
-        # t = Thread(target=writefunc)
-        # # t.setDaemon(True)
-        # t.start()
+        writer = None
+        if self.use_queued_writer and self.data_writer:
+            writer = QueuedDataWriter(self.data_writer,
+                                      flush_period=self.writer_flush_period,
+                                      flush_count=self.writer_flush_count)
+            writer.start()
+        self._writer = writer
 
         self.debug('measurement period (ms) = {}'.format(self.period_ms))
         period = self.period_ms * 0.001
         i = 1
 
-        while not evt.is_set():
-            result = self._check_iteration(i)
-            if not result:
-                if not self._pre_trigger_hook():
-                    break
-
-                if self.trigger:
-                    self.trigger()
-
-                evt.wait(period)
-                self.automated_run.plot_panel.counts = i
-                if not self._iter_hook(i):
+        try:
+            while not evt.is_set():
+                result = self._check_iteration(i)
+                if not result:
+                    if not self._pre_trigger_hook():
+                        break
+
+                    if self.trigger:
+                        self.trigger()
+
+                    evt.wait(period)
+                    self.automated_run.plot_panel.counts = i
+                    if not self._iter_hook(i):
+                        break
+
+                    self._post_iter_hook(i)
+                    i += 1
+                else:
+                    if result == 'cancel':
+                        self.canceled = True
+                    elif result == 'terminate':
+                        self.terminated = True
                     break
-
-                self._post_iter_hook(i)
-                i += 1
-            else:
-                if result == 'cancel':
-                    self.canceled = True
-                elif result == 'terminate':
-                    self.terminated = True
-                break
-
-        evt.set()
-        # self.debug('waiting for write to finish')
-        # t.join()
+        finally:
+            evt.set()
+            if writer:
+                # everything must be on disk before the tables are closed and post_measurement_save runs
+                self.debug('waiting for data writer to finish. queue depth={}'.format(writer.depth))
+                writer.stop()
+                self.debug('data writer {}'.format(writer.report()))
+                self._writer = None
 
         self.debug('measurement finished')
         
     def _pre_trigger_hook(self):
         return True
 
+    def _use_incremental_age(self):
+        return self.experiment_type == AR_AR and self.refresh_age and self.incremental_age
+
     def _post_iter_hook(self, i):
-        if self.experiment_type == AR_AR and self.refresh_age and not i % 5:
-            self.isotope_group.calculate_age(force=True)
+        if self.experiment_type == AR_AR and self.refresh_age:
+            if self.incremental_age:
+                # intercepts are updated from running sums so the age can be checked every count
+                self.isotope_group.update_age(self.age_tolerance)
+            elif not i % 5:
+                self.isotope_group.calculate_age(force=True)
 
     def _pre_trigger_hook(self):
         return True
@@ -252,8 +272,10 @@ class DataCollector(Consoleable):
             return data
 
     def _save_data(self, x, keys, signals):
-        # self._queue.put((x, keys, signals))
-        self.data_writer(self.detectors, x, keys, signals)
+        if self._writer:
+            self._writer.put(self.detectors, x, keys, signals)
+        else:
+            self.data_writer(self.detectors, x, keys, signals)
 
         # update arar_age
         if self.is_baseline and self.for_peak_hop:
@@ -0,0 +1,200 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import time
+from queue import Queue, Empty
+from threading import Thread
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+
+_STOP = object()
+
+
+def snapshot_detectors(dets):
+    """
+    return the (name, isotope) of each detector. the isotope of a detector changes when the magnet hops so rows
+    have to be written to the tables of the isotopes the detectors had when the data was measured
+    """
+    return [d if isinstance(d, tuple) else (d.name, d.isotope) for d in dets]
+
+
+class H5DataWriter(object):
+    """
+    write measured intensities to the tables built by ``AutomatedRunPersister.build_tables``.
+
+    calling the writer appends one row per detector and flushes, ``write`` only appends and leaves the rows in
+    the table buffers until ``flush`` is called
+    """
+
+    def __init__(self, persister, grpname):
+        self._persister = persister
+        self._grpname = grpname
+        self._tables = {}
+        self._dirty = set()
+
+    def __call__(self, dets, x, keys, signals):
+        self.write(dets, x, keys, signals)
+        self.flush()
+
+    def write(self, dets, x, keys, signals):
+        for k, isotope in snapshot_detectors(dets):
+            try:
+                if k in keys:
+                    t = self._get_table(k, isotope)
+                    nrow = t.row
+                    nrow['time'] = x
+                    nrow['value'] = signals[keys.index(k)]
+                    nrow.append()
+                    self._dirty.add(t)
+            except AttributeError as e:
+                self._persister.debug('error: {} group:{} det:{} iso:{}'.format(e, self._grpname, k, isotope))
+
+    def flush(self):
+        while self._dirty:
+            self._dirty.pop().flush()
+
+    def _get_table(self, name, isotope):
+        grpname = self._grpname
+        if grpname == 'baseline':
+            grp = '/{}'.format(grpname)
+        else:
+            grp = '/{}/{}'.format(grpname, isotope)
+
+        tag = '{}/{}'.format(grp, name)
+        t = self._tables.get(tag)
+        if t is None:
+            t = self._persister.data_manager.get_table(name, grp)
+            if t is not None:
+                self._tables[tag] = t
+        return t
+
+
+class QueuedDataWriter(Loggable):
+    """
+    write data on a background thread so the measurement loop never waits on disk io.
+
+    rows are queued by ``put`` and written by the worker in arrival order. writers with a ``write``/``flush``
+    api, e.g. ``H5DataWriter``, are flushed every ``flush_period`` seconds or ``flush_count`` rows, plain
+    callables are called once per row. ``stop`` blocks until every queued row is written and flushed.
+
+    ``put`` blocks if ``maxsize`` rows are waiting so a stalled disk cannot grow the queue without bound. the
+    detectors are queued as (name, isotope) pairs, see ``snapshot_detectors``
+    """
+
+    def __init__(self, writer, maxsize=1000, flush_period=1.0, flush_count=50, *args, **kw):
+        super(QueuedDataWriter, self).__init__(*args, **kw)
+        self._writer = writer
+        self._queue = Queue(maxsize)
+        self._thread = None
+
+        self.flush_period = flush_period
+        self.flush_count = flush_count
+
+        self.nwritten = 0
+        self.nflushes = 0
+        self.max_depth = 0
+        self.max_latency = 0
+        self.total_latency = 0
+
+    def start(self):
+        self._thread = Thread(target=self._run, name='DataWriter')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def put(self, dets, x, keys, signals):
+        q = self._queue
+        q.put((time.time(), snapshot_detectors(dets), x, keys, signals))
+        self.max_depth = max(self.max_depth, q.qsize())
+
+    def stop(self, timeout=None):
+        if self._thread is None:
+            return True
+
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        alive = self._thread.is_alive()
+        if alive:
+            self.warning('data writer did not finish in {}s. {} rows pending'.format(timeout, self._queue.qsize()))
+        else:
+            self._thread = None
+        return not alive
+
+    @property
+    def depth(self):
+        return self._queue.qsize()
+
+    def report(self):
+        n = self.nwritten
+        return {'written': n,
+                'flushes': self.nflushes,
+                'depth': self.depth,
+                'max_depth': self.max_depth,
+                'max_latency': self.max_latency,
+                'mean_latency': self.total_latency / n if n else 0}
+
+    # private
+    def _run(self):
+        writer = self._writer
+        write = getattr(writer, 'write', writer)
+        flush = getattr(writer, 'flush', None)
+
+        q = self._queue
+        pending = 0
+        lastflush = time.time()
+        while 1:
+            timeout = max(0, self.flush_period - (time.time() - lastflush))
+            try:
+                item = q.get(timeout=timeout)
+            except Empty:
+                item = None
+
+            if item is _STOP:
+                break
+
+            if item is not None:
+                st, dets, x, keys, signals = item
+                try:
+                    write(dets, x, keys, signals)
+                except BaseException as e:
+                    self.debug('data writer failed. {}'.format(e))
+
+                lat = time.time() - st
+                self.max_latency = max(self.max_latency, lat)
+                self.total_latency += lat
+                self.nwritten += 1
+                pending += 1
+
+            if pending and (pending >= self.flush_count or time.time() - lastflush >= self.flush_period):
+                self._flush(flush)
+                pending = 0
+                lastflush = time.time()
+            elif not pending:
+                lastflush = time.time()
+
+        self._flush(flush)
+
+    def _flush(self, flush):
+        if flush is not None:
+            try:
+                flush()
+                self.nflushes += 1
+            except BaseException as e:
+                self.debug('data writer flush failed. {}'.format(e))
+
+# ============= EOF =============================================
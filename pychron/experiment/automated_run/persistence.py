@@ -28,6 +28,7 @@ from pychron.core.helpers.filetools import subdirize
 from pychron.core.helpers.strtools import to_bool
 from pychron.core.ui.preference_binding import set_preference
 from pychron.database.adapters.local_lab_adapter import LocalLabAdapter
+from pychron.experiment.automated_run.data_writer import H5DataWriter
 from pychron.experiment.automated_run.hop_util import parse_hops
 from pychron.experiment.automated_run.mass_spec_persistence_spec import MassSpecPersistenceSpec
 from pychron.loggable import Loggable
@@ -277,45 +278,12 @@ class AutomatedRunPersister(BasePersister):
     def get_data_writer(self, grpname):
         """
         grpname should be a str such as "signal", "baseline",etc
-        return a closure for writing the data
+        return a writer for the data. see ``H5DataWriter``
 
         :param grpname: str
-        :return: function
+        :return: H5DataWriter
         """
-        tables = {}
-
-        def write_data(dets, x, keys, signals):
-            # todo: test whether saving data to h5 in real time is expansive
-
-            # disable H5 data writer
-            # self.unique_warning('NOT Writing data to H5 in real time')
-            # return
-
-            dm = self.data_manager
-            for det in dets:
-                k = det.name
-                try:
-                    if k in keys:
-                        if grpname == 'baseline':
-                            grp = '/{}'.format(grpname)
-                        else:
-                            grp = '/{}/{}'.format(grpname, det.isotope)
-
-                        tag = '{}/{}'.format(grp, k)
-                        if tag in tables:
-                            t = tables['tag']
-                        else:
-                            t = dm.get_table(k, grp)
-
-                        nrow = t.row
-                        nrow['time'] = x
-                        nrow['value'] = signals[keys.index(k)]
-                        nrow.append()
-                        t.flush()
-                except AttributeError as e:
-                    self.debug('error: {} group:{} det:{} iso:{}'.format(e, grpname, k, det.isotope))
-
-        return write_data
+        return H5DataWriter(self, grpname)
 
     def build_tables(self, grpname, detectors, n):
         """
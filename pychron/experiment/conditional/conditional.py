@@ -18,6 +18,8 @@
 
 import os
 import pprint
+import time
+from collections import OrderedDict
 
 from traits.api import Str, Either, Int, Callable, Bool, Float, Enum, List
 # ============= standard library imports ========================
@@ -33,6 +35,9 @@ from pychron.experiment.utilities.conditionals import RUN, QUEUE, SYSTEM
 from pychron.loggable import Loggable
 from pychron.paths import paths
 
+# compiled variants of an evaluated teststr kept per conditional. interpolated values make every check a new variant
+MAX_CODES = 32
+
 
 def dictgetter(d, attrs, default=None):
     if not isinstance(attrs, tuple):
@@ -218,7 +223,18 @@ class AutomatedRunConditional(BaseConditional):
 
     _teststr = None
     _ctx = None
-    value_context = None
+
+    # compiled form of teststr/mapper. rebuilt only when either changes
+    _compiled_key = None
+    _terms = None
+    _use_std = False
+    _mapper_code = None
+    _codes = None
+
+    # timing counters. plain attributes so updating them does not fire trait notifications
+    ncalls = 0
+    total_time = 0
+    max_time = 0
 
     # def __init__(self, attr, teststr,
     # start_count=0,
@@ -261,6 +277,59 @@ class AutomatedRunConditional(BaseConditional):
         hash_id = self._hash_id()
         return {'teststr': self._teststr, 'context': self.value_context, 'hash_id': hash_id}
 
+    @property
+    def value_context(self):
+        if self._ctx is not None:
+            return pprint.pformat(self._ctx, width=1)
+
+    @property
+    def required_attrs(self):
+        """
+        the context keys this conditional fetches on every check
+        """
+        return [t[1] for t in self.compile()]
+
+    @property
+    def mean_time(self):
+        n = self.ncalls
+        return self.total_time / n if n else 0
+
+    def reset_timing(self):
+        self.ncalls = 0
+        self.total_time = 0
+        self.max_time = 0
+
+    def compile(self):
+        """
+        parse teststr and mapper once and cache the result until either changes.
+
+        returns a list of (teststr, key, func, interpolate, operator) terms
+        """
+        key = (self.teststr, self.mapper)
+        if self._compiled_key != key:
+            teststr = self.teststr
+            terms = []
+            for ti, oper in tokenize(teststr):
+                ts, attr, func = get_teststr_attr_func(ti)
+
+                attr = attr.replace('(', '_').replace(')', '_')
+                ts = ts.replace('(', '_').replace(')', '_')
+                terms.append((ts, attr, func, bool(INTERPOLATE_REGEX.search(ts)), oper))
+
+            mapper_code = None
+            if self.mapper:
+                m = MAPPER_KEY_REGEX.search(self.mapper)
+                if m:
+                    mapper_code = m.group(0), compile(self.mapper, '<mapper>', 'eval')
+
+            self._terms = terms
+            self._use_std = bool(STD_REGEX.match(teststr))
+            self._mapper_code = mapper_code
+            self._codes = OrderedDict()
+            self._compiled_key = key
+
+        return self._terms
+
     def _should_check(self, run, data, cnt):
         if self.analysis_types:
             # check if checking should be done on this run based on analysis_type
@@ -290,18 +359,39 @@ class AutomatedRunConditional(BaseConditional):
         evaluate the teststr with the context
 
         """
+        st = time.perf_counter()
+        try:
+            return self._evaluate(run, data, verbose)
+        finally:
+            et = time.perf_counter() - st
+            self.ncalls += 1
+            self.total_time += et
+            if et > self.max_time:
+                self.max_time = et
+
+    def _evaluate(self, run, data, verbose):
         teststr, ctx = self._make_context(run, data)
         self._teststr, self._ctx = teststr, ctx
 
-        self.value_context = vc = pprint.pformat(ctx, width=1)
-
         self.debug('testing {}'.format(teststr))
         if verbose:
             self.debug('attribute context {}'.format(pprint.pformat(self._attr_dict(), width=1)))
-        msg = 'evaluate ot="{}" t="{}", ctx="{}"'.format(self.teststr, teststr, vc)
+        msg = 'evaluate ot="{}" t="{}", ctx="{}"'.format(self.teststr, teststr, ctx)
         self.debug(msg)
         if teststr and ctx:
-            if eval(teststr, ctx):
+            # terms whose value is None are dropped so the evaluated string can vary between checks.
+            # keep one code object per variant, least recently used first
+            codes = self._codes
+            code = codes.get(teststr)
+            if code is None:
+                code = codes[teststr] = compile(teststr, '<conditional>', 'eval')
+                if len(codes) > MAX_CODES:
+                    codes.popitem(last=False)
+            else:
+                codes.move_to_end(teststr)
+
+            # eval adds __builtins__ to its globals, pass a copy so ctx only holds the values
+            if eval(code, dict(ctx)):
                 self.trips += 1
                 self.debug('condition {} is true trips={}/{}'.format(teststr, self.trips,
                                                                      self.ntrips))
@@ -314,22 +404,21 @@ class AutomatedRunConditional(BaseConditional):
                 self.trips = 0
 
     def _make_context(self, obj, data):
-        teststr = self.teststr
+        terms = self.compile()
+        use_std = self._use_std
+        window = self.window
+
         ctx = {}
         tt = []
-        for ti, oper in tokenize(teststr):
-            ts, attr, func = get_teststr_attr_func(ti)
-
-            attr = attr.replace('(', '_').replace(')', '_')
-            ts = ts.replace('(', '_').replace(')', '_')
-
-            v = func(obj, data, self.window)
+        for ts, attr, func, interpolate, oper in terms:
+            v = func(obj, data, window)
             if v is not None:
-                vv = std_dev(v) if STD_REGEX.match(teststr) else nominal_value(v)
+                vv = std_dev(v) if use_std else nominal_value(v)
                 vv = self._map_value(vv)
                 ctx[attr] = vv
 
-                ts = self._interpolate_teststr(ts, obj, data)
+                if interpolate:
+                    ts = self._interpolate_teststr(ts, obj, data)
                 tt.append(ts)
                 if oper:
                     tt.append(oper)
@@ -338,10 +427,10 @@ class AutomatedRunConditional(BaseConditional):
 
     def _map_value(self, vv):
         if self.mapper:
-            m = MAPPER_KEY_REGEX.search(self.mapper)
-            if m:
-                key = m.group(0)
-                vv = eval(self.mapper, {key: vv})
+            self.compile()
+            if self._mapper_code:
+                key, code = self._mapper_code
+                vv = eval(code, {key: vv})
         return vv
 
     def _interpolate_teststr(self, ts, obj, data):
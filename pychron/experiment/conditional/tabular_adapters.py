@@ -62,12 +62,25 @@ class ConditionalsAdapter(BaseConditionalsAdapter):
                ('Start', 'start_count'),
                ('Frequency', 'frequency'),
                ('Check', 'teststr'),
+               ('Calls', 'ncalls'),
+               ('Mean (ms)', 'mean_time'),
+               ('Max (ms)', 'max_time'),
                ('Location', 'location')]
 
     attr_width = Int(75)
     teststr_width = Int(175)
     start_width = Int(50)
     frequency_width = Int(75)
+    ncalls_width = Int(50)
+
+    mean_time_text = Property
+    max_time_text = Property
+
+    def _get_mean_time_text(self):
+        return '{:0.3f}'.format(self.item.mean_time * 1000)
+
+    def _get_max_time_text(self):
+        return '{:0.3f}'.format(self.item.max_time * 1000)
 
 
 class EPRConditionalsAdapter(PRConditionalsAdapter):
@@ -79,8 +79,10 @@ def get_teststr_attr_func(token):
 
 # wrappers
 def wrapper(fstr, token, ai):
+    code = compile(fstr, '<conditional>', 'eval')
+
     def func(obj, data, window):
-        return eval(fstr, {'attr': ai,
+        return eval(code, {'attr': ai,
                            'aa': obj.isotope_group,
                            'obj': obj,
                            'data': data, 'window': window})
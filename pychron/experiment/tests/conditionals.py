@@ -3,7 +3,7 @@ import unittest
 
 from numpy import linspace
 
-from pychron.experiment.conditional.conditional import conditional_from_dict, tokenize
+from pychron.experiment.conditional.conditional import conditional_from_dict, tokenize, MAX_CODES
 from pychron.processing.arar_age import ArArAge
 from pychron.processing.isotope import Isotope
 
@@ -299,6 +299,51 @@ class ConditionalsTestCase(unittest.TestCase):
         d = {'check': 'L2(CDD).deflection==2000', 'attr': 'CDD'}
         self._test(d)
 
+    def test_required_attrs(self):
+        c = conditional_from_dict({'check': 'age>0.1 and Ar40.std<100'}, 'TerminationConditional')
+        self.assertListEqual(c.required_attrs, ['age', 'Ar40'])
+
+    def test_compile_once(self):
+        c = conditional_from_dict({'check': 'age>0.1 and Ar40<100'}, 'TerminationConditional')
+        terms = c.compile()
+        for i in range(3):
+            self.assertTrue(c.check(self.arun, ([], []), 1000))
+        self.assertIs(c.compile(), terms)
+        self.assertEqual(len(c._codes), 1)
+
+    def test_interpolated_codes_bounded(self):
+        c = conditional_from_dict({'check': 'age>$limit'}, 'TerminationConditional')
+        for i in range(MAX_CODES * 2):
+            self.arun.get_interpolated_value = lambda v, i=i: i * 0.1
+            c.check(self.arun, ([], []), 1000)
+        self.assertEqual(len(c._codes), MAX_CODES)
+
+    def test_recompile(self):
+        c = conditional_from_dict({'check': 'age>0.1'}, 'TerminationConditional')
+        self.assertTrue(c.check(self.arun, ([], []), 1000))
+        c.teststr = 'age<0.1'
+        self.assertFalse(c.check(self.arun, ([], []), 1000))
+
+    def test_timing(self):
+        c = conditional_from_dict({'check': 'age>0.1'}, 'TerminationConditional')
+        c.check(self.arun, ([], []), 1000)
+        c.check(self.arun, ([], []), 1000)
+        # skipped checks are not counted
+        c.check(self.arun, ([], []), 1)
+        self.assertEqual(c.ncalls, 2)
+        self.assertGreater(c.mean_time, 0)
+        self.assertGreaterEqual(c.max_time, c.mean_time)
+
+        c.reset_timing()
+        self.assertEqual(c.ncalls, 0)
+        self.assertEqual(c.mean_time, 0)
+
+    def test_value_context(self):
+        c = conditional_from_dict({'check': 'age>0.1'}, 'TerminationConditional')
+        self.assertIsNone(c.value_context)
+        c.check(self.arun, ([], []), 1000)
+        self.assertEqual(c.result_dict()['context'], "{'age': 10}")
+
     def _test_between(self, l, h):
         self.arun.isotope_group.isotopes['Ar40'].value = 3.4
         d = {'check': 'between(Ar40,{},{})'.format(l, h), 'attr': 'Ar40'}
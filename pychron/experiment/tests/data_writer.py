@@ -0,0 +1,191 @@
+import time
+import unittest
+from threading import Event
+
+from pychron.experiment.automated_run.data_writer import QueuedDataWriter, H5DataWriter
+
+
+class Detector(object):
+    def __init__(self, name, isotope):
+        self.name = name
+        self.isotope = isotope
+
+
+class Row(dict):
+    def __init__(self, table):
+        super(Row, self).__init__()
+        self._table = table
+
+    def append(self):
+        self._table.buffer.append((self['time'], self['value']))
+
+
+class Table(object):
+    def __init__(self):
+        self.buffer = []
+        self.rows = []
+        self.nflushes = 0
+
+    @property
+    def row(self):
+        return Row(self)
+
+    def flush(self):
+        self.rows.extend(self.buffer)
+        self.buffer = []
+        self.nflushes += 1
+
+
+class DataManager(object):
+    def __init__(self):
+        self.tables = {}
+        self.lookups = 0
+
+    def get_table(self, name, grp):
+        self.lookups += 1
+        return self.tables.setdefault('{}/{}'.format(grp, name), Table())
+
+
+class Persister(object):
+    def __init__(self):
+        self.data_manager = DataManager()
+
+    def debug(self, msg):
+        pass
+
+
+class SlowWriter(object):
+    def __init__(self, delay=0):
+        self.rows = []
+        self.flushed = 0
+        self.delay = delay
+
+    def write(self, dets, x, keys, signals):
+        time.sleep(self.delay)
+        self.rows.append(x)
+
+    def flush(self):
+        self.flushed = len(self.rows)
+
+
+class GatedWriter(object):
+    """
+    holds every write until ``gate`` is set
+    """
+
+    def __init__(self, writer):
+        self.gate = Event()
+        self._writer = writer
+
+    def write(self, *args):
+        self.gate.wait(1)
+        self._writer.write(*args)
+
+    def flush(self):
+        self._writer.flush()
+
+
+class DataWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dets = [Detector('H1', 'Ar40'), Detector('CDD', 'Ar36')]
+        self.keys = ['H1', 'CDD']
+
+    def test_h5_writer(self):
+        p = Persister()
+        w = H5DataWriter(p, 'signal')
+        for i in range(10):
+            w(self.dets, i, self.keys, [i * 10, i * 0.1])
+
+        t = p.data_manager.tables['/signal/Ar40/H1']
+        self.assertEqual(len(t.rows), 10)
+        self.assertEqual(t.rows[3], (3, 30))
+        self.assertEqual(p.data_manager.lookups, 2)
+
+    def test_h5_writer_batch(self):
+        p = Persister()
+        w = H5DataWriter(p, 'baseline')
+        for i in range(10):
+            w.write(self.dets, i, self.keys, [i, i])
+
+        t = p.data_manager.tables['/baseline/CDD']
+        self.assertEqual(t.nflushes, 0)
+        w.flush()
+        self.assertEqual(len(t.rows), 10)
+        self.assertEqual(t.nflushes, 1)
+
+    def test_queued_writer(self):
+        p = Persister()
+        w = QueuedDataWriter(H5DataWriter(p, 'signal'), flush_count=4)
+        w.start()
+        for i in range(10):
+            w.put(self.dets, i, self.keys, [i, i])
+        self.assertTrue(w.stop(1))
+
+        t = p.data_manager.tables['/signal/Ar36/CDD']
+        self.assertEqual([r[0] for r in t.rows], list(range(10)))
+        self.assertLessEqual(t.nflushes, 4)
+        self.assertEqual(w.report()['written'], 10)
+        self.assertEqual(w.report()['depth'], 0)
+
+    def test_queued_writer_peak_hop(self):
+        p = Persister()
+        writer = GatedWriter(H5DataWriter(p, 'signal'))
+        w = QueuedDataWriter(writer)
+        w.start()
+        w.put(self.dets, 0, self.keys, [1, 1])
+
+        # hop the magnet before the first row is written
+        self.dets[0].isotope = 'Ar39'
+        w.put(self.dets, 1, self.keys, [2, 2])
+        writer.gate.set()
+        self.assertTrue(w.stop(1))
+
+        tables = p.data_manager.tables
+        self.assertEqual(tables['/signal/Ar40/H1'].rows, [(0, 1)])
+        self.assertEqual(tables['/signal/Ar39/H1'].rows, [(1, 2)])
+
+    def test_put_does_not_wait(self):
+        writer = SlowWriter(0.01)
+        w = QueuedDataWriter(writer)
+        w.start()
+        st = time.time()
+        for i in range(20):
+            w.put(self.dets, i, self.keys, [i, i])
+        self.assertLess(time.time() - st, 0.1)
+
+        w.stop()
+        self.assertEqual(writer.rows, list(range(20)))
+        self.assertEqual(writer.flushed, 20)
+        self.assertGreater(w.report()['max_latency'], 0)
+
+    def test_flush_period(self):
+        writer = SlowWriter()
+        w = QueuedDataWriter(writer, flush_period=0.05, flush_count=1000)
+        w.start()
+        w.put(self.dets, 1, self.keys, [1, 1])
+        time.sleep(0.2)
+        self.assertEqual(writer.flushed, 1)
+        w.stop()
+
+    def test_callable(self):
+        rows = []
+        w = QueuedDataWriter(lambda dets, x, keys, signals: rows.append(x))
+        w.start()
+        for i in range(5):
+            w.put(self.dets, i, self.keys, [i, i])
+        w.stop()
+        self.assertEqual(rows, list(range(5)))
+
+    def test_bounded(self):
+        writer = SlowWriter(0.02)
+        w = QueuedDataWriter(writer, maxsize=2)
+        w.start()
+        for i in range(6):
+            w.put(self.dets, i, self.keys, [i, i])
+        self.assertLessEqual(w.report()['max_depth'], 2)
+        w.stop()
+        self.assertEqual(len(writer.rows), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,7 @@ import binascii
 import os
 import pickle
 import time
+from concurrent.futures import ThreadPoolExecutor
 from operator import itemgetter
 from pickle import PickleError
 from string import digits
@@ -33,6 +34,7 @@ from pychron.extraction_line import VERBOSE_DEBUG, VERBOSE
 from pychron.extraction_line.pipettes.tracking import PipetteTracker
 from pychron.globals import globalv
 from pychron.hardware.core.checksum_helper import computeCRC
+from pychron.hardware.core.communicators.scheduler import status_polling
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.hardware.switch import Switch, ManualSwitch
 from pychron.hardware.valve import HardwareValve
@@ -508,44 +510,87 @@ class SwitchManager(Manager):
     def load_hardware_states(self, force=False, verbose=False):
         """
         """
-        states = []
+        with status_polling():
+            self._load_hardware_states(force, verbose)
+
+    def _load_hardware_states(self, force, verbose):
+        """
+        query the switches grouped by the device that reports their state. every device is queried concurrently,
+        in as few round trips as it allows, and only the switches whose state changed are refreshed
+        """
         words = {}
+        queries = {}
         for k, v in self.switches.items():
-            a = (k, v.address, v.state)
             if v.use_state_word:
-                if v.actuator not in words:
-                    words[v.actuator] = [a]
-                else:
-                    words[v.actuator].append(a)
+                words.setdefault(v.actuator, []).append((k, v.address, v.state))
 
             elif v.query_state or force:
-                ostate = v.state
-                s = v.get_hardware_indicator_state(verbose=verbose)
-                if not isinstance(s, bool):
-                    s = None
-
-                if ostate != s:
-                    states.append((k, s, False))
-                    
-        for actuator, items in words.items():
-            stateword = actuator.get_state_word()
-            if stateword:
-                for k, address, ostate in items:
-                    try:
-                        s = stateword[address]
-                        if s != ostate:
-                            states.append((k, s, False))
-                        self.switches[k].set_state(s)
-                    except KeyError:
-                        self.warning('Failed getting state from valve word={}, '
-                                     'valve={}({})'.format(stateword, k, address))
-            else:
-                self.warning('Actuator failed to return state word')
+                dev, address = None, None
+                if isinstance(v, Switch):
+                    dev, address = v.get_state_query()
+                queries.setdefault(dev, []).append((k, v, address))
+
+        jobs = [(self._load_state_word, actuator, items) for actuator, items in words.items()]
+        jobs.extend((self._load_indicator_states, dev, items) for dev, items in queries.items())
+
+        if len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [executor.submit(self._status_job, func, dev, items, verbose) for func, dev, items in jobs]
+                results = [f.result() for f in futures]
+        else:
+            results = [func(dev, items, verbose) for func, dev, items in jobs]
 
+        states = [si for r in results for si in r]
         if states:
             self.refresh_state = states
             self.refresh_canvas_needed = True
 
+    def _status_job(self, func, *args):
+        # the priority set by status_polling is per thread
+        with status_polling():
+            return func(*args)
+
+    def _load_indicator_states(self, dev, items, verbose):
+        """
+        read the indicator states of ``items`` from ``dev`` in one call if the device supports it,
+        otherwise one switch at a time. switches missing from the bulk reading are read one at a time
+        """
+        bulk = None
+        if dev is not None and len(items) > 1:
+            func = getattr(dev, 'get_indicator_states', None)
+            if callable(func):
+                bulk = func([address for _, _, address in items], verbose=verbose)
+
+        states = []
+        for k, v, address in items:
+            ostate = v.state
+            if bulk is not None and bulk.get(address) is not None:
+                result = v.set_indicator_state(bulk[address])
+            else:
+                result = v.get_hardware_indicator_state(verbose=verbose)
+
+            s = v.state if isinstance(result, bool) else None
+            if ostate != s:
+                states.append((k, s, False))
+        return states
+
+    def _load_state_word(self, actuator, items, verbose):
+        states = []
+        stateword = actuator.get_state_word()
+        if stateword:
+            for k, address, ostate in items:
+                try:
+                    s = stateword[address]
+                    if s != ostate:
+                        states.append((k, s, False))
+                    self.switches[k].set_state(s)
+                except KeyError:
+                    self.warning('Failed getting state from valve word={}, '
+                                 'valve={}({})'.format(stateword, k, address))
+        else:
+            self.warning('Actuator failed to return state word')
+        return states
+
     def load_hardware_states_old(self, force=False, verbose=False):
         self._verbose('load hardware states')
         # update = False
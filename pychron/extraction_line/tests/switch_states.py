@@ -0,0 +1,134 @@
+import time
+import unittest
+
+from pychron.extraction_line.switch_manager import SwitchManager
+from pychron.globals import globalv
+from pychron.hardware.switch import Switch
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+LATENCY = 0.05
+
+
+class Actuator(object):
+    """
+    reads one channel per round trip
+    """
+
+    def __init__(self, states):
+        self.states = states
+        self.nqueries = 0
+
+    def get_indicator_state(self, address, *args, **kw):
+        time.sleep(LATENCY)
+        self.nqueries += 1
+        return self.states[address]
+
+    def get_state_word(self):
+        time.sleep(LATENCY)
+        self.nqueries += 1
+        return dict(self.states)
+
+
+class BulkActuator(Actuator):
+    """
+    reads every channel in one round trip
+    """
+
+    def get_indicator_states(self, addresses, verbose=False):
+        word = self.get_state_word()
+        return {a: word.get(a) for a in addresses}
+
+
+class PartialBulkActuator(BulkActuator):
+    """
+    the state word is missing ``missing``
+    """
+    missing = None
+
+    def get_indicator_states(self, addresses, verbose=False):
+        word = super(PartialBulkActuator, self).get_indicator_states(addresses, verbose=verbose)
+        word.pop(self.missing, None)
+        return word
+
+
+class SwitchStatesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.manager = SwitchManager()
+        self.refreshes = []
+        self.manager.on_trait_change(lambda new: self.refreshes.append(new), 'refresh_state')
+
+    def _add(self, actuator, n, prefix, **kw):
+        for i in range(n):
+            address = '{}{}'.format(prefix, i)
+            actuator.states[address] = False
+            self.manager.switches[address] = Switch(address, address=address, actuator=actuator, **kw)
+
+    def test_bulk_round_trip(self):
+        a = BulkActuator({})
+        self._add(a, 20, 'A')
+        self.manager.load_hardware_states()
+        self.assertEqual(a.nqueries, 1)
+
+    def test_fallback(self):
+        a = Actuator({})
+        self._add(a, 3, 'A')
+        self.manager.load_hardware_states()
+        self.assertEqual(a.nqueries, 3)
+
+    def test_missing_from_bulk(self):
+        a = PartialBulkActuator({})
+        self._add(a, 3, 'A')
+        a.states['A1'] = True
+        a.missing = 'A1'
+        self.manager.load_hardware_states()
+
+        # the missing switch is read on its own
+        self.assertEqual(a.nqueries, 2)
+        self.assertTrue(self.manager.switches['A1'].state)
+        self.assertEqual(self.refreshes, [[('A1', True, False)]])
+
+    def test_concurrent(self):
+        actuators = [BulkActuator({}) for i in range(4)]
+        for i, a in enumerate(actuators):
+            self._add(a, 5, '{}-'.format(i))
+
+        st = time.time()
+        self.manager.load_hardware_states()
+        self.assertLess(time.time() - st, 3 * LATENCY)
+        self.assertTrue(all(a.nqueries == 1 for a in actuators))
+
+    def test_only_changed(self):
+        a = BulkActuator({})
+        self._add(a, 5, 'A')
+        self.manager.load_hardware_states()
+        self.assertEqual(self.refreshes, [])
+
+        a.states['A2'] = True
+        self.manager.load_hardware_states()
+        self.assertEqual(self.refreshes, [[('A2', True, False)]])
+        self.assertTrue(self.manager.switches['A2'].state)
+
+        self.manager.load_hardware_states()
+        self.assertEqual(len(self.refreshes), 1)
+
+    def test_invert(self):
+        a = BulkActuator({})
+        self._add(a, 2, 'A', state_invert=True)
+        self.manager.load_hardware_states()
+        self.assertTrue(self.manager.switches['A0'].state)
+        self.assertEqual(len(self.refreshes), 1)
+        self.assertEqual(sorted(self.refreshes[0]), [('A0', True, False), ('A1', True, False)])
+
+    def test_state_word(self):
+        a = Actuator({})
+        self._add(a, 4, 'A', use_state_word=True)
+        a.states['A1'] = True
+        self.manager.load_hardware_states()
+        self.assertEqual(a.nqueries, 1)
+        self.assertEqual(self.refreshes, [[('A1', True, False)]])
+
+
+if __name__ == '__main__':
+    unittest.main()
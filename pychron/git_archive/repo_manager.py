@@ -682,11 +682,13 @@ class GitRepoManager(Loggable):
         commit_view = CommitView(model=h)
         return commit_view
 
-    def pull(self, branch='master', remote='origin', handled=True, use_progress=True, use_auto_pull=False):
+    def pull(self, branch='master', remote='origin', handled=True, use_progress=True, use_auto_pull=False,
+             fetch=True, timeout=None):
         """
             fetch and merge
 
             if use_auto_pull is False ask user if they want to accept the available updates
+            if fetch is False only merge the previously fetched changes
         """
         self.debug('pulling {} from {}'.format(branch, remote))
 
@@ -704,13 +706,14 @@ class GitRepoManager(Loggable):
                                      show_percent=False,
                                      title='Pull Repository {}'.format(self.name), close_at_end=False)
                 prog.change_message('Fetching branch:"{}" from "{}"'.format(branch, remote))
-            try:
-                self.fetch(remote)
-            except GitCommandError as e:
-                self.debug(e)
-                if not handled:
-                    raise e
-            self.debug('fetch complete')
+            if fetch:
+                try:
+                    self.fetch(remote, timeout=timeout)
+                except GitCommandError as e:
+                    self.debug(e)
+                    if not handled:
+                        raise e
+                self.debug('fetch complete')
 
             def merge():
                 try:
@@ -858,9 +861,15 @@ You like to delete them and try again?'''.format(clean)):
 
         return True
 
-    def fetch(self, remote='origin'):
+    def fetch(self, remote='origin', timeout=None):
+        """
+        timeout: kill the fetch if it takes longer than timeout seconds
+        """
         if self._repo:
-            return self._git_command(lambda: self._repo.git.fetch(remote), 'GitRepoManager.fetch')
+            kw = {}
+            if timeout:
+                kw['kill_after_timeout'] = timeout
+            return self._git_command(lambda: self._repo.git.fetch(remote, **kw), 'GitRepoManager.fetch')
             # return self._repo.git.fetch(remote)
 
     def ahead_behind(self, remote='origin'):
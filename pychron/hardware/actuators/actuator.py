@@ -96,4 +96,11 @@ class Actuator(AbstractDevice):
         if self._cdevice is not None:
             return self._cdevice.get_channel_state(*args, **kw)
 
+    @simulate
+    def get_indicator_states(self, *args, **kw):
+        if self._cdevice is not None:
+            func = getattr(self._cdevice, 'get_indicator_states', None)
+            if func is not None:
+                return func(*args, **kw)
+
 # ============= EOF ====================================
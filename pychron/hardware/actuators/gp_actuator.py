@@ -41,6 +41,15 @@ class GPActuator(CoreDevice):
     def get_state_word(self):
         return
 
+    def get_indicator_states(self, addresses, verbose=False):
+        """
+        return the indicator states of ``addresses`` as a dict of address: state, read in as few round trips as the
+        device allows.
+
+        return None if the device cannot read several channels at once. the states are then queried one at a time
+        """
+        return
+
     def get_channel_state(self, *args, **kw):
         """
         """
@@ -77,6 +77,14 @@ class WiscArGPActuator(ASCIIGPActuator, ClientMixin):
             
             return worddict
 
+    def get_indicator_states(self, addresses, verbose=False):
+        """
+        read every valve with one get,valve,all
+        """
+        word = self.get_state_word()
+        if word:
+            return {a: word.get(a) for a in addresses}
+
     def get_channel_state(self, obj, *args, **kw):
         cmd = get_channel(get_switch_address(obj))
         resp = self.ask(cmd, verbose=True)
@@ -0,0 +1,256 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import select
+import socket
+import time
+from threading import Condition, Lock, RLock
+
+# ============= local library imports  ==========================
+
+_POOLS = {}
+_POOLS_LOCK = Lock()
+
+
+def get_pool(key, factory, size=1, **kw):
+    """
+    return the pool shared by every communicator connecting to ``key``, e.g. ('TCP', host, port, message_frame,
+    timeout). the key must include every setting ``factory`` applies to a connection.
+
+    the pool is created with ``factory`` and ``size`` the first time ``key`` is requested
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = ConnectionPool(factory, size=size, **kw)
+        return pool
+
+
+def close_pools():
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.close()
+        _POOLS.clear()
+
+
+def is_healthy(handler):
+    """
+    an idle connection is healthy if the peer has not closed it and there is no unread data waiting on it.
+    unread data would be returned as the response to the next command
+    """
+    sock = handler.sock
+    if sock is None:
+        return False
+
+    if sock.type != socket.SOCK_STREAM:
+        return True
+
+    try:
+        r, _, _ = select.select([sock], [], [], 0)
+    except (ValueError, socket.error):
+        return False
+
+    return not r
+
+
+class ConnectionPool(object):
+    """
+    persistent connections to one address.
+
+    ``acquire`` returns an idle connection that passes a health check, opens a new one if fewer than ``size``
+    are open, or waits for one to be released. a connection released as bad is closed and discarded.
+
+    after a failed connect no new connection is attempted for ``backoff`` seconds. the backoff doubles after each
+    consecutive failure up to ``max_backoff`` and is reset by a successful connect
+    """
+
+    def __init__(self, factory, size=1, min_backoff=0.1, max_backoff=5):
+        self._factory = factory
+        self.size = size
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+
+        self._cond = Condition(Lock())
+        self._idle = []
+        self._nopen = 0
+        self._backoff = 0
+        self._next_connect = 0
+
+        self.nconnects = 0
+        self.nfailures = 0
+        self.nreuses = 0
+        self.nstale = 0
+
+    def acquire(self, timeout=None):
+        """
+        return a connection or None if a connection could not be made within ``timeout`` seconds
+        """
+        st = time.time()
+        with self._cond:
+            while 1:
+                while self._idle:
+                    h = self._idle.pop()
+                    if is_healthy(h):
+                        self.nreuses += 1
+                        return h
+
+                    self.nstale += 1
+                    self._discard(h)
+
+                if self._nopen < self.size:
+                    if time.time() < self._next_connect:
+                        return
+
+                    # reserve the slot so other threads do not exceed size while we connect
+                    self._nopen += 1
+                    break
+
+                remaining = None
+                if timeout is not None:
+                    remaining = timeout - (time.time() - st)
+                    if remaining <= 0:
+                        return
+
+                self._cond.wait(remaining)
+
+        try:
+            h = self._factory()
+        except socket.error:
+            h = None
+
+        with self._cond:
+            if h is None:
+                self._nopen -= 1
+                self.nfailures += 1
+                self._backoff = min(self.max_backoff, max(self.min_backoff, self._backoff * 2))
+                self._next_connect = time.time() + self._backoff
+                self._cond.notify()
+            else:
+                self.nconnects += 1
+                self._backoff = 0
+                self._next_connect = 0
+        return h
+
+    def release(self, handler, ok=True):
+        with self._cond:
+            if ok:
+                self._idle.append(handler)
+            else:
+                self._discard(handler)
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            while self._idle:
+                self._discard(self._idle.pop())
+
+    def report(self):
+        return {'open': self._nopen,
+                'idle': len(self._idle),
+                'connects': self.nconnects,
+                'failures': self.nfailures,
+                'reuses': self.nreuses,
+                'stale': self.nstale}
+
+    def _discard(self, handler):
+        self._nopen -= 1
+        try:
+            handler.end()
+        except socket.error:
+            pass
+
+
+class Pipeline(object):
+    """
+    send commands on one connection without waiting for the previous response.
+
+    responses are matched to commands by order so the device must answer every command, in the order received,
+    with a response ending in ``terminator``. if a response is not received the stream can no longer be matched
+    to the outstanding commands. the pipeline is marked broken and every waiting caller gets None
+    """
+
+    def __init__(self, handler, terminator, datasize=2 ** 12):
+        self.handler = handler
+        self.terminator = terminator.encode('utf-8')
+        self.datasize = datasize
+        self.broken = False
+
+        self._send_lock = RLock()
+        self._cond = Condition(Lock())
+        self._next_ticket = 0
+        self._serving = 0
+        self._buf = b''
+
+    @property
+    def outstanding(self):
+        return self._next_ticket - self._serving
+
+    def ask(self, cmd, timeout=None):
+        with self._send_lock:
+            if self.broken:
+                return
+            try:
+                self.handler.send_packet(cmd)
+            except socket.error:
+                self._break()
+                return
+
+            ticket = self._next_ticket
+            self._next_ticket += 1
+
+        with self._cond:
+            while self._serving != ticket and not self.broken:
+                self._cond.wait(timeout)
+
+            if self.broken:
+                return
+
+            try:
+                return self._read(timeout)
+            except socket.error:
+                self.broken = True
+            finally:
+                self._serving += 1
+                self._cond.notify_all()
+
+    def close(self):
+        """
+        fail every waiting caller. the connection is closed by the owner of the pipeline
+        """
+        self._break()
+
+    def _break(self):
+        with self._cond:
+            self.broken = True
+            self._cond.notify_all()
+
+    def _read(self, timeout):
+        sock = self.handler.sock
+        sock.settimeout(timeout)
+
+        t = self.terminator
+        while t not in self._buf:
+            s = sock.recv(self.datasize)
+            if not s:
+                raise socket.error('connection closed')
+            self._buf += s
+
+        r, self._buf = self._buf.split(t, 1)
+        return (r + t).decode('utf-8')
+
+# ============= EOF =============================================
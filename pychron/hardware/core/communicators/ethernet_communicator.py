@@ -26,6 +26,7 @@ from traits.api import Float
 from pychron.globals import globalv
 from pychron.hardware.core.checksum_helper import computeCRC
 from pychron.hardware.core.communicators.communicator import Communicator, process_response
+from pychron.hardware.core.communicators.connection_pool import get_pool, Pipeline
 from pychron.regex import IPREGEX
 
 
@@ -191,6 +192,18 @@ class EthernetCommunicator(Communicator):
     timeout = Float(1.0)
 
     default_timeout = 3
+    retry_delay = 0.025
+
+    # share persistent connections with every communicator using the same address
+    use_pool = False
+    pool_size = 1
+
+    # send commands without waiting for the previous response. requires a device that answers every command,
+    # in order, with a response ending in read_terminator
+    pipelined = False
+    read_terminator = None
+
+    _pipeline = None
 
     _comms_report_attrs = ('host', 'port', 'read_port', 'kind', 'timeout')
 
@@ -222,6 +235,15 @@ class EthernetCommunicator(Communicator):
         self.message_frame = self.config_get(config, 'Communications', 'message_frame', optional=True, default='')
         self.default_timeout = self.config_get(config, 'Communications', 'default_timeout', cast='int',
                                                optional=True, default=3)
+        self.retry_delay = self.config_get(config, 'Communications', 'retry_delay', cast='float',
+                                           optional=True, default=0.025)
+        self.use_pool = self.config_get(config, 'Communications', 'use_pool', cast='boolean', optional=True,
+                                        default=False)
+        self.pool_size = self.config_get(config, 'Communications', 'pool_size', cast='int', optional=True,
+                                         default=1)
+        self.pipelined = self.config_get(config, 'Communications', 'pipelined', cast='boolean', optional=True,
+                                         default=False)
+        self.read_terminator = self.config_get(config, 'Communications', 'read_terminator', optional=True)
 
         if self.kind is None:
             self.kind = 'UDP'
@@ -320,6 +342,9 @@ class EthernetCommunicator(Communicator):
 
         cmd = '{}{}'.format(cmd, self.write_terminator)
 
+        if self._use_pool():
+            return self._pooled_ask(cmd, retries, verbose, quiet, info, timeout, message_frame, delay)
+
         r = None
         with self._lock:
             if use_error_mode and self.error_mode:
@@ -335,7 +360,7 @@ class EthernetCommunicator(Communicator):
                 if r is not None:
                     break
                 else:
-                    time.sleep(0.025)
+                    time.sleep(self.retry_delay)
                     self.debug('doing retry {}'.format(i))
                     # else:
                     #     self._reset_connection()
@@ -361,6 +386,11 @@ class EthernetCommunicator(Communicator):
             self.handler.end()
         self._reset_connection()
 
+        pipeline = self._pipeline
+        if pipeline:
+            self._close_pipeline(pipeline)
+            self._pipeline = None
+
     def read(self, datasize=None, *args, **kw):
         with self._lock:
             handler = self.get_handler()
@@ -381,6 +411,104 @@ class EthernetCommunicator(Communicator):
                     self.error_mode = True
 
     # private
+    def _use_pool(self):
+        """
+        pooling is not used for devices that close the connection after every command or answer on a
+        separate read port
+        """
+        return (self.use_pool or self.pipelined) and not (self.use_end or self.read_port)
+
+    def _get_pool(self):
+        """
+        communicators share a pool only if their connections are configured the same way
+        """
+        key = (self.kind.upper(), self.host, self.port, self.message_frame, self.timeout)
+        return get_pool(key, self._handler_factory, size=self.pool_size)
+
+    def _handler_factory(self):
+        if self.kind.lower() == 'udp':
+            h = UDPHandler()
+        else:
+            h = TCPHandler()
+        h.open_socket((self.host, self.port), timeout=self.timeout)
+        h.set_frame(self.message_frame)
+        return h
+
+    def _pooled_ask(self, cmd, retries, verbose, quiet, info, timeout, message_frame, delay):
+        if timeout is None:
+            timeout = self.default_timeout
+
+        r = None
+        for i in range(retries):
+            if self.pipelined and self.kind.lower() == 'tcp':
+                r = self._pipelined_ask(cmd, timeout)
+            else:
+                r = self._pool_ask(cmd, timeout, message_frame, delay)
+
+            if r is not None:
+                break
+
+            time.sleep(self.retry_delay)
+            self.debug('doing retry {}'.format(i))
+
+        if r is not None:
+            re = process_response(r)
+        else:
+            re = 'ERROR: Connection refused: {}, timeout={}'.format(self.address, timeout)
+
+        if verbose or (self.verbose and not quiet):
+            self.log_response(cmd, re, info)
+        return r
+
+    def _pool_ask(self, cmd, timeout, message_frame, delay):
+        pool = self._get_pool()
+        handler = pool.acquire(timeout)
+        if handler is None:
+            return
+
+        ok = False
+        try:
+            handler.sock.settimeout(timeout)
+            handler.send_packet(cmd)
+            if delay:
+                time.sleep(delay)
+
+            r = handler.get_packet(message_frame=message_frame)
+            ok = True
+            return r
+        except socket.error as e:
+            self.warning('ask. error: {} address: {}'.format(e, self.address))
+        finally:
+            pool.release(handler, ok)
+
+    def _pipelined_ask(self, cmd, timeout):
+        with self._lock:
+            pipeline = self._pipeline
+            if pipeline is None or pipeline.broken:
+                if pipeline is not None:
+                    self.warning('pipeline to {} broken. reconnecting'.format(self.address))
+                    self._close_pipeline(pipeline)
+
+                # the pipeline holds its connection until it is closed so it does not take one from the pool
+                try:
+                    handler = self._handler_factory()
+                except socket.error as e:
+                    self.warning('pipeline. error: {} address: {}'.format(e, self.address))
+                    self._pipeline = None
+                    return
+
+                terminator = self.read_terminator or self.write_terminator
+                pipeline = self._pipeline = Pipeline(handler, terminator)
+
+        return pipeline.ask(cmd, timeout)
+
+    def _close_pipeline(self, pipeline):
+        pipeline.close()
+        try:
+            pipeline.handler.end()
+        except socket.error:
+            pass
+
     def _reset_connection(self):
         self.handler = None
         self.error_mode = False
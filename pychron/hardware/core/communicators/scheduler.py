@@ -16,95 +16,255 @@
 
 # ============= enthought library imports =======================
 from __future__ import absolute_import
-from traits.api import Float, HasTraits
+from traits.api import Float, HasTraits, Str
 
 # ============= standard library imports ========================
-from threading import Lock
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from threading import Condition, Event, Lock, Thread, current_thread, local
 
 # ============= local library imports  ==========================
 
+# priority classes. lower values are sent first
+INTERACTIVE = 0
+STATUS = 1
 
-# SINGLE_ITEM_BUF = True
-# SINGLE_ITEM_BUF=False
-class CommunicationScheduler(HasTraits):
+_priority = local()
+
+
+@contextmanager
+def status_polling():
+    """
+    schedule every command sent by this thread inside the block as status polling.
+
+    e.g. wrap periodic reads so that commands issued by the user are sent ahead of them::
+
+        with status_polling():
+            state = valve.get_hardware_indicator_state()
     """
+    prev = getattr(_priority, 'value', INTERACTIVE)
+    _priority.value = STATUS
+    try:
+        yield
+    finally:
+        _priority.value = prev
+
+
+def current_priority():
+    return getattr(_priority, 'value', INTERACTIVE)
+
+
+class Request(object):
+    def __init__(self, func, args, kwargs, priority, key):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.key = key
+        self.submitted = time.time()
+
+        self.result = None
+        self.exception = None
+        self.nwaiters = 1
+        self.started = False
+        self._evt = Event()
 
+    @property
+    def done(self):
+        return self._evt.is_set()
 
+    def wait(self, timeout=None):
+        if self._evt.wait(timeout):
+            if self.exception is not None:
+                raise self.exception
+            return self.result
+
+    def set(self, result=None, exception=None):
+        self.result = result
+        self.exception = exception
+        self._evt.set()
+
+
+def device_name(func):
+    obj = getattr(func, '__self__', None)
+    return getattr(obj, 'name', None) or getattr(func, '__name__', str(func))
+
+
+class CommunicationScheduler(HasTraits):
+    """
         this class should be used when working with multiple rs485 devices on the same port.
 
-        it uses a simple lock and sleep cycle to avoid collision on the data lines
+        requests are sent one at a time by a dedicated bus thread, highest priority first and in the order
+        submitted within a priority. at least ``collision_delay`` ms are left between the end of one frame and the
+        start of the next to avoid collision on the data lines.
+
+        status polling requests (see ``status_polling``) are sent after any pending interactive commands.
+        an identical status request, same function and arguments, that is already pending is not sent twice,
+        every caller receives the result of the single request.
 
         when setting up the devices use device.set_scheduler to set the shared scheduler
 
     """
-
-    #    collision_delay = Float(125)
+    name = Str
     collision_delay = Float(50)
 
     def __init__(self, *args, **kw):
         super(CommunicationScheduler, self).__init__(*args, **kw)
-        self._lock = Lock()
-
-    #        self._condition = Condition()
-    #        self._command_queue = Queue()
-    #        self._buffer = Queue()
-    #
-    #        consumer = Consumer(self._command_queue,
-    #                            self._buffer,
-    # #                            self._condition,
-    #                            self.collision_delay)
-    #        consumer.start()
-
-    def schedule(self, func, args=None, kwargs=None):
+        self._cond = Condition(Lock())
+        self._queue = []
+        self._pending = {}
+        self._seq = itertools.count()
+        self._thread = None
+        self._last_frame = 0
+        self._stats = {}
+
+    def schedule(self, func, args=None, kwargs=None, priority=None, timeout=None):
+        """
+        send ``func(*args, **kwargs)`` on the bus thread and return its result.
+
+        :param priority: INTERACTIVE or STATUS. defaults to the priority of the calling thread
+        :param timeout: seconds to wait for the result. None waits indefinitely. returns None on timeout. a request
+            that has not been sent when the last of its callers times out is not sent
+        """
         if args is None:
             args = tuple()
         if kwargs is None:
             kwargs = dict()
+        if priority is None:
+            priority = current_priority()
 
-        #        while SINGLE_ITEM_BUF and not self._buffer.empty():
-        #            time.sleep(0.0001)
-        #
-        #        self._command_queue.put((func, args, kwargs))
-        #
-        #        try:
-        #            r = self._buffer.get(timeout=0.5)
-        #        except Empty:
-        #            r = None
+        # called from a request already running on the bus
+        if current_thread() is self._thread:
+            return func(*args, **kwargs)
 
-        with self._lock:
-            r = func(*args, **kwargs)
+        key = None
+        if priority == STATUS:
+            try:
+                key = func, args, tuple(sorted(kwargs.items()))
+                hash(key)
+            except TypeError:
+                key = None
 
-        return r
+        with self._cond:
+            req = self._pending.get(key) if key is not None else None
+            if req is not None:
+                req.nwaiters += 1
+                self._get_stats(device_name(func))['deduplicated'] += 1
+            else:
+                req = Request(func, args, kwargs, priority, key)
+                if key is not None:
+                    self._pending[key] = req
+                heapq.heappush(self._queue, (priority, next(self._seq), req))
+                self._start()
+                self._cond.notify()
 
-# class Consumer(Thread):
-#
-#    def __init__(self, q, b, cd):
-#        Thread.__init__(self)
-#        self._q = q
-#        self._buf = b
-# #        self.logger = add_console(name='consumer')
-# #        self.cond = cond
-#        self.cd = cd
-#
-#    def run(self):
-#        while 1:
-# #            self.cond.acquire()
-#            while self._q.empty():
-#                time.sleep(0.0001)
-# #                self.cond.wait(timeout=0.05)
-# #            st = time.time()
-#            func, args, kwargs = self._q.get()
-#
-#            while SINGLE_ITEM_BUF and not self._buf.empty():
-#                time.sleep(0.0001)
-#
-#            r = func(*args, **kwargs)
-# #            self.logger.info(r)
-#            self._buf.put(r)
-# #            self.cond.release()
-#
-# #            time.sleep(self.cd/1000.)
-# #            time.sleep(max(0.0001, self.cd / 1000. - (time.time() - st) - 0.001))
+        result = req.wait(timeout)
+        if not req.done:
+            self._cancel(req)
+        return result
+
+    def stop(self):
+        with self._cond:
+            thread = self._thread
+            self._thread = None
+            # fail the requests queued before the stop. the queue is left empty for the next bus thread
+            stale = self._queue
+            self._queue = []
+            self._pending = {}
+            self._cond.notify()
+
+        for _, _, req in stale:
+            req.set()
+
+        if thread is not None:
+            thread.join(1)
+
+    def report(self):
+        """
+        per device request counts and mean/max time spent waiting for the bus and on the bus, in seconds
+        """
+        with self._cond:
+            r = {}
+            for name, st in self._stats.items():
+                n = st['count']
+                r[name] = {'count': n,
+                           'deduplicated': st['deduplicated'],
+                           'mean_wait': st['wait'] / n if n else 0,
+                           'max_wait': st['max_wait'],
+                           'mean_duration': st['duration'] / n if n else 0,
+                           'max_duration': st['max_duration']}
+            return r
+
+    def reset_stats(self):
+        with self._cond:
+            self._stats = {}
+
+    # private
+    def _start(self):
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name='CommunicationScheduler-{}'.format(self.name))
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _cancel(self, req):
+        """
+        a caller stopped waiting for ``req``. remove it from the queue if nobody else is waiting and it was not sent
+        """
+        with self._cond:
+            req.nwaiters -= 1
+            if req.nwaiters or req.started:
+                return
+
+            self._queue = [q for q in self._queue if q[2] is not req]
+            heapq.heapify(self._queue)
+            if req.key is not None and self._pending.get(req.key) is req:
+                del self._pending[req.key]
+
+    def _get_stats(self, name):
+        st = self._stats.get(name)
+        if st is None:
+            st = self._stats[name] = {'count': 0, 'deduplicated': 0,
+                                      'wait': 0, 'max_wait': 0,
+                                      'duration': 0, 'max_duration': 0}
+        return st
+
+    def _run(self):
+        me = current_thread()
+        while 1:
+            with self._cond:
+                while not self._queue and self._thread is me:
+                    self._cond.wait()
+
+                if self._thread is not me:
+                    break
+
+                _, _, req = heapq.heappop(self._queue)
+                req.started = True
+                if req.key is not None:
+                    self._pending.pop(req.key, None)
+
+            delay = self._last_frame + self.collision_delay / 1000. - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+            st = time.time()
+            try:
+                req.set(result=req.func(*req.args, **req.kwargs))
+            except BaseException as e:
+                req.set(exception=e)
+
+            self._last_frame = et = time.time()
 
+            with self._cond:
+                stats = self._get_stats(device_name(req.func))
+                wait = st - req.submitted
+                dur = et - st
+                stats['count'] += 1
+                stats['wait'] += wait
+                stats['max_wait'] = max(stats['max_wait'], wait)
+                stats['duration'] += dur
+                stats['max_duration'] = max(stats['max_duration'], dur)
 
 # ============= EOF ====================================
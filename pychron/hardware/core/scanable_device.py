@@ -25,6 +25,7 @@ from pychron.core.helpers.datetime_tools import generate_datetimestamp
 from pychron.database.data_warehouse import DataWarehouse
 from pychron.graph.plot_record import PlotRecord
 from pychron.hardware.core.alarm import Alarm
+from pychron.hardware.core.communicators.scheduler import status_polling
 from pychron.hardware.core.viewable_device import ViewableDevice
 from pychron.managers.data_managers.csv_data_manager import CSVDataManager
 from pychron.paths import paths
@@ -103,7 +104,8 @@ class ScanableDevice(ViewableDevice):
         if self.scan_func:
 
             try:
-                v = getattr(self, self.scan_func)(verbose=False)
+                with status_polling():
+                    v = getattr(self, self.scan_func)(verbose=False)
             except AttributeError as e:
                 print('exception', e)
                 return
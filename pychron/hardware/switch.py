@@ -124,27 +124,34 @@ class Switch(BaseSwitch):
     def state_str(self):
         return '{}{}{}'.format(self.name, self.state, self.software_lock)
 
-    def _state_call(self, func, *args, **kw):
-        result = None
-        dev = None
+    def get_state_query(self):
+        """
+        return the device and address queried for the indicator state
+        """
         if self.state_device is not None:
-            dev = self.state_device
-            address = self.state_address
-            # result = self.state_device.get_indicator_state(self, 'closed', **kw)
+            return self.state_device, self.state_address
         elif self.actuator is not None:
-            dev = self.actuator
-            address = self.address
-            # result = self.actuator.get_indicator_state(self, 'closed', **kw)
+            return self.actuator, self.address
+        return None, None
 
+    def _state_call(self, func, *args, **kw):
+        result = None
+        dev, address = self.get_state_query()
         if dev:
             result = getattr(dev, func)(address, *args, **kw)
 
         return result
 
     def get_hardware_indicator_state(self, verbose=True):
+        result = self._state_call('get_indicator_state', 'closed', verbose)
+        return self.set_indicator_state(result)
+
+    def set_indicator_state(self, result):
+        """
+        set the state from an indicator reading. used for readings made one at a time or in bulk
+        """
         msg = 'Get hardware indicator state err'
 
-        result = self._state_call('get_indicator_state', 'closed', verbose)
         s = result
         if not isinstance(result, bool):
             self.debug('{}: {}'.format(msg, result))
@@ -0,0 +1,168 @@
+import time
+import unittest
+from threading import Event, Thread
+
+from pychron.hardware.core.communicators.scheduler import CommunicationScheduler, INTERACTIVE, STATUS, \
+    status_polling
+
+
+class Device(object):
+    name = 'device'
+
+    def __init__(self):
+        self.calls = []
+        self.times = []
+
+    def ask(self, cmd, block=None):
+        if block is not None:
+            block.wait(2)
+        self.calls.append(cmd)
+        self.times.append(time.time())
+        return cmd
+
+
+class CommunicationSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = CommunicationScheduler(name='bus', collision_delay=0)
+        self.device = Device()
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def _submit(self, cmd, priority=None, **kw):
+        results = []
+
+        def func():
+            if priority == STATUS:
+                with status_polling():
+                    results.append(self.scheduler.schedule(self.device.ask, args=(cmd,), kwargs=kw))
+            else:
+                results.append(self.scheduler.schedule(self.device.ask, args=(cmd,), kwargs=kw,
+                                                       priority=priority))
+
+        t = Thread(target=func)
+        t.start()
+        return t, results
+
+    def _block(self, cmd='block'):
+        evt = Event()
+        t, _ = self._submit(cmd, block=evt)
+        time.sleep(0.05)
+        return t, evt
+
+    def test_result(self):
+        self.assertEqual(self.scheduler.schedule(self.device.ask, args=('a',)), 'a')
+
+    def test_exception(self):
+        def func():
+            raise ValueError('bad')
+
+        self.assertRaises(ValueError, self.scheduler.schedule, func)
+
+    def test_priority(self):
+        bt, evt = self._block()
+        st, _ = self._submit('status', STATUS)
+        time.sleep(0.05)
+        it, _ = self._submit('interactive', INTERACTIVE)
+        time.sleep(0.05)
+        evt.set()
+        for t in (bt, st, it):
+            t.join()
+
+        self.assertListEqual(self.device.calls, ['block', 'interactive', 'status'])
+
+    def test_deduplicate(self):
+        bt, evt = self._block()
+        a, ra = self._submit('status', STATUS)
+        b, rb = self._submit('status', STATUS)
+        time.sleep(0.05)
+        evt.set()
+        for t in (bt, a, b):
+            t.join()
+
+        self.assertEqual(self.device.calls.count('status'), 1)
+        self.assertListEqual(ra + rb, ['status', 'status'])
+        self.assertEqual(self.scheduler.report()['device']['deduplicated'], 1)
+
+    def test_interactive_not_deduplicated(self):
+        bt, evt = self._block()
+        a, _ = self._submit('open', INTERACTIVE)
+        b, _ = self._submit('open', INTERACTIVE)
+        time.sleep(0.05)
+        evt.set()
+        for t in (bt, a, b):
+            t.join()
+
+        self.assertEqual(self.device.calls.count('open'), 2)
+
+    def test_collision_delay(self):
+        self.scheduler.collision_delay = 20
+        for c in 'ab':
+            self.scheduler.schedule(self.device.ask, args=(c,))
+
+        a, b = self.device.times
+        self.assertGreaterEqual(b - a, 0.019)
+
+    def test_nested(self):
+        def func():
+            return self.scheduler.schedule(self.device.ask, args=('nested',))
+
+        self.assertEqual(self.scheduler.schedule(func), 'nested')
+
+    def test_timeout(self):
+        bt, evt = self._block()
+        self.assertIsNone(self.scheduler.schedule(self.device.ask, args=('late',), timeout=0.05))
+        evt.set()
+        bt.join()
+        self.scheduler.schedule(self.device.ask, args=('next',))
+
+        # nobody is waiting for the timed out request so it is never sent
+        self.assertListEqual(self.device.calls, ['block', 'next'])
+
+    def test_deduplicated_timeout(self):
+        bt, evt = self._block()
+        a, ra = self._submit('status', STATUS)
+        time.sleep(0.05)
+        with status_polling():
+            self.assertIsNone(self.scheduler.schedule(self.device.ask, args=('status',), timeout=0.05))
+        evt.set()
+        for t in (bt, a):
+            t.join()
+
+        # still sent for the caller that is waiting
+        self.assertListEqual(ra, ['status'])
+
+    def test_restart(self):
+        bt, evt = self._block()
+        ot, ro = self._submit('old')
+        time.sleep(0.05)
+        self.scheduler.stop()
+
+        # the stopped thread is still sending "block" while the new thread starts
+        nt, nevt = self._block('new')
+        t, r = self._submit('queued')
+        time.sleep(0.05)
+
+        # the stopped thread exits while "queued" waits for the new thread
+        evt.set()
+        bt.join()
+        time.sleep(0.05)
+        nevt.set()
+        for ti in (ot, nt, t):
+            ti.join()
+
+        self.assertListEqual(ro, [None])
+        self.assertListEqual(r, ['queued'])
+        self.assertNotIn('old', self.device.calls)
+
+    def test_stats(self):
+        for c in 'abc':
+            self.scheduler.schedule(self.device.ask, args=(c,))
+
+        st = self.scheduler.report()['device']
+        self.assertEqual(st['count'], 3)
+        self.assertGreaterEqual(st['max_wait'], st['mean_wait'])
+
+
+if __name__ == '__main__':
+    unittest.main()
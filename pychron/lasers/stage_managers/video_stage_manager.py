@@ -669,7 +669,8 @@ class VideoStageManager(StageManager):
                     self.stage_controller.y,
                     ox, oy,
                     dim=dim,
-                    shape=shape)
+                    shape=shape,
+                    holder=sm.name)
 
                 if rpos is not None:
                     self.linear_move(*rpos, block=True,
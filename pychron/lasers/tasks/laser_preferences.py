@@ -66,6 +66,7 @@ class FusionsLaserPreferences(LaserPreferences):
     autocenter_search_step = Int
     autocenter_search_n = Int
     autocenter_search_width = Int
+    autocenter_coarse_to_fine = Bool(False)
 
     render_with_markup = Bool(False)
     crosshairs_offsetx = Float(0)
@@ -163,6 +164,10 @@ class FusionsLaserPreferencesPane(PreferencesPane):
                                     VGroup(Item('autocenter_search_step', label='Step'),
                                            Item('autocenter_search_n', label='N'),
                                            Item('autocenter_search_width', label='Width'),
+                                           Item('autocenter_coarse_to_fine', label='Coarse to Fine',
+                                                tooltip='Score the threshold windows on a downsampled image, '
+                                                        'refine the best and start each hole from the window '
+                                                        'that found the previous hole of the tray'),
 
                                            Item('autocenter_use_adaptive_threshold', label='Use Adaptive Threshold'),
                                            Item('autocenter_blocksize', label='Block Size',
@@ -18,7 +18,7 @@
 from __future__ import absolute_import
 
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Float, Button, Bool, Any, Instance, Event, Int
+from traits.api import Float, Button, Bool, Any, Instance, Event, Int, Dict
 from traitsui.api import View, Item, HGroup, RangeEditor
 from math import ceil
 from pychron.image.standalone_image import FrameImage
@@ -46,9 +46,13 @@ class AutoCenterManager(MachineVisionManager):
     search_width = Int
     blocksize = Int
     blocksize_step = Int
+    use_coarse_to_fine_search = Bool(False)
 
     display_image = Instance(FrameImage, ())
 
+    # threshold window that last found a hole, keyed by holder
+    _threshold_hints = Dict
+
     def bind_preferences(self, pref_id):
         bind_preference(self, 'use_autocenter', '{}.use_autocenter'.format(pref_id))
         bind_preference(self, 'blur', '{}.autocenter_blur'.format(pref_id))
@@ -59,8 +63,9 @@ class AutoCenterManager(MachineVisionManager):
         bind_preference(self, 'search_width', '{}.autocenter_search_width'.format(pref_id))
         bind_preference(self, 'blocksize', '{}.autocenter_blocksize'.format(pref_id))
         bind_preference(self, 'blocksize_step', '{}.autocenter_blocksize_step'.format(pref_id))
+        bind_preference(self, 'use_coarse_to_fine_search', '{}.autocenter_coarse_to_fine'.format(pref_id))
 
-    def calculate_new_center(self, cx, cy, offx, offy, dim=1.0, shape='circle'):
+    def calculate_new_center(self, cx, cy, offx, offy, dim=1.0, shape='circle', holder=None):
         frame = self.new_image_frame()
         loc = self._get_locator(shape=shape)
 
@@ -80,7 +85,13 @@ class AutoCenterManager(MachineVisionManager):
                       blocksize=self.blocksize,
                       blocksize_step=self.blocksize_step,
                       use_adaptive_threshold=self.use_adaptive_threshold)
+        if self.use_coarse_to_fine_search:
+            search['coarse_to_fine'] = True
+            search['hint'] = self._threshold_hints.get(holder)
+
         dx, dy = loc.find(im, frame, dim=dim, preprocess=preprop, search=search)
+        if loc.last_threshold is not None:
+            self._threshold_hints[holder] = loc.last_threshold
 
         if dx is None and dy is None:
             return
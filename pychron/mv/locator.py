@@ -36,10 +36,15 @@ from pychron.image.cv_wrapper import grayspace, draw_contour_list, contour, \
     draw_lines, \
     draw_polygons, crop
 from pychron.mv.target import Target
+from pychron.mv.threshold_search import ThresholdSearch, threshold_windows, downsample
 from pychron.core.geometry.geometry import approximate_polygon_center, \
     calc_length
 
 
+# smallest radius or half width, in pixels, of a hole in a downsampled frame
+MIN_COARSE_DIM = 8
+
+
 def _coords_inside_image(rr, cc, shape):
     mask = (rr >= 0) & (rr < shape[0]) & (cc >= 0) & (cc < shape[1])
     return rr[mask], cc[mask]
@@ -64,6 +69,7 @@ class Locator(Loggable):
     use_square_approximation = True
     step_signal = None
     pixel_depth = 255
+    last_threshold = None
 
     def wait(self):
         if self.step_signal:
@@ -159,63 +165,106 @@ class Locator(Loggable):
         if inverted:
             src = invert(src)
 
+        w = search.get('width', 10)
         start = search.get('start')
         if start is None:
-            w = search.get('width', 10)
             start = int(mean(src[src > 0])) - search.get('start_offset_scalar', 3) * w
 
-        step = search.get('step', 2)
-        n = search.get('n', 20)
+        windows = threshold_windows(start, w, search.get('step', 2), search.get('n', 20),
+                                    inverted=inverted,
+                                    blocksize=search.get('blocksize', 20),
+                                    blocksize_step=search.get('blocksize_step', 5))
 
-        blocksize_step = search.get('blocksize_step', 5)
-        seg = RegionSegmenter(use_adaptive_threshold=search.get('use_adaptive_threshold', False),
-                              blocksize=search.get('blocksize', 20))
+        use_adaptive_threshold = search.get('use_adaptive_threshold', False)
         fa = self._get_filter_target_area(shape, dim)
-        phigh, plow = None, None
-
-        for j in range(n):
-            ww = w * (j + 1)
-            self.debug('start intensity={}, width={}'.format(start, ww))
-            for i in range(n):
 
-                low = max((0, start + i * step - ww))
-                high = max((1, min((255, start + i * step + ww))))
-                if inverted:
-                    low = 255-low
-                    high = 255-high
-
-                seg.threshold_low = low
-                seg.threshold_high = high
+        def evaluate(window):
+            nf, targets = self._evaluate_window(src, window, use_adaptive_threshold)
+            if targets:
+                # filter targets
+                if filter_targets:
+                    targets = self._filter_targets(image, frame, dim, targets, fa)
+                elif convexity_filter:
+                    targets = [t for t in targets if t.perimeter_convexity > convexity_filter]
+
+            return nf, targets
+
+        self.last_threshold = None
+        if search.get('coarse_to_fine'):
+            # downsample no further than the hole is still resolved
+            factor = int(min(search.get('downsample', 4), dim / MIN_COARSE_DIM))
+            score = None
+            if factor > 1:
+                csrc = downsample(src, factor)
+                cfa = fa[0] / factor ** 2, fa[1] / factor ** 2
+
+                def score(window):
+                    _, targets = self._evaluate_window(csrc, window, use_adaptive_threshold, draw=False)
+                    return self._score_targets(csrc, targets, cfa, factor)
+
+            results = {}
+
+            def full(window):
+                nf, targets = results[window] = evaluate(window)
+                return targets
+
+            ts = ThresholdSearch(full, score,
+                                 nrefine=search.get('nrefine', 2),
+                                 nworkers=search.get('nworkers', 4),
+                                 chunksize=search.get('chunksize', 40))
+            hint = search.get('hint')
+            if hint is not None:
+                hint = tuple(hint)
+
+            window, targets = ts.search(windows, hint=hint)
+            self.debug('coarse to fine search. scored={} evaluated={} window={}'.format(ts.nscored,
+                                                                                          ts.nevaluated,
+                                                                                          window))
+            if window is not None:
+                nf, _ = results[window]
+                if set_image and image is not None:
+                    image.set_frame(nf)
 
-                if seg.threshold_low == plow and seg.threshold_high == phigh:
-                    break
+                self.last_threshold = window
+                return sorted(targets, key=attrgetter('area'), reverse=True)
+        else:
+            self.debug('start intensity={}, width={}, windows={}'.format(start, w, len(windows)))
+            for window in windows:
+                nf, targets = evaluate(window)
+                if set_image and image is not None:
+                    image.set_frame(nf)
 
-                plow = seg.threshold_low
-                phigh = seg.threshold_high
+                if targets:
+                    self.last_threshold = window
+                    return sorted(targets, key=attrgetter('area'), reverse=True)
 
-                nsrc = seg.segment(src)
-                seg.blocksize += blocksize_step
+    def _evaluate_window(self, src, window, use_adaptive_threshold, draw=True):
+        """
+            segment src with the (low, high, blocksize) threshold window and find the polygon targets
+        """
+        seg = RegionSegmenter(use_adaptive_threshold=use_adaptive_threshold)
+        seg.threshold_low, seg.threshold_high, seg.blocksize = window
 
-                nf = colorspace(nsrc)
+        nsrc = seg.segment(src)
+        nf = colorspace(nsrc) if draw else None
 
-                # draw contours
-                targets = self._find_polygon_targets(nsrc, frame=nf)
-                if set_image and image is not None:
-                    image.set_frame(nf)
+        # draw contours
+        targets = self._find_polygon_targets(nsrc, frame=nf)
+        return nf, targets
 
-                if targets:
+    def _score_targets(self, src, targets, fa, factor):
+        """
+            score the targets found in a downsampled frame.
 
-                    # filter targets
-                    if filter_targets:
-                        targets = self._filter_targets(image, frame, dim, targets, fa)
-                    elif convexity_filter:
-                        # for t in targets:
-                        #     print t.convexity, t.area, t.min_enclose_area, t.perimeter_convexity
-                        targets = [t for t in targets if t.perimeter_convexity > convexity_filter]
+            0 if no target has a plausible area near the center otherwise 1 + the convexity of the best target
+        """
+        mi, ma = fa
+        cxy = self._get_frame_center(src)
+        tol = 0.75 * self.pxpermm / factor
 
-                if targets:
-                    return sorted(targets, key=attrgetter('area'), reverse=True)
-                    # time.sleep(0.5)
+        scores = [1 + ti.convexity for ti in targets or []
+                  if ma > ti.area > mi and calc_length(ti.centroid, cxy) < tol]
+        return max(scores) if scores else 0
 
     def _mask(self, src, radius=None):
 
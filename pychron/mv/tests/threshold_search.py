@@ -0,0 +1,121 @@
+import unittest
+from threading import Lock
+
+from numpy import arange, array_equal
+
+from pychron.mv.threshold_search import ThresholdSearch, threshold_windows, downsample
+
+
+def sweep(start, width, step, n, inverted=False, blocksize=20, blocksize_step=5):
+    """
+    the threshold sweep as it was written in Locator._find_targets
+    """
+    ws = []
+    plow, phigh = None, None
+    for j in range(n):
+        ww = width * (j + 1)
+        for i in range(n):
+            low = max((0, start + i * step - ww))
+            high = max((1, min((255, start + i * step + ww))))
+            if inverted:
+                low = 255 - low
+                high = 255 - high
+
+            if low == plow and high == phigh:
+                break
+
+            plow, phigh = low, high
+            ws.append((low, high, blocksize))
+            blocksize += blocksize_step
+    return ws
+
+
+class ThresholdWindowsTestCase(unittest.TestCase):
+    def test_sweep_order(self):
+        for args in ((100, 10, 2, 20), (200, 10, 5, 20), (30, 15, 2, 10)):
+            for inverted in (False, True):
+                self.assertListEqual(threshold_windows(*args, inverted=inverted),
+                                     sweep(*args, inverted=inverted))
+
+    def test_clipped_rows(self):
+        # every window of the second row spans the full intensity range
+        ws = threshold_windows(128, 100, 2, 5)
+        self.assertEqual(len(ws), 6)
+        self.assertEqual(ws[-1][:2], (0, 255))
+
+    def test_downsample(self):
+        src = arange(36, dtype='uint8').reshape(6, 6)
+        d = downsample(src, 2)
+        self.assertEqual(d.shape, (3, 3))
+        self.assertEqual(d.dtype, src.dtype)
+        self.assertEqual(d[0, 0], int((0 + 1 + 6 + 7) / 4))
+
+        self.assertEqual(downsample(src, 4).shape, (1, 1))
+        self.assertTrue(array_equal(downsample(src, 1), src))
+
+
+class ThresholdSearchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.windows = threshold_windows(100, 10, 2, 20)
+        self.evaluated = []
+        self.lock = Lock()
+
+    def _evaluate(self, passing):
+        def evaluate(w):
+            with self.lock:
+                self.evaluated.append(w)
+            if w in passing:
+                return ['target']
+
+        return evaluate
+
+    def test_refine_best(self):
+        good = self.windows[150]
+        s = ThresholdSearch(self._evaluate([good]), lambda w: 2 if w == good else 0, nworkers=4)
+        w, r = s.search(self.windows)
+        self.assertEqual(w, good)
+        self.assertEqual(r, ['target'])
+        # scoring stops with the chunk containing the window
+        self.assertEqual(s.nscored, 160)
+        self.assertEqual(s.nevaluated, 1)
+
+    def test_fallback_sweep_order(self):
+        passing = self.windows[40:60]
+        s = ThresholdSearch(self._evaluate(passing), lambda w: 0, nworkers=4)
+        w, r = s.search(self.windows)
+        self.assertEqual(w, self.windows[40])
+        self.assertLessEqual(s.nevaluated, 44)
+
+    def test_first_in_batch_wins(self):
+        passing = [self.windows[2], self.windows[1]]
+        s = ThresholdSearch(self._evaluate(passing), lambda w: 0, nworkers=4)
+        w, r = s.search(self.windows)
+        self.assertEqual(w, self.windows[1])
+
+    def test_hint(self):
+        hint = self.windows[200]
+        s = ThresholdSearch(self._evaluate([hint]), lambda w: 1, nworkers=4)
+        w, r = s.search(self.windows, hint=hint)
+        self.assertEqual(w, hint)
+        self.assertEqual(s.nevaluated, 1)
+        self.assertEqual(s.nscored, 0)
+
+    def test_hint_fails(self):
+        hint = self.windows[200]
+        good = self.windows[10]
+        s = ThresholdSearch(self._evaluate([good]), lambda w: 1 if w == good else 0)
+        w, r = s.search(self.windows, hint=hint)
+        self.assertEqual(w, good)
+        self.assertEqual(s.nevaluated, 2)
+
+    def test_not_found(self):
+        s = ThresholdSearch(self._evaluate([]), lambda w: 1, nrefine=3)
+        w, r = s.search(self.windows)
+        self.assertIsNone(w)
+        self.assertIsNone(r)
+        self.assertEqual(s.nevaluated, len(self.windows))
+        self.assertEqual(len(set(self.evaluated)), len(self.windows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy import asarray
+
+
+# ============= local library imports  ==========================
+
+
+def threshold_windows(start, width, step, n, inverted=False, blocksize=20, blocksize_step=5):
+    """
+    the (low, high, blocksize) threshold windows swept by ``Locator``, in the order they are tried.
+
+    the window widens by ``width`` every row and slides by ``step`` within a row. a row ends early when a window
+    repeats the previous one, i.e. it has been clipped at the end of the intensity range
+    """
+    windows = []
+    plow, phigh = None, None
+    for j in range(n):
+        ww = width * (j + 1)
+        for i in range(n):
+            low = max(0, start + i * step - ww)
+            high = max(1, min(255, start + i * step + ww))
+            if inverted:
+                low = 255 - low
+                high = 255 - high
+
+            if low == plow and high == phigh:
+                break
+
+            plow, phigh = low, high
+            windows.append((low, high, blocksize + len(windows) * blocksize_step))
+
+    return windows
+
+
+def downsample(src, factor):
+    """
+    reduce ``src`` by averaging ``factor``x``factor`` blocks. rows and columns that do not fill a block are dropped
+    """
+    src = asarray(src)
+    if factor <= 1:
+        return src
+
+    h, w = src.shape[:2]
+    h, w = h - h % factor, w - w % factor
+    blocks = src[:h, :w].reshape((h // factor, factor, w // factor, factor) + src.shape[2:])
+    return blocks.mean(axis=(1, 3)).astype(src.dtype)
+
+
+class ThresholdSearch(object):
+    """
+    coarse-to-fine search of threshold windows.
+
+    ``evaluate(window)`` segments the full resolution frame with ``window`` and returns the targets that pass the
+    filters, or None. ``score(window)`` segments the downsampled frame and returns how promising ``window`` is,
+    0 if it is not worth refining.
+
+    1. the ``hint`` window, usually the one that found the previous hole of the tray, is evaluated first. the
+       other windows are then searched nearest the hint first.
+    2. the windows are scored on the downsampled frame ``chunksize`` at a time and the ``nrefine`` best of each
+       chunk are evaluated at full resolution.
+    3. if none of them pass, the remaining windows are evaluated in order.
+
+    windows are evaluated ``nworkers`` at a time. when several windows in a batch pass, the first in search order
+    wins so the result does not depend on which thread finishes first
+    """
+
+    def __init__(self, evaluate, score=None, nrefine=2, nworkers=4, chunksize=40):
+        self.evaluate = evaluate
+        self.score = score
+        self.nrefine = nrefine
+        self.nworkers = nworkers
+        self.chunksize = chunksize
+
+        self.nevaluated = 0
+        self.nscored = 0
+
+    def search(self, windows, hint=None):
+        """
+        return (window, result) for the first window that passes or (None, None)
+        """
+        self.nevaluated = 0
+        self.nscored = 0
+
+        with ThreadPoolExecutor(max_workers=max(1, self.nworkers)) as executor:
+            if hint is not None:
+                result = self._evaluate(executor, [hint])
+                if result[0] is not None:
+                    return result
+
+                windows = sorted(windows, key=lambda w: abs(w[0] - hint[0]) + abs(w[1] - hint[1]))
+                windows = [w for w in windows if w[:2] != hint[:2]]
+
+            if self.score is None:
+                return self._evaluate(executor, windows)
+
+            # score a chunk of windows at a time so a frame that segments easily stops early
+            n = max(1, self.chunksize)
+            skipped = []
+            for i in range(0, len(windows), n):
+                chunk = windows[i:i + n]
+                scores = list(executor.map(self.score, chunk))
+                self.nscored += len(chunk)
+
+                # stable sort keeps the hint/sweep order for equal scores
+                ranked = sorted((s, -j) for j, s in enumerate(scores) if s > 0)
+                idxs = [-j for _, j in reversed(ranked)][:self.nrefine]
+
+                result = self._evaluate(executor, [chunk[j] for j in idxs])
+                if result[0] is not None:
+                    return result
+
+                skipped.extend(w for j, w in enumerate(chunk) if j not in idxs)
+
+            return self._evaluate(executor, skipped)
+
+    def _evaluate(self, executor, windows):
+        n = max(1, self.nworkers)
+        for i in range(0, len(windows), n):
+            batch = windows[i:i + n]
+            results = list(executor.map(self.evaluate, batch))
+            self.nevaluated += len(batch)
+            for w, r in zip(batch, results):
+                if r:
+                    return w, r
+
+        return None, None
+
+# ============= EOF =============================================
@@ -76,6 +76,7 @@ class IdeogramOptions(AgeOptions):
     use_asymptotic_limits = Bool
     # asymptotic_width = Float)
     asymptotic_height_percent = Float
+    probability_curve_refine = Int(0)
 
     analysis_number_sorting = Enum('Oldest @Top', 'Youngest @Top')
     global_analysis_number_sorting = Bool(True)
@@ -117,6 +117,9 @@ class CalculationSubOptions(SubOptions):
             Item('probability_curve_kind',
                  width=-150,
                  label='Probability Curve Method'),
+            Item('probability_curve_refine',
+                 label='Peak Refinement',
+                 tooltip='Number of extra points added on either side of each peak of the probability curve'),
             Item('mean_calculation_kind',
                  width=-150,
                  label='Mean Calculation Method'),
@@ -765,6 +765,43 @@ class PipelineEngine(Loggable):
 
     run = run_pipeline
 
+    def append_pipeline(self, ans, pipeline=None, state=None):
+        """
+        add ``ans`` to the results of the previous run instead of rerunning the pipeline.
+
+        each enabled node is passed the analyses that are new since the previous run and returns the analyses passed
+        on to the next node. return False if a node does not support appending. nothing is modified in that case and
+        the pipeline needs to be rerun
+        """
+        if pipeline is None:
+            pipeline = self.pipeline
+
+        if state is None:
+            state = self.state
+
+        nodes = [n for n in pipeline.iternodes(None) if n.enabled]
+        node = next((n for n in nodes if not n.supports_append), None)
+        if node is not None:
+            self.debug('{} does not support append'.format(node))
+            return False
+
+        ost = time.time()
+        state.canceled = False
+        for idx, node in enumerate(nodes):
+            with ActiveCTX(node):
+                st = time.time()
+                ans = node.append(state, ans)
+                node.visited = True
+                self.debug('{:02n}: {} Append time: {:0.4f}'.format(idx, node, time.time() - st))
+
+            if state.canceled:
+                self.debug('pipeline append canceled by {}'.format(node))
+                break
+        else:
+            self.debug('pipeline append finished. runtime {}'.format(time.time() - ost))
+
+        return True
+
     def post_run(self, state):
         self.debug('pipeline post run started')
         for idx, node in enumerate(self.pipeline.nodes):
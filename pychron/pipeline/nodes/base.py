@@ -49,6 +49,9 @@ class BaseNode(ColumnSorterMixin):
     use_state_unknowns = True
     use_state_references = True
 
+    # nodes that can add new analyses to the results of the previous run set this and implement ``append``
+    supports_append = False
+
     def __init__(self, *args, **kw):
         super(BaseNode, self).__init__(*args, **kw)
         self.bind_preferences()
@@ -116,6 +119,13 @@ class BaseNode(ColumnSorterMixin):
     def run(self, state):
         raise NotImplementedError(self.__class__.__name__)
 
+    def append(self, state, ans):
+        """
+        add ``ans``, the analyses that are new since the previous run, to the results of the previous run.
+        return the analyses passed on to the next node
+        """
+        raise NotImplementedError(self.__class__.__name__)
+
     def post_run(self, engine, state):
         pass
 
@@ -306,6 +306,9 @@ class BaseAutoUnknownNode(UnknownNode):
     verbose = Bool
 
     _cached_unknowns = None
+    _signatures = None
+    _added = None
+    _removed = None
     _unks_ids = None
     _updated = False
     _alive = False
@@ -372,9 +375,14 @@ class BaseAutoUnknownNode(UnknownNode):
         raise NotImplementedError
 
     def _load_analyses(self):
+        """
+        return the analyses in the time window and whether they differ from the previous call.
+
+        only the analyses that are new or whose tag changed since the previous call are loaded. they are stored in
+        ``_added``. the previous analyses that were reloaded or fell out of the window are stored in ``_removed``
+        """
         td = timedelta(hours=self.hours)
         high = datetime.now()
-        updated = False
 
         if self.mode == 'Normal':
             low = self._low - td
@@ -388,35 +396,56 @@ class BaseAutoUnknownNode(UnknownNode):
                                                           mass_spectrometers=self.mass_spectrometer,
                                                           verbose=self.verbose)
 
-            if not self._cached_unknowns:
-                updated = True
-                ans = self.dvc.make_analyses(records)
-            else:
-                ans = []
-                ais = []
-                for ri in records:
-                    ca = next((ci for ci in self._cached_unknowns if ci.record_id == ri.record_id), None)
-                    if ca is not None:
-                        ans.append(ca)
-                    else:
-                        ais.append(ri)
-
-                if ais:
-                    updated = True
-                    # the database may have updated but the repository not yet updated.
-                    # sleeping X seconds is a potential work around but a little dumb.
-                    # better solution is to save to database after repository is updated
+            signatures = {ri.record_id: self._record_signature(ri) for ri in records}
+            previous = self._signatures or {}
+            cached = {}
+            if self._cached_unknowns:
+                cached = {ci.record_id: ci for ci in self._cached_unknowns}
+
+            ais = [ri for ri in records
+                   if ri.record_id not in cached or signatures[ri.record_id] != previous.get(ri.record_id)]
+
+            loaded = []
+            if ais:
+                # reload the analyses that changed instead of using the copies in the analysis cache
+                self.dvc.invalidate_cache([ri.uuid for ri in ais if ri.record_id in cached])
+
+                # the database may have updated but the repository not yet updated.
+                # sleeping X seconds is a potential work around but a little dumb.
+                # better solution is to save to database after repository is updated
+                try:
+                    loaded = self.dvc.make_analyses(ais)
+                except BaseException:
+                    time.sleep(10)
                     try:
-                        ans.extend(self.dvc.make_analyses(ais))
+                        loaded = self.dvc.make_analyses(ais)
                     except BaseException:
-                        time.sleep(10)
-                        try:
-                            ans.extend(self.dvc.make_analyses(ais))
-                        except BaseException:
-                            pass
+                        pass
+
+            loaded = {ai.record_id: ai for ai in loaded if ai is not None}
+            ans = []
+            self._signatures = {}
+            for ri in records:
+                rid = ri.record_id
+                if rid in loaded:
+                    ans.append(loaded[rid])
+                    self._signatures[rid] = signatures[rid]
+                elif rid in cached:
+                    # keep the previous signature so an analysis that failed to reload is tried again next time
+                    ans.append(cached[rid])
+                    self._signatures[rid] = previous.get(rid)
+
+        keep = {id(ai) for ai in ans}
+        self._added = [ai for ai in ans if ai.record_id in loaded]
+        self._removed = [ci for ci in cached.values() if id(ci) not in keep]
 
         self._cached_unknowns = ans
-        return ans, updated
+        return ans, bool(self._added or self._removed)
+
+    def _record_signature(self, record):
+        change = record.change
+        if change is not None:
+            return change.tag, change.timestamp
 
 
 class ListenUnknownNode(BaseAutoUnknownNode):
@@ -428,6 +457,7 @@ class ListenUnknownNode(BaseAutoUnknownNode):
     post_analysis_delay = Float(5)
 
     max_period = 10
+    supports_append = True
     _between_updates = None
     pipeline = None
     state = None
@@ -488,6 +518,10 @@ class ListenUnknownNode(BaseAutoUnknownNode):
             self.state = state
             self.skip_configure = True
 
+    def append(self, state, ans):
+        state.unknowns.extend(ans)
+        return ans
+
     def _finish_load_hook(self):
         if globalv.auto_pipeline_debug:
             self.mass_spectrometer = 'jan'
@@ -504,13 +538,17 @@ class ListenUnknownNode(BaseAutoUnknownNode):
 
         st = None
         if updated:
-
-            self.state.unknowns = unks
             self.unknowns = unks
-            self.engine.run(post_run=False, pipeline=self.pipeline, state=self.state, configure=False)
+
+            # only the new analyses are passed through the pipeline if nothing was removed and every node can
+            # append. otherwise rerun the pipeline with all the analyses. only the new analyses were loaded either way
+            if self._removed or not self.engine.append_pipeline(self._added, pipeline=self.pipeline,
+                                                                state=self.state):
+                self.state.unknowns = unks
+                self.engine.run(post_run=False, pipeline=self.pipeline, state=self.state, configure=False)
+                self.engine.refresh_figure_editors()
 
             self.engine.post_run_refresh(state=self.state)
-            self.engine.refresh_figure_editors()
             self.engine.selected = self.pipeline.nodes[-1]
 
             if not self._alive:
@@ -92,13 +92,51 @@ class FigureNode(SortableNode):
 
                 state.editors.append(editor)
                 self.editor = editor
-                if self.auto_set_items:
-                    if self.name in self.skip_meaning.split(','):
-                        unks = [u for u in unks if u.tag.lower() != 'skip']
+                self._set_items(editor, unks)
 
-                    editor.set_items(list(unks))
-                    editor.refresh_needed = True
+        self._name_editors(state)
 
+    def append(self, state, ans):
+        """
+        only the editors of the tabs that ``ans`` are added to are updated
+        """
+        po = self.plotter_options
+        try:
+            use_plotting = po.use_plotting
+        except AttributeError:
+            use_plotting = True
+
+        if use_plotting and self.use_plotting:
+            tab_ids = {a.tab_id for a in ans}
+            added = False
+            for tab_id, unks in groupby_key(state.unknowns, 'tab_id'):
+                if tab_id not in tab_ids:
+                    continue
+
+                editor = self.editors.get(tab_id)
+                if editor is None:
+                    editor = self._editor_factory()
+                    self.editors[tab_id] = editor
+                    state.editors.append(editor)
+                    added = True
+
+                self.editor = editor
+                self._set_items(editor, unks)
+
+            if added:
+                self._name_editors(state)
+
+        return ans
+
+    def _set_items(self, editor, unks):
+        if self.auto_set_items:
+            if self.name in self.skip_meaning.split(','):
+                unks = [u for u in unks if u.tag.lower() != 'skip']
+
+            editor.set_items(list(unks))
+            editor.refresh_needed = True
+
+    def _name_editors(self, state):
         for name, es in groupby_key(state.editors, 'name'):
             for i, ei in enumerate(es):
                 ei.name = ' '.join(ei.name.split(' ')[:-1])
@@ -152,6 +190,7 @@ class FigureNode(SortableNode):
 
 class XYScatterNode(FigureNode):
     name = 'XYScatter'
+    supports_append = True
     editor_klass = 'pychron.pipeline.plot.editors.xyscatter_editor,XYScatterEditor'
     plotter_options_manager_klass = XYScatterOptionsManager
 
@@ -223,6 +262,7 @@ class FluxVisualizationNode(FigureNode):
 
 class IdeogramNode(FigureNode):
     name = 'Ideogram'
+    supports_append = True
     editor_klass = 'pychron.pipeline.plot.editors.ideogram_editor,IdeogramEditor'
     plotter_options_manager_klass = IdeogramOptionsManager
 
@@ -235,6 +275,7 @@ class HistoryIdeogramNode(FigureNode):
 
 class SpectrumNode(FigureNode):
     name = 'Spectrum'
+    supports_append = True
 
     editor_klass = 'pychron.pipeline.plot.editors.spectrum_editor,SpectrumEditor'
     plotter_options_manager_klass = SpectrumOptionsManager
@@ -242,6 +283,7 @@ class SpectrumNode(FigureNode):
 
 class SeriesNode(FigureNode):
     name = 'Series'
+    supports_append = True
     editor_klass = 'pychron.pipeline.plot.editors.series_editor,SeriesEditor'
     plotter_options_manager_klass = SeriesOptionsManager
 
@@ -287,6 +329,14 @@ class RegressionSeriesNode(SeriesNode):
     plotter_options_manager_klass = RegressionSeriesOptionsManager
 
     def run(self, state):
+        self._load_raw(state.unknowns)
+        super(RegressionSeriesNode, self).run(state)
+
+    def append(self, state, ans):
+        self._load_raw(ans)
+        return super(RegressionSeriesNode, self).append(state, ans)
+
+    def _load_raw(self, ans):
         po = self.plotter_options
 
         keys = [fi.name for fi in list(reversed([pi for pi in po.get_plotable_aux_plots()]))]
@@ -294,8 +344,7 @@ class RegressionSeriesNode(SeriesNode):
         def load_raw(x, prog, i, n):
             x.load_raw_data(keys)
 
-        progress_iterator(state.unknowns, load_raw, threshold=1)
-        super(RegressionSeriesNode, self).run(state)
+        progress_iterator(ans, load_raw, threshold=1)
 
     def _configure_hook(self):
         pom = self.plotter_options_manager
@@ -313,18 +362,21 @@ class RegressionSeriesNode(SeriesNode):
 
 class InverseIsochronNode(FigureNode):
     name = 'Inverse Isochron'
+    supports_append = True
     editor_klass = 'pychron.pipeline.plot.editors.isochron_editor,InverseIsochronEditor'
     plotter_options_manager_klass = InverseIsochronOptionsManager
 
 
 class RadialNode(FigureNode):
     name = 'Radial Plot'
+    supports_append = True
     editor_klass = 'pychron.pipeline.plot.editors.radial_editor,RadialEditor'
     plotter_options_manager_klass = RadialOptionsManager
 
 
 class CompositeNode(FigureNode):
     name = 'Spectrum/Isochron'
+    supports_append = True
     editor_klass = 'pychron.pipeline.plot.editors.composite_editor,CompositeEditor'
     plotter_options_manager_klass = CompositeOptionsManager
     # configurable = False
@@ -333,6 +385,7 @@ class CompositeNode(FigureNode):
 
 class RatioSeriesNode(FigureNode):
     name = 'Ratio Series'
+    supports_append = True
     editor_klass = 'pychron.pipeline.plot.editors.ratio_series_editor,RatioSeriesEditor'
     plotter_options_manager_klass = RatioSeriesOptionsManager
 
@@ -174,6 +174,7 @@ class FilterNode(BaseNode):
     filters = List
     add_filter_button = Button
     remove = Bool(False)
+    supports_append = True
 
     help_str = '''The behavior is filter-in NOT filter-out. Analyses that match the filter are kept'''
 
@@ -224,6 +225,35 @@ class FilterNode(BaseNode):
         return func
 
     def run(self, state):
+        filterfunc = self._make_filterfunc()
+
+        ans = getattr(state, self.analysis_kind)
+        if self.remove:
+            # vs = list(filter(filterfunc, getattr(state, self.analysis_kind)))
+            vs = [a for a in ans if filterfunc(a)]
+            setattr(state, self.analysis_kind, vs)
+        else:
+            for a in ans:
+                if not filterfunc(a):
+                    a.temp_status = 'omit'
+
+    def append(self, state, ans):
+        filterfunc = self._make_filterfunc()
+
+        if self.remove:
+            rejected = {id(a) for a in ans if not filterfunc(a)}
+            if rejected:
+                vs = [a for a in getattr(state, self.analysis_kind) if id(a) not in rejected]
+                setattr(state, self.analysis_kind, vs)
+                ans = [a for a in ans if id(a) not in rejected]
+        else:
+            for a in ans:
+                if not filterfunc(a):
+                    a.temp_status = 'omit'
+
+        return ans
+
+    def _make_filterfunc(self):
         for fi in self.filters:
             fi.generate_evaluate_func()
 
@@ -238,15 +268,7 @@ class FilterNode(BaseNode):
                     flag = flag or b
             return flag
 
-        ans = getattr(state, self.analysis_kind)
-        if self.remove:
-            # vs = list(filter(filterfunc, getattr(state, self.analysis_kind)))
-            vs = [a for a in ans if filterfunc(a)]
-            setattr(state, self.analysis_kind, vs)
-        else:
-            for a in ans:
-                if not filterfunc(a):
-                    a.temp_status = 'omit'
+        return filterfunc
 
     def add_filter(self, attr, comp, crit):
         self.filters.append(PipelineFilter(attribute=attr, comparator=comp, criterion=crit))
@@ -201,7 +201,9 @@ class FindVerticalFluxNode(FindIrradiationNode):
 
     def _run_hook(self, state):
         if not self.use_saved_means:
-            monitors = self.dvc.find_flux_monitors(self.irradiation, state.levels, self.monitor_sample_name)
+            # the vertical flux only uses the monitors' F
+            monitors = self.dvc.find_flux_monitors(self.irradiation, state.levels, self.monitor_sample_name,
+                                                   calculate_f_only=True)
             state.unknowns = monitors
         state.use_saved_means = self.use_saved_means
 
@@ -45,6 +45,7 @@ class GroupingNode(BaseNode):
     attribute = Enum('Group', 'Graph', 'Tab', 'Aux')
     # _attr = 'group_id'
     _id_func = None
+    supports_append = True
 
     _sorting_enabled = True
     _cached_items = None
@@ -75,6 +76,13 @@ class GroupingNode(BaseNode):
     def run(self, state):
         self._run(state)
 
+    def append(self, state, ans):
+        # group ids are assigned in order of first appearance so regrouping everything leaves the ids of the
+        # previous analyses unchanged. grouping does not load anything and is cheap compared to plotting
+        self._run(state)
+        self._state = None
+        return ans
+
     def post_run(self, engine, state):
         self._state = None
 
@@ -137,6 +145,8 @@ class SubGroupingNode(GroupingNode, Preferred):
 
     _sorting_enabled = False
     _parent_group = 'group_id'
+    # compress_groups renumbers the subgroups of every analysis
+    supports_append = False
 
     def load(self, nodedict):
         self.by_key = nodedict.get('key', 'Aliquot')
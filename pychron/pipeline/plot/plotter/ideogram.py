@@ -32,7 +32,7 @@ from uncertainties import nominal_value, std_dev
 from pychron.core.helpers.formatting import floatfmt
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.core.stats.peak_detection import fast_find_peaks
-from pychron.core.stats.probability_curves import cumulative_probability, kernel_density
+from pychron.core.stats.probability_curves import cumulative_probability, kernel_density, asymptotic_limits
 from pychron.graph.explicit_legend import ExplicitLegend
 from pychron.graph.ticks import IntTickGenerator
 from pychron.pipeline.plot.overlays.ideogram_inset_overlay import IdeogramInset, IdeogramPointsInset
@@ -547,10 +547,7 @@ class Ideogram(BaseArArFigure):
                                     location=self.options.inset_location)
             plot.overlays.append(o)
 
-            def cfunc(x1, x2):
-                return cumulative_probability(self.xs, self.xes, x1, x2, n=N)
-
-            xs, ys, xmi, xma = self._calculate_asymptotic_limits(cfunc,
+            xs, ys, xmi, xma = self._calculate_asymptotic_limits(self.xs, self.xes,
                                                                  tol=self.options.asymptotic_height_percent)
             oo = IdeogramInset(xs, ys,
                                color=d['color'],
@@ -859,63 +856,29 @@ class Ideogram(BaseArArFigure):
 
         else:
             if opt.use_asymptotic_limits and calculate_limits:
-                def cfunc(x1, x2):
-                    return cumulative_probability(ages, errors, x1, x2, n=N)
-
-                bins, probs, x1, x2 = self._calculate_asymptotic_limits(cfunc,
+                bins, probs, x1, x2 = self._calculate_asymptotic_limits(ages, errors,
                                                                         tol=(opt.asymptotic_height_percent or 10))
                 self.trait_setq(xmi=x1, xma=x2)
 
                 return bins, probs
             else:
-                return cumulative_probability(ages, errors, xmi, xma, n=N)
+                return cumulative_probability(ages, errors, xmi, xma, n=N, refine=opt.probability_curve_refine)
 
     def _calculate_nominal_xlimits(self):
         return self.min_x(self.options.index_attr), self.max_x(self.options.index_attr)
 
-    def _calculate_asymptotic_limits(self, cfunc, max_iter=200, tol=10):
-        tol *= 0.01
-        rx1, rx2 = None, None
-        xs, ys = None, None
-        xmi, xma = self._calculate_nominal_xlimits()
-        x1, x2 = xmi, xma
-
-        step_percent = 0.005
-        step = step_percent * (xma - xmi)
-        # aw = int(asymptotic_width * N * 0.01)
-        for i in range(max_iter):
-            if rx1 is None:
-                x1 -= step
-            else:
-                x1 = rx1
-
-            if rx2 is None:
-                x2 += step
-            else:
-                x2 = rx2
-
-            # grow step size
-            step = step_percent * (x2 - x1)
-
-            xs, ys = cfunc(x1, x2)
-            tt = tol * ys.max()
-            if rx1 is None:
-                if ys[0] < tt:
-                    rx1 = x1
-
-            if rx2 is None:
-                if ys[-1] < tt:
-                    rx2 = x2
-
-            if rx1 is not None and rx2 is not None:
-                break
+    def _calculate_asymptotic_limits(self, ages, errors, tol=10):
+        """
+            returns xs, ys, xmi, xma
 
-        if rx1 is None:
-            rx1 = x1
-        if rx2 is None:
-            rx2 = x2
+            xmi, xma are the limits where the probability curve falls to tol% of its maximum
+        """
+        x1, x2 = asymptotic_limits(ages, errors, tol=tol * 0.01, n=N)
+        if x1 is None:
+            x1, x2 = self._calculate_nominal_xlimits()
 
-        return xs, ys, rx1, rx2
+        xs, ys = cumulative_probability(ages, errors, x1, x2, n=N, refine=self.options.probability_curve_refine)
+        return xs, ys, x1, x2
 
     def _calculate_asymptotic_limits2(self, cfunc, max_iter=200, asymptotic_width=10,
                                       tol=10):
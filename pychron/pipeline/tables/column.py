@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
-from traits.api import HasTraits, Bool, Str, Tuple, Either, Callable, List, Int
+from traits.api import HasTraits, Bool, Str, Tuple, Either, Callable, Dict, Int
 
 from pychron.core.helpers.formatting import floatfmt
 from pychron.pipeline.tables.util import value, error
@@ -27,7 +27,7 @@ class Column(HasTraits):
     units = Str
     func = Callable
     sigformat = Str
-    fformat = List
+    fformat = Dict
     use_scientific = Bool
     width = None
     calculated_width = None
@@ -0,0 +1,242 @@
+import os
+import re
+import shutil
+import tempfile
+import unittest
+import zipfile
+from datetime import datetime, timedelta
+from xml.etree import ElementTree
+
+from numpy import random
+from uncertainties import ufloat
+
+from pychron.globals import globalv
+from pychron.paths import paths
+from pychron.pipeline.tables.xlsx_table_options import XLSXAnalysisTableWriterOptions
+from pychron.pipeline.tables.xlsx_table_writer import XLSXAnalysisTableWriter
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+DETECTORS = {'Ar40': 'H1', 'Ar39': 'AX', 'Ar38': 'L1', 'Ar37': 'L2', 'Ar36': 'CDD'}
+NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+
+class MockArArConstants(object):
+    age_units = 'Ma'
+    atm4036 = ufloat(298.56, 0.31)
+
+
+class MockIsotope(object):
+    def __init__(self, name, rng):
+        self.name = name
+        self.detector = DETECTORS[name]
+        v = rng.uniform(1, 100)
+        self.uvalue = ufloat(v, v * 1e-3)
+        self.blank = MockBlank(rng)
+
+    def get_intensity(self):
+        return self.uvalue
+
+
+class MockBlank(object):
+    def __init__(self, rng):
+        self.uvalue = ufloat(rng.uniform(0, 0.1), 1e-3)
+
+
+class MockAnalysis(object):
+    arar_constants = MockArArConstants()
+    identifier = '66001'
+    sample = 'FC-2'
+    material = 'sanidine'
+    project = 'Test'
+    tag = 'ok'
+    irradiation_label = 'NM-300 A1'
+    lambda_k = ufloat(5.463e-10, 1.07e-12)
+    monitor_age = 28.201
+    monitor_name = 'FC-2'
+    monitor_material = 'sanidine'
+    interference_corrections = {}
+    production_ratios = {'Ca_K': 1.312, 'Cl_K': 0.255}
+
+    def __init__(self, i, rng):
+        self.aliquot_step_str = '{:02d}'.format(i)
+        self.isotopes = {k: MockIsotope(k, rng) for k in DETECTORS}
+        self.extract_value = rng.uniform(0, 5)
+        self.age = ufloat(rng.uniform(28, 29), rng.uniform(0.01, 0.1))
+        self.age_err_wo_j = self.age
+        self.kca = ufloat(rng.uniform(10, 100), rng.uniform(1, 5))
+        self.kcl = ufloat(rng.uniform(10, 100), rng.uniform(1, 5))
+        self.uF = ufloat(rng.uniform(1, 10), rng.uniform(0.01, 0.1))
+        self.radiogenic_yield = ufloat(rng.uniform(90, 100), 0.1)
+        self.display_k2o = ufloat(rng.uniform(1, 10), 0.1)
+        self.k2o = self.display_k2o
+        self.sensitivity = 1e-17
+        self.isochron3940 = ufloat(rng.uniform(0, 1), 1e-3)
+        self.isochron3640 = ufloat(rng.uniform(0, 1e-3), 1e-6)
+        self.discrimination = ufloat(1.01, 0.001)
+        self.j = ufloat(rng.uniform(1e-3, 1e-2), 1e-6)
+        self.ar39decayfactor = 1.001
+        self.ar37decayfactor = 1.2
+        self.rundate = datetime(2020, 1, 1) + timedelta(hours=i)
+        self.decay_days = rng.uniform(10, 100)
+        self.omitted = i % 7 == 6
+
+    def is_omitted(self):
+        return self.omitted
+
+    def get_ic_factor(self, det):
+        return ufloat(1.0, 0.001)
+
+
+class MockValue(object):
+    def __init__(self, v, kind='Weighted Mean'):
+        self.uvalue = v
+        self.value = v.nominal_value
+        self.error = v.std_dev
+        self.kind = kind
+        self.computed_kind = kind
+        self.error_kind = 'SEM'
+
+
+class MockGroup(object):
+    """
+    the parts of an analysis group used by the table writer
+    """
+    arar_constants = MockArArConstants()
+    material = 'sanidine'
+    flatlon = '35.0,-106.0'
+    unit = ''
+    location = ''
+    irradiation_label = 'NM-300 A1'
+    comments = ''
+    monitor_info = (28.201, 'Min et al., 2000')
+    integrated_enabled = True
+
+    def __init__(self, i, nanalyses, rng):
+        self.sample = 'S{:03d}'.format(i)
+        self.identifier = '{}'.format(66000 + i)
+        self.analyses = [MockAnalysis(j, rng) for j in range(nanalyses)]
+        self.nanalyses = self.total_n = nanalyses
+        self.nratio = '{}/{}'.format(nanalyses, nanalyses)
+        self.mswd = 1.1
+        self.weighted_age = self.arith_age = self.isochron_age = self.plateau_age = self.integrated_age = \
+            ufloat(28.2, 0.05)
+        self.isochron_4036 = ufloat(298.56, 1.0)
+        self.total_k2o = ufloat(5.0, 0.1)
+
+    def get_preferred_obj(self, attr):
+        return MockValue(ufloat(28.2, 0.05) if attr == 'age' else ufloat(50, 1))
+
+    def get_preferred_mswd_tuple(self):
+        return 1.1, True, self.nanalyses, 0.5
+
+    def isochron_mswd(self):
+        return 1.2, True, self.nanalyses, 0.4
+
+    def plateau_total_ar39(self):
+        return 100.
+
+    def scaled_age(self, a, units='Ma'):
+        return a
+
+
+def make_groups(ngroups, nanalyses, seed=3):
+    rng = random.RandomState(seed)
+    return [MockGroup(i, nanalyses, rng) for i in range(ngroups)]
+
+
+def read_sheet(path, name):
+    """
+    return {cell reference: text} of the sheet called ``name``
+    """
+    with zipfile.ZipFile(path) as zf:
+        names = zf.namelist()
+        workbook = ElementTree.fromstring(zf.read('xl/workbook.xml'))
+        idx = next(i for i, s in enumerate(workbook.iter('{}sheet'.format(NS))) if s.get('name') == name)
+
+        strings = []
+        if 'xl/sharedStrings.xml' in names:
+            sst = ElementTree.fromstring(zf.read('xl/sharedStrings.xml'))
+            strings = [''.join(t.text or '' for t in si.iter('{}t'.format(NS))) for si in sst]
+
+        sheet = ElementTree.fromstring(zf.read('xl/worksheets/sheet{}.xml'.format(idx + 1)))
+
+    cells = {}
+    for c in sheet.iter('{}c'.format(NS)):
+        kind = c.get('t')
+        if kind == 's':
+            txt = strings[int(c.find('{}v'.format(NS)).text)]
+        elif kind == 'inlineStr':
+            txt = ''.join(t.text or '' for t in c.iter('{}t'.format(NS)))
+        else:
+            v = c.find('{}v'.format(NS))
+            txt = v.text if v is not None else ''
+        cells[c.get('r')] = txt
+    return cells
+
+
+class XLSXTableWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        paths.build(self.root)
+        self.options = XLSXAnalysisTableWriterOptions('xlsx_table_test')
+        self.options.highlight_non_plateau = False
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, groups, name='table', **kw):
+        for k, v in kw.items():
+            setattr(self.options, k, v)
+
+        path = os.path.join(self.root, '{}.xlsx'.format(name))
+        writer = XLSXAnalysisTableWriter()
+        writer._options = self.options
+        writer._make_workbook({'unknowns': groups, 'machine_unknowns': groups}, path)
+        return writer, path
+
+    def test_format_interned(self):
+        writer = XLSXAnalysisTableWriter()
+        writer._new_workbook(os.path.join(self.root, 'formats.xlsx'))
+
+        a = writer._get_format(bold=True, bottom=1)
+        self.assertIs(a, writer._get_format({'bottom': 1}, bold=True))
+        self.assertIs(a, writer._get_format({'bottom': 1, 'bold': True, 'bg_color': None}))
+        self.assertIsNot(a, writer._get_format(bold=True))
+
+        b = writer._get_number_format(sig_figs=3, bold=True)
+        self.assertIs(b, writer._get_format(num_format='0.000', bold=True))
+        writer._workbook.close()
+
+    def test_format_count(self):
+        w, _ = self._write(make_groups(2, 5), 'small')
+        nsmall = len(w._workbook.formats)
+
+        w, _ = self._write(make_groups(10, 30), 'large')
+        self.assertEqual(len(w._workbook.formats), nsmall)
+        self.assertLess(nsmall, 100)
+
+    def test_constant_memory(self):
+        w, _ = self._write(make_groups(2, 5))
+        human, machine = w._workbook.worksheets()[:2]
+        self.assertFalse(human.constant_memory)
+        self.assertTrue(machine.constant_memory)
+        self.assertFalse(w._workbook.constant_memory)
+
+    def test_constant_memory_cells(self):
+        groups = make_groups(3, 10)
+        _, streamed = self._write(groups, 'streamed', machine_constant_memory=True)
+        _, inmemory = self._write(groups, 'inmemory', machine_constant_memory=False)
+
+        a = read_sheet(streamed, 'Unknowns (Machine)')
+        b = read_sheet(inmemory, 'Unknowns (Machine)')
+        self.assertEqual(a, b)
+
+        rows = {int(re.sub(r'[A-Z]+', '', k)) for k in a}
+        # title, column header and the analyses
+        self.assertEqual(len(rows), 1 + 3 + 10 * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -98,6 +98,7 @@ class XLSXAnalysisTableWriterOptions(BasePersistenceOptions):
     root_directory = dumpable(Directory)
     name = dumpable(Str('Untitled'))
     auto_view = dumpable(Bool(False))
+    machine_constant_memory = dumpable(Bool(True))
 
     unknown_note_name = dumpable(Str('Default'))
     available_unknown_note_names = List
@@ -290,6 +291,9 @@ Ages calculated relative to FC-2 Fish Canyon Tuff sanidine interlaboratory stand
                                 label='Sorting')
         appearence_grp = BorderVGroup(HGroup(Item('hide_gridlines', label='Hide Gridlines'),
                                              Item('repeat_header', label='Repeat Header')),
+                                      Item('machine_constant_memory', label='Stream Machine Sheet',
+                                           tooltip='Write the machine readable sheet to disk a row at a time '
+                                                   'to reduce memory use for large tables'),
                                       units_grp,
                                       sigma_grp,
                                       sort_grp,
@@ -49,10 +49,12 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
     _superscript = None
     _subscript = None
     _ital = None
+    _formats = None
     _options = Instance(XLSXAnalysisTableWriterOptions)
 
     def _new_workbook(self, path):
         self._workbook = xlsxwriter.Workbook(add_extension(path, '.xlsx'), {'nan_inf_to_errors': True})
+        self._formats = {}
 
     def build(self, groups, path=None, options=None):
         if options is None:
@@ -65,14 +67,25 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         self.debug('saving table to {}'.format(path))
         r_mkdir(os.path.dirname(path))
 
+        self._make_workbook(groups, path)
+
+        view = self._options.auto_view
+        if not view:
+            view = confirm(None, 'Table saved to {}\n\nView Table?'.format(path)) == YES
+
+        if view:
+            view_file(path, application='Excel')
+
+    # private
+    def _make_workbook(self, groups, path):
         self._new_workbook(path)
 
-        self._bold = self._workbook.add_format({'bold': True})
-        self._superscript = self._workbook.add_format({'font_script': 1})
-        self._subscript = self._workbook.add_format({'font_script': 2})
-        self._bsuperscript = self._workbook.add_format({'font_script': 1, 'bold': True})
-        self._bsubscript = self._workbook.add_format({'font_script': 2, 'bold': True})
-        self._ital = self._workbook.add_format({'italic': True})
+        self._bold = self._get_format(bold=True)
+        self._superscript = self._get_format(font_script=1)
+        self._subscript = self._get_format(font_script=2)
+        self._bsuperscript = self._get_format(font_script=1, bold=True)
+        self._bsubscript = self._get_format(font_script=2, bold=True)
+        self._ital = self._get_format(italic=True)
 
         unknowns = groups.get('unknowns')
         if unknowns:
@@ -105,14 +118,6 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
 
         self._workbook.close()
 
-        view = self._options.auto_view
-        if not view:
-            view = confirm(None, 'Table saved to {}\n\nView Table?'.format(path)) == YES
-
-        if view:
-            view_file(path, application='Excel')
-
-    # private
     def _get_detectors(self, grps):
         def rec_dets(dets, a):
             if isinstance(a, InterpretedAgeGroup):
@@ -255,7 +260,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         columns.extend([Column(visible=options.include_rundate,
                                label='RunDate', attr='rundate',
                                width=15,
-                               fformat=[('set_num_format', ('mm/dd/yy hh:mm',))]),
+                               fformat={'num_format': 'mm/dd/yy hh:mm'}),
                         Column(visible=options.include_time_delta,
                                label=(u'\u0394t', '<sup>3</sup>'),
                                units='(days)',
@@ -511,14 +516,14 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
 
     def _make_summary_sheet(self, unks):
         self._current_row = 1
-        sh = self._workbook.add_worksheet('Summary')
+        sh = self._add_worksheet('Summary')
         self._format_generic_worksheet(sh)
 
         cols = self._get_summary_columns()
         cols = [c for c in cols if c.visible]
         self._make_title(sh, 'Summary', cols)
 
-        fmt = self._workbook.add_format({'bottom': 1, 'align': 'center'})
+        fmt = self._get_format(bottom=1, align='center')
         sh.set_row(self._current_row, 5)
         self._current_row += 1
 
@@ -597,7 +602,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
     def _make_sheet(self, groups, name):
         self._current_row = 1
 
-        worksheet = self._workbook.add_worksheet(name)
+        worksheet = self._add_worksheet(name)
 
         cols = self._get_columns(name, groups)
         self._format_worksheet(worksheet, cols, (8, 2))
@@ -678,7 +683,8 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
 
     def _make_machine_sheet(self, groups, name):
         self._current_row = 1
-        worksheet = self._workbook.add_worksheet(name)
+        # rows are written in order so the sheet can be streamed to disk
+        worksheet = self._add_worksheet(name, constant_memory=self._options.machine_constant_memory)
 
         cols = self._get_machine_columns(name, groups)
         self._format_worksheet(worksheet, cols, (5, 2))
@@ -718,8 +724,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         except AttributeError:
             title = None
 
-        fmt = self._workbook.add_format({'font_size': 14, 'bold': True,
-                                         'bottom': 6 if not title else 0})
+        fmt = self._get_format(font_size=14, bold=True, bottom=6 if not title else 0)
 
         sh.write_string(self._current_row, 0, 'Table X. {}'.format(name), fmt)
         if title:
@@ -748,8 +753,8 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
     def _write_header(self, sh, cols, include_units=True):
         names, units = self._get_names_units(cols)
 
-        border = self._workbook.add_format({'bottom': 2, 'align': 'center'})
-        center = self._workbook.add_format({'align': 'center'})
+        border = self._get_format(bottom=2, align='center')
+        center = self._get_format(align='center')
         if include_units:
             t = ((names, False), (units, True))
         else:
@@ -816,14 +821,11 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         age_idx = next((i for i, c in enumerate(cols) if c.label == 'Age'), 0)
         cum_idx = next((i for i, c in enumerate(cols) if c.attr == 'cumulative_ar39'), 0)
 
-        fmt = self._get_number_format('summary_age')
-        kcafmt = self._get_number_format('summary_kca')
+        fmt = self._get_number_format('summary_age', bottom=1)
+        kcafmt = self._get_number_format('summary_kca', bottom=1)
 
-        fmt.set_bottom(1)
-        kcafmt.set_bottom(1)
-
-        fmt2 = self._workbook.add_format({'bottom': 1, 'bold': True})
-        border = self._workbook.add_format({'bottom': 1})
+        fmt2 = self._get_format(bottom=1, bold=True)
+        border = self._get_format(bottom=1)
 
         for i in range(age_idx + 1):
             sh.write_blank(row, i, '', fmt)
@@ -863,14 +865,17 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             sh.write_number(row, cum_idx, ag.valid_total_ar39(), fmt)
         self._current_row += 1
 
-    def _get_number_format(self, kind=None, use_scientific=False, sig_figs=2):
+    def _get_number_format(self, kind=None, use_scientific=False, sig_figs=2, **props):
+        fmt = self._get_num_format(kind, use_scientific, sig_figs)
+        return self._get_format(props, num_format=fmt)
+
+    def _get_num_format(self, kind=None, use_scientific=False, sig_figs=2):
         if kind:
             try:
                 sig_figs = getattr(self._options, '{}_sig_figs'.format(kind))
             except AttributeError as e:
                 sig_figs = self._options.sig_figs
 
-        fn = self._workbook.add_format()
         if use_scientific:
             fmt = '0.0E+00'
         else:
@@ -880,22 +885,55 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         # if not self._options.ensure_trailing_zeros:
         #     fmt = '{}#'.format(fmt)
 
-        fn.set_num_format(fmt)
-        return fn
+        return fmt
+
+    def _get_format(self, props=None, **kw):
+        """
+        return the format with ``props`` and ``kw``, properties that are None are ignored.
+
+        formats are interned so a table uses a handful of formats instead of one per cell. the returned format is
+        shared, never modify it
+        """
+        if props:
+            kw = dict(props, **kw)
+
+        key = tuple(sorted((k, v) for k, v in kw.items() if v is not None))
+        try:
+            fmt = self._formats[key]
+        except KeyError:
+            fmt = self._formats[key] = self._workbook.add_format(dict(key))
+        return fmt
+
+    def _add_worksheet(self, name, constant_memory=False):
+        """
+        add a worksheet. a constant memory worksheet is streamed to a temporary file a row at a time, so its rows
+        have to be written in order
+        """
+        wb = self._workbook
+        cm = wb.constant_memory
+        wb.constant_memory = constant_memory
+        try:
+            return wb.add_worksheet(name)
+        finally:
+            wb.constant_memory = cm
 
     def _make_analysis(self, sh, cols, item, is_last=False, is_plateau_step=None, cum=''):
         row = self._current_row
 
-        fmt = self._workbook.add_format()
+        props = {}
+        if is_last:
+            props['bottom'] = 1
 
         status = 'X' if item.is_omitted() else ''
-        highlight_color = self._options.highlight_color.name()
         if is_plateau_step is False:
-            fmt.set_bg_color(highlight_color)
-            sh.set_row(0, -1, fmt)
+            props['bg_color'] = self._options.highlight_color.name()
             if not status:
                 status = 'pX'
 
+        fmt = self._get_format(props)
+        if is_plateau_step is False:
+            sh.set_row(0, -1, fmt)
+
         sh.write(row, 0, status, fmt)
 
         pcfmt = None
@@ -908,23 +946,17 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             if self._options.use_standard_sigfigs:
                 if isinstance(c, SigFigColumn):
                     # get the txt from the next column to determine number of sigfigs
-                    cfmt = pcfmt = self._get_standard_sigfig_fmt(c, self._get_txt(item, cols[j + 2]))
+                    cfmt = pcfmt = self._get_standard_sigfig_fmt(c, self._get_txt(item, cols[j + 2]), **props)
                 elif isinstance(c, SigFigEColumn):
                     cfmt = pcfmt
                 else:
-                    cfmt = self._get_fmt(c)
+                    cfmt = self._get_fmt(c, **props)
             else:
-                cfmt = self._get_fmt(c)
+                cfmt = self._get_fmt(c, **props)
 
-            if cfmt:
-                if is_plateau_step is False:
-                    cfmt.set_bg_color(highlight_color)
-            else:
+            if not cfmt:
                 cfmt = fmt
 
-            if is_last:
-                cfmt.set_bottom(1)
-
             if c.label in ('N', 'Power'):
                 sh.write(row, j + 1, txt, cfmt)
             elif c.label == 'RunDate':
@@ -943,8 +975,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         fmt = self._bold
         start_col = 0
         if self._options.include_summary_kca:
-            nfmt = self._get_number_format('summary_kca')
-            nfmt.set_bold(True)
+            nfmt = self._get_number_format('summary_kca', bold=True)
 
             kcalabel = 'Ca/K' if self._options.invert_kca_kcl else 'K/Ca'
             idx = next((i for i, c in enumerate(cols) if c.label == kcalabel))
@@ -973,8 +1004,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             sh.write_string(self._current_row, idx + 2, pv.error_kind, fmt)
             self._current_row += 1
 
-        nfmt = self._get_number_format('summary_age')
-        nfmt.set_bold(True)
+        nfmt = self._get_number_format('summary_age', bold=True)
 
         idx = next((i for i, c in enumerate(cols) if c.label == 'Age'))
 
@@ -1052,15 +1082,14 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
                                  self._bold, 'Ar)',
                                  self._bsubscript, 'trapped',
                                  self._bold, ' {}'.format(PLUSMINUS_NSIGMA.format(nsigma)))
-            nfmt = self._get_number_format()
-            nfmt.set_bold(True)
+            nfmt = self._get_number_format(bold=True)
             sh.write_number(self._current_row, idx, trapped_value, nfmt)
             sh.write_number(self._current_row, idx + 1, trapped_error * nsigma, nfmt)
 
             self._current_row += 1
 
     def _make_notes(self, groups, sh, ncols, name):
-        top = self._workbook.add_format({'top': 1, 'bold': True})
+        top = self._get_format(top=1, bold=True)
 
         sh.write_string(self._current_row, 0, 'Notes:', top)
         for i in range(1, ncols):
@@ -1141,7 +1170,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         units = [c.units for c in cols]
         return names, units
 
-    def _get_standard_sigfig_fmt(self, col, txt):
+    def _get_standard_sigfig_fmt(self, col, txt, **props):
         try:
             kind = None
             sf = math.ceil((abs(math.log10(txt))))
@@ -1149,22 +1178,20 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             kind = col.sigformat
             sf = 2
 
-        fmt = self._get_number_format(kind=kind, use_scientific=col.use_scientific, sig_figs=sf)
+        fmt = self._get_num_format(kind=kind, use_scientific=col.use_scientific, sig_figs=sf)
 
         if txt >= 1:
-            fmt.set_num_format('0')
+            fmt = '0'
 
-        return fmt
+        return self._get_format(props, num_format=fmt)
 
-    def _get_fmt(self, col):
+    def _get_fmt(self, col, **props):
         fmt = None
         if col.sigformat:
-            fmt = self._get_number_format(col.sigformat, col.use_scientific)
+            fmt = self._get_number_format(col.sigformat, col.use_scientific, **props)
 
         elif col.fformat:
-            fmt = self._workbook.add_format()
-            for cmd, args in col.fformat:
-                getattr(fmt, cmd)(*args)
+            fmt = self._get_format(col.fformat, **props)
 
         return fmt
 
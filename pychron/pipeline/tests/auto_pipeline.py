@@ -0,0 +1,236 @@
+import unittest
+from contextlib import contextmanager
+from datetime import datetime
+
+from traits.api import Any
+from uncertainties import ufloat
+
+from pychron.globals import globalv
+from pychron.pipeline.engine import Pipeline, PipelineEngine
+from pychron.pipeline.nodes.data import ListenUnknownNode
+from pychron.pipeline.nodes.figure import IdeogramNode
+from pychron.pipeline.nodes.filter import FilterNode
+from pychron.pipeline.nodes.grouping import GroupingNode, SubGroupingNode
+from pychron.pipeline.state import EngineState
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+
+class MockChange(object):
+    def __init__(self, tag='ok'):
+        self.tag = tag
+        self.timestamp = datetime.now()
+
+
+class MockRecord(object):
+    def __init__(self, i, identifier='66000', age=28.2):
+        self.record_id = '{}-{:02d}'.format(identifier, i)
+        self.uuid = 'uuid-{}'.format(self.record_id)
+        self.identifier = identifier
+        self.age = age
+        self.change = MockChange()
+
+
+class MockAnalysis(object):
+    def __init__(self, record):
+        self.record_id = record.record_id
+        self.uuid = record.uuid
+        self.identifier = record.identifier
+        self.tag = record.change.tag
+        self.uage = ufloat(record.age, 0.1)
+        self.temp_status = ''
+        self.group_id = 0
+        self.graph_id = 0
+        self.tab_id = 0
+
+
+class MockDVC(object):
+    def __init__(self, records):
+        self.records = records
+        self.loaded = []
+        self.invalidated = []
+        self.fail = set()
+
+    @contextmanager
+    def session_ctx(self, *args, **kw):
+        yield
+
+    def get_analyses_by_date_range(self, *args, **kw):
+        return list(self.records)
+
+    def make_analyses(self, records):
+        self.loaded.extend(r.record_id for r in records)
+        return [MockAnalysis(r) for r in records if r.record_id not in self.fail]
+
+    def invalidate_cache(self, uuids):
+        self.invalidated.extend(uuids)
+
+
+class MockEditor(object):
+    def __init__(self):
+        self.name = 'Ideogram'
+        self.items = []
+        self.nset = 0
+        self.refresh_needed = False
+
+    def set_items(self, items):
+        self.items = items
+        self.nset += 1
+
+
+class MockListenUnknownNode(ListenUnknownNode):
+    dvc = Any
+
+
+class MockIdeogramNode(IdeogramNode):
+    editor_klass = MockEditor
+
+
+def make_node(records):
+    node = MockListenUnknownNode(dvc=MockDVC(records))
+    node._low = datetime.now()
+    return node
+
+
+class LoadAnalysesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.records = [MockRecord(i) for i in range(5)]
+        self.node = make_node(self.records)
+        self.dvc = self.node.dvc
+        self.node._load_analyses()
+        self.dvc.loaded = []
+
+    def test_initial(self):
+        node = make_node(self.records)
+        ans, updated = node._load_analyses()
+        self.assertTrue(updated)
+        self.assertEqual(len(ans), 5)
+        self.assertEqual(node._added, ans)
+        self.assertEqual(node._removed, [])
+
+    def test_unchanged(self):
+        ans, updated = self.node._load_analyses()
+        self.assertFalse(updated)
+        self.assertEqual(self.dvc.loaded, [])
+        self.assertEqual(len(ans), 5)
+
+    def test_new(self):
+        previous = list(self.node._cached_unknowns)
+        self.records.append(MockRecord(5))
+        ans, updated = self.node._load_analyses()
+
+        self.assertTrue(updated)
+        self.assertEqual(self.dvc.loaded, ['66000-05'])
+        self.assertEqual(ans[:5], previous)
+        self.assertEqual([a.record_id for a in self.node._added], ['66000-05'])
+        self.assertEqual(self.node._removed, [])
+
+    def test_changed(self):
+        previous = self.node._cached_unknowns[2]
+        self.records[2].change = MockChange('invalid')
+        ans, updated = self.node._load_analyses()
+
+        self.assertTrue(updated)
+        self.assertEqual(self.dvc.loaded, ['66000-02'])
+        self.assertEqual(self.dvc.invalidated, ['uuid-66000-02'])
+        self.assertEqual(ans[2].tag, 'invalid')
+        self.assertEqual(self.node._removed, [previous])
+
+    def test_removed(self):
+        previous = self.node._cached_unknowns[0]
+        self.records.pop(0)
+        ans, updated = self.node._load_analyses()
+
+        self.assertTrue(updated)
+        self.assertEqual(self.dvc.loaded, [])
+        self.assertEqual(self.node._added, [])
+        self.assertEqual(self.node._removed, [previous])
+
+    def test_failed_load_retried(self):
+        self.records.append(MockRecord(5))
+        self.dvc.fail.add('66000-05')
+        ans, updated = self.node._load_analyses()
+        self.assertFalse(updated)
+        self.assertEqual(len(ans), 5)
+
+        self.dvc.fail.clear()
+        ans, updated = self.node._load_analyses()
+        self.assertTrue(updated)
+        self.assertEqual(self.dvc.loaded, ['66000-05', '66000-05'])
+        self.assertEqual(len(ans), 6)
+
+
+class AppendPipelineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.records = [MockRecord(i, identifier='6600{}'.format(i % 2)) for i in range(6)]
+        self.listen = make_node(self.records)
+
+        self.filter = FilterNode(remove=True)
+        self.filter.load({'filters': ['age>0']})
+        self.grouping = GroupingNode(by_key='Identifier', attribute='Tab')
+        self.figure = MockIdeogramNode()
+        self.figure.plotter_options = object()
+
+        self.engine = PipelineEngine()
+        self.pipeline = Pipeline(nodes=[self.listen, self.filter, self.grouping, self.figure])
+        self.state = EngineState()
+
+        # previous run
+        unks, _ = self.listen._load_analyses()
+        self.state.unknowns = unks
+        for node in (self.filter, self.grouping):
+            node.run(self.state)
+
+        for tab_id, ans in self.grouping_items():
+            editor = MockEditor()
+            editor.set_items(ans)
+            self.figure.editors[tab_id] = editor
+            self.state.editors.append(editor)
+
+    def grouping_items(self):
+        d = {}
+        for a in self.state.unknowns:
+            d.setdefault(a.tab_id, []).append(a)
+        return d.items()
+
+    def _append(self, *records):
+        self.records.extend(records)
+        self.listen.dvc.loaded = []
+        unks, updated = self.listen._load_analyses()
+        self.assertTrue(updated)
+        return self.engine.append_pipeline(self.listen._added, pipeline=self.pipeline, state=self.state)
+
+    def test_append(self):
+        self.assertTrue(self._append(MockRecord(6, identifier='66001')))
+
+        self.assertEqual(self.listen.dvc.loaded, ['66001-06'])
+        self.assertEqual(len(self.state.unknowns), 7)
+
+        e0, e1 = self.figure.editors[0], self.figure.editors[1]
+        # only the editor of the tab the analysis was added to is updated
+        self.assertEqual(e0.nset, 1)
+        self.assertEqual(e1.nset, 2)
+        self.assertEqual([a.record_id for a in e1.items][-1], '66001-06')
+
+    def test_append_new_tab(self):
+        self.assertTrue(self._append(MockRecord(6, identifier='66002')))
+
+        self.assertEqual(len(self.figure.editors), 3)
+        self.assertEqual(self.state.unknowns[-1].tab_id, 2)
+        self.assertEqual(self.figure.editors[0].nset, 1)
+
+    def test_append_filtered(self):
+        self.assertTrue(self._append(MockRecord(6, identifier='66001', age=-1)))
+
+        self.assertEqual(len(self.state.unknowns), 6)
+        self.assertEqual(self.figure.editors[1].nset, 1)
+
+    def test_append_not_supported(self):
+        self.pipeline.nodes.insert(3, SubGroupingNode())
+        self.assertFalse(self._append(MockRecord(6, identifier='66001')))
+        self.assertEqual(len(self.state.unknowns), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
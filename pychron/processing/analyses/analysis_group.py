@@ -29,6 +29,7 @@ from pychron.experiment.utilities.runid import make_aliquot
 from pychron.processing.analyses.analysis import IdeogramPlotable
 from pychron.processing.analyses.preferred import Preferred
 from pychron.processing.arar_age import ArArAge
+from pychron.processing.batch_age import calculate_analyses
 from pychron.processing.argon_calculations import calculate_plateau_age, age_equation, calculate_isochron
 from pychron.pychron_constants import MSEM, SD, SUBGROUPING_ATTRS, ERROR_TYPES, WEIGHTED_MEAN, \
     DEFAULT_INTEGRATED, SUBGROUPINGS, ARITHMETIC_MEAN, PLATEAU_ELSE_WEIGHTED_MEAN, WEIGHTINGS, FLECK, NULL_STR, \
@@ -171,6 +172,17 @@ class AnalysisGroup(IdeogramPlotable):
 
             self.age_units = self.arar_constants.age_units
 
+            self._calculate_missing_ages(new)
+
+    def _calculate_missing_ages(self, ans):
+        """
+        calculate the ages of analyses loaded with ``calculate_f_only``, e.g. flux monitors, together. the group
+        statistics only use the nominal ages and their errors
+        """
+        ans = [a for a in ans if isinstance(a, ArArAge) and a.F and not a.age]
+        if ans:
+            calculate_analyses(ans)
+
     def attr_stats(self, attr):
         w, sd, sem, (vs, es) = self._calculate_weighted_mean(attr, error_kind='both')
         mi, ma, total_dev, mswd, valid_mswd = 0, 0, 0, 0, False
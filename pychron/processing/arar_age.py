@@ -101,6 +101,7 @@ class ArArAge(IsotopeGroup):
     _kca_warning = False
     _kcl_warning = False
     _lambda_k = None
+    _age_intercepts = None
 
     discrimination = None
     weight = 0  # in milligrams
@@ -376,6 +377,24 @@ class ArArAge(IsotopeGroup):
             self._calculate_kca()
             self._calculate_kcl()
 
+    def update_age(self, tol=1e-4):
+        """
+            recalculate the age only if an isotope or baseline intercept changed by more than ``tol``
+            (relative) since the age was last updated. returns True if the age was recalculated
+        """
+        cur = {k: (iso.value, iso.baseline.value) for k, iso in self.isotopes.items()}
+        last = self._age_intercepts
+        if last is not None and last.keys() == cur.keys():
+            for k, vs in cur.items():
+                if any(abs(v - lv) > tol * abs(lv) for v, lv in zip(vs, last[k])):
+                    break
+            else:
+                return False
+
+        self.calculate_age(force=True)
+        self._age_intercepts = cur
+        return True
+
     def calculate_decay_factors(self):
         arc = self.arar_constants
         # only calculate decayfactors once
@@ -19,7 +19,7 @@
 # ============= standard library imports ========================
 import math
 
-from numpy import asarray, average, array
+from numpy import asarray, average, array, exp, expm1, errstate, isfinite, where
 from uncertainties import ufloat, umath, nominal_value, std_dev
 
 from pychron.core.stats.core import calculate_weighted_mean
@@ -261,6 +261,32 @@ def calculate_arar_decay_factors(dc37, dc39, segments, use_mh=True):
     return df37, df39
 
 
+def calculate_arar_decay_factors_vectorized(dc37, dc39, powers, durations, dts):
+    """
+        McDougall and Harrison decay factors (see ``calculate_arar_decay_factors``) for many analyses at once
+
+        ``powers`` and ``durations`` (days) have one value per irradiation segment. ``dts`` is the time (days)
+        between each segment and each analysis with shape (nanalyses, nsegments).
+
+        returns arrays of df37 and df39, one value per analysis. a factor that cannot be calculated is 1.0.
+        the factors agree with ``calculate_arar_decay_factors`` to ~1e-10 (relative)
+    """
+    powers = asarray(powers, dtype=float)
+    durations = asarray(durations, dtype=float)
+    dts = asarray(dts, dtype=float)
+
+    tpower = (powers * durations).sum()
+
+    def factor(dc):
+        with errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # expm1 avoids the cancellation in 1-exp(-dc*t) for the small Ar39 decay constant
+            b = (powers * (-expm1(-dc * durations) / (dc * exp(dc * dts)))).sum(axis=-1)
+            df = tpower / b
+        return where(isfinite(df) & (b != 0), df, 1.0)
+
+    return factor(dc37), factor(dc39)
+
+
 def abundance_sensitivity_correction(isos, abundance_sensitivity):
     s40, s39, s38, s37, s36 = isos
     # correct for abundance sensitivity
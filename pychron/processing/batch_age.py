@@ -0,0 +1,359 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+float based F and age calculation for many analyses at once.
+
+``calculate_f`` and ``age_equation`` in argon_calculations propagate errors with ``uncertainties``, one analysis
+at a time. the functions here evaluate the same equations on arrays with one row per analysis and propagate the
+errors with the same first order (linear) approximation.
+
+the derivatives are computed with the complex step method. every input with an error is perturbed by a tiny
+imaginary step in its own row of a (ninputs, nanalyses) complex array so one evaluation returns the value and
+the exact derivative with respect to every input.
+
+the inputs are treated as independent. analyses whose isotopes share, for example, a discrimination factor are
+calculated with the uncertainties path so the correlation is kept.
+"""
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import array, asarray, broadcast_to, zeros, where, errstate, log, abs as nabs
+from uncertainties import ufloat, nominal_value, std_dev
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.iterfuncs import groupby_key
+from pychron.processing.arar_constants import ArArConstants
+from pychron.pychron_constants import ARGON_KEYS
+
+PR_KEYS = ('K4039', 'K3839', 'K3739', 'Ca3937', 'Ca3837', 'Ca3637', 'Cl3638')
+ISOTOPE_KEYS = ('a40', 'a39', 'a38', 'a37', 'a36')
+
+
+def _value_error(v, n):
+    """
+    return (values, errors) arrays of length n for a scalar, ufloat, (value, error) tuple or array
+    """
+    if isinstance(v, tuple):
+        vs, es = v
+    else:
+        vs, es = nominal_value(v), std_dev(v)
+
+    vs = broadcast_to(asarray(vs, dtype=float), (n,))
+    es = broadcast_to(asarray(es, dtype=float), (n,))
+    return vs, es
+
+
+def _values_errors(vs):
+    vs = list(vs)
+    return array([nominal_value(v) for v in vs], dtype=float), array([std_dev(v) for v in vs], dtype=float)
+
+
+def _complex_step(func, variables, n, **kw):
+    """
+    evaluate ``func`` with complex arrays and return (value, {name: d(value)/d(name) * error(name)})
+    """
+    names = list(variables)
+    nv = len(names)
+    zs = {}
+    steps = []
+    for k, name in enumerate(names):
+        v, _ = variables[name]
+        h = where(v == 0, 1, nabs(v)) * 1e-20
+        z = zeros((nv, n), dtype=complex)
+        z.real = v
+        z.imag[k] = h
+        zs[name] = z
+        steps.append(h)
+
+    with errstate(divide='ignore', invalid='ignore'):
+        r = func(**zs, **kw)
+
+    comps = {name: r[k].imag / steps[k] * variables[name][1] for k, name in enumerate(names)}
+    return r[0].real, comps
+
+
+def _f(a40, a39, a38, a37, a36, K4039, K3839, K3739, Ca3937, Ca3837, Ca3637, Cl3638, atm4036, fixed_k3739,
+       decay_days, df37, df39, arar_constants):
+    """
+    the equations of argon_calculations.calculate_f on complex arrays
+    """
+    arc = arar_constants
+
+    s = arc.abundance_sensitivity
+    if s:
+        a40, a39, a38, a37, a36 = (a40 - s * (a39 + a39),
+                                   a39 - s * (a40 + a38),
+                                   a38 - s * (a39 + a37),
+                                   a37 - s * (a38 + a36),
+                                   a36 - s * (a37 + a37))
+
+    a39 = a39 * df39
+    a37 = a37 * df37
+
+    # interference_corrections
+    if arc.k3739_mode.lower() == 'normal' and fixed_k3739 is None:
+        k39 = (a39 - Ca3937 * a37) / (1 - K3739 * Ca3937)
+        k37 = K3739 * k39
+        ca37 = a37 - k37
+        ca39 = Ca3937 * ca37
+    else:
+        x = fixed_k3739
+        y = where(Ca3937.real == 0, 1, 1 / Ca3937)
+        ca37 = (a39 * x * y) / (x + y)
+        ca39 = Ca3937 * ca37
+        k39 = a39 - ca39
+
+    k38 = K3839 * k39
+    if not arc.allow_negative_ca_correction:
+        ca37 = where(ca37.real < 0, 0, ca37)
+
+    ca36 = Ca3637 * ca37
+    ca38 = Ca3837 * ca37
+
+    # calculate_atmospheric
+    m = Cl3638 * nominal_value(arc.lambda_Cl36) * decay_days
+    atm3836 = nominal_value(arc.atm3836)
+    atm36 = (a36 - ca36 - m * (a38 - k38 - ca38)) / (1 - m * atm3836)
+
+    atm40 = atm36 * atm4036
+    k40 = k39 * K4039
+    rad40 = a40 - atm40 - k40
+    return where(k39.real == 0, 1, rad40 / k39)
+
+
+def calculate_f_batch(values, errors, decay_days=0, production_ratios=None, arar_constants=None,
+                      ar37decayfactor=1, ar39decayfactor=1, fixed_k3739=False, atm4036=None):
+    """
+    calculate F for N analyses
+
+    values, errors: (N, 5) arrays of the Ar40, Ar39, Ar38, Ar37, Ar36 intensities. see ``get_intensities``
+    decay_days, ar37decayfactor, ar39decayfactor: scalars or arrays of length N
+    production_ratios: dict of ufloats, floats, (value, error) tuples or (values, errors) arrays of length N.
+        missing ratios are 0
+    fixed_k3739, atm4036: override the arar_constants values. same types as the production ratios
+
+    returns F, F_err, F_err_wo_irrad arrays. F_err_wo_irrad excludes the production ratio errors
+    """
+    values = asarray(values, dtype=float)
+    errors = asarray(errors, dtype=float)
+    n = values.shape[0]
+
+    if arar_constants is None:
+        arar_constants = ArArConstants()
+    if production_ratios is None:
+        production_ratios = {}
+
+    variables = {k: (values[:, i], errors[:, i]) for i, k in enumerate(ISOTOPE_KEYS)}
+    for k in PR_KEYS:
+        variables[k] = _value_error(production_ratios.get(k, 0), n)
+    if atm4036 is None:
+        atm4036 = arar_constants.atm4036
+    variables['atm4036'] = _value_error(atm4036, n)
+
+    if arar_constants.k3739_mode.lower() != 'normal' or fixed_k3739:
+        if not fixed_k3739:
+            fixed_k3739 = arar_constants.fixed_k3739
+        variables['fixed_k3739'] = _value_error(fixed_k3739, n)
+        kw = {}
+    else:
+        kw = {'fixed_k3739': None}
+
+    f, comps = _complex_step(_f, variables, n,
+                             decay_days=broadcast_to(asarray(decay_days, dtype=float), (n,)),
+                             df37=broadcast_to(asarray(ar37decayfactor, dtype=float), (n,)),
+                             df39=broadcast_to(asarray(ar39decayfactor, dtype=float), (n,)),
+                             arar_constants=arar_constants, **kw)
+
+    var_wo_irrad = sum(v ** 2 for k, v in comps.items() if k not in PR_KEYS)
+    var = var_wo_irrad + sum(comps[k] ** 2 for k in PR_KEYS)
+    return f, var ** 0.5, var_wo_irrad ** 0.5
+
+
+def age_equation_batch(j, f, j_err=0, f_err=0, lambda_k=None, arar_constants=None):
+    """
+    the age equation for arrays of J and F
+
+    returns age, age_err in the age units of ``arar_constants``
+    """
+    if arar_constants is None:
+        arar_constants = ArArConstants()
+    if not lambda_k:
+        lambda_k = arar_constants.lambda_k
+    lambda_k = nominal_value(lambda_k)
+
+    j, f = asarray(j, dtype=float), asarray(f, dtype=float)
+    x = 1 + j * f
+    valid = x > 0
+    x = where(valid, x, 1)
+
+    age = log(x) / lambda_k
+    dage = 1 / (lambda_k * x)
+    err = ((dage * j * f_err) ** 2 + (dage * f * j_err) ** 2) ** 0.5
+
+    s = arar_constants.scale_age(1, current='a')
+    return where(valid, age * s, 0), where(valid, err * s, 0)
+
+
+def get_intensities(analysis):
+    """
+    return the values and errors of the Ar40-Ar36 intensities of ``analysis``, as ``Isotope.get_intensity``
+    calculates them, or None if an isotope is missing
+    """
+    isotopes = analysis.isotopes
+    mapping = analysis.arar_mapping
+    try:
+        isos = [isotopes[mapping[k]] for k in ARGON_KEYS]
+    except KeyError:
+        return
+
+    vs, es = [], []
+    for iso in isos:
+        v, e = iso.value, iso.error
+        bv, be = iso.baseline.value, iso.baseline.error
+        v -= bv
+        var = e ** 2
+        if iso.include_baseline_error:
+            var += be ** 2
+
+        faraday = iso.detector.lower() == 'faraday'
+        if iso.correct_for_blank and not faraday:
+            v -= iso.blank.value
+            var += iso.blank.error ** 2
+
+        if iso.background:
+            v -= iso.background.value
+            var += iso.background.error ** 2
+
+        # a missing ic_factor (None or a zero value) is treated as 1, as it is by get_intensity
+        for c in (iso.discrimination, iso.ic_factor or None):
+            if c is None:
+                continue
+            cv, ce = nominal_value(c), std_dev(c)
+            var = var * cv ** 2 + (v * ce) ** 2
+            v *= cv
+
+        if faraday:
+            v -= iso.blank.value
+            var += iso.blank.error ** 2
+
+        vs.append(v)
+        es.append(var ** 0.5)
+
+    return vs, es
+
+
+def has_correlated_inputs(analysis):
+    """
+    return True if two of the Ar40-Ar36 isotopes of ``analysis`` share a discrimination or ic_factor with an error.
+    the batch calculator treats the isotopes as independent so it would drop the correlation
+    """
+    isotopes = analysis.isotopes
+    mapping = analysis.arar_mapping
+    seen = set()
+    for k in ARGON_KEYS:
+        iso = isotopes[mapping[k]]
+        for c in (iso.discrimination, iso.ic_factor or None):
+            if c is not None and std_dev(c):
+                if id(c) in seen:
+                    return True
+                seen.add(id(c))
+    return False
+
+
+def _constants_key(a):
+    arc = a.arar_constants
+    return (bool(a.fixed_k3739), arc.k3739_mode.lower(), arc.allow_negative_ca_correction, arc.abundance_sensitivity,
+            nominal_value(arc.lambda_Cl36), nominal_value(arc.atm3836), nominal_value(arc.lambda_k), arc.age_units)
+
+
+def calculate_analyses(analyses, calculate_f_only=False):
+    """
+    set uF, F, F_err and F_err_wo_irrad and, unless ``calculate_f_only``, the age attributes (uage, age, age_err,
+    uage_w_j_err and uage_w_position_err) of ``analyses`` using the batch calculator.
+
+    the other attributes set by ``ArArAge.calculate_age``, e.g. the computed values and error components, are not
+    set and uF is not correlated with the isotopes. analyses missing an isotope or with correlated inputs (see
+    ``has_correlated_inputs``) are calculated with the uncertainties path.
+
+    returns the analyses that were calculated
+    """
+    rows = []
+    for a in analyses:
+        a.calculate_decay_factors()
+        r = get_intensities(a)
+        if r is None or has_correlated_inputs(a):
+            if calculate_f_only:
+                a.calculate_f()
+            else:
+                a.calculate_age()
+        else:
+            rows.append((a, r))
+
+    # analyses with equal constants are calculated together
+    for _, gs in groupby_key(rows, key=lambda r: _constants_key(r[0])):
+        gs = list(gs)
+        ans = [a for a, _ in gs]
+        arc = ans[0].arar_constants
+
+        values = array([r[0] for _, r in gs])
+        errors = array([r[1] for _, r in gs])
+        prs = {k: _values_errors(a.interference_corrections.get(k, 0) for a in ans) for k in PR_KEYS}
+
+        fixed_k3739 = False
+        if ans[0].fixed_k3739:
+            fixed_k3739 = _values_errors(a.fixed_k3739 for a in ans)
+
+        # the trapped 40/36 is set per analysis, e.g. from an isochron
+        atm4036 = _values_errors(a.arar_constants.atm4036 for a in ans)
+
+        fs, fes, fwes = calculate_f_batch(values, errors,
+                                          decay_days=[a.decay_days for a in ans],
+                                          production_ratios=prs,
+                                          arar_constants=arc,
+                                          ar37decayfactor=[a.ar37decayfactor for a in ans],
+                                          ar39decayfactor=[a.ar39decayfactor for a in ans],
+                                          fixed_k3739=fixed_k3739,
+                                          atm4036=atm4036)
+
+        for a, f, fe, fwe in zip(ans, fs, fes, fwes):
+            a.uF = ufloat(f, fe)
+            a.F = f
+            a.F_err = fe
+            a.F_err_wo_irrad = fwe
+
+        if calculate_f_only:
+            continue
+
+        js = array([nominal_value(a.j) if a.j is not None else 0 for a in ans])
+        jes = array([std_dev(a.j) if a.j is not None else 0 for a in ans])
+        pjes = array([a.position_jerr or 0 for a in ans])
+
+        age, err = age_equation_batch(js, fs, f_err=fes, arar_constants=arc)
+        _, jerr = age_equation_batch(js, fs, j_err=jes, f_err=fes, arar_constants=arc)
+        _, perr = age_equation_batch(js, fs, j_err=pjes, f_err=fes, arar_constants=arc)
+        for i, a in enumerate(ans):
+            if a.j is None:
+                continue
+            a.uage = ufloat(age[i], err[i])
+            a.uage_w_j_err = ufloat(age[i], jerr[i])
+            a.uage_w_position_err = ufloat(age[i], perr[i])
+            a.age = age[i]
+            a.age_err = err[i]
+            a.age_err_wo_j = err[i]
+
+    return [a for a, _ in rows]
+
+
+# ============= EOF =============================================
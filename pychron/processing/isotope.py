@@ -24,15 +24,16 @@ from binascii import hexlify
 from math import isnan, isinf
 
 import six
-from numpy import array, Inf, polyfit, gradient, array_split, mean
+from numpy import array, Inf, polyfit, gradient, array_split, mean, append as npappend
 from uncertainties import ufloat, nominal_value, std_dev
 
 from pychron.core.geometry.geometry import curvature_at
-from pychron.core.helpers.binpack import unpack
+from pychron.core.helpers.binpack import unpack_array, pack_arrays
 from pychron.core.helpers.fits import natural_name_fit, fit_to_degree
 from pychron.core.regression.least_squares_regressor import ExponentialRegressor, FitError, LeastSquaresRegressor
 from pychron.core.regression.mean_regressor import MeanRegressor
 from pychron.core.regression.ols_regressor import PolynomialRegressor
+from pychron.core.regression.running_regressor import RunningRegressor
 
 
 def fit_abbreviation(fit, ):
@@ -83,6 +84,10 @@ class BaseMeasurement(object):
         # if self._regressor:
         #     self._regressor.dirty = True
 
+    def append_data(self, x, y):
+        self.xs = npappend(self.xs, x)
+        self.ys = npappend(self.ys, y)
+
     def get_data(self):
         xs = self.offset_xs
         ys = self.ys
@@ -98,7 +103,7 @@ class BaseMeasurement(object):
             endianness = self.endianness
 
         fmt = '{}ff'.format(endianness)
-        txt = b''.join((struct.pack(fmt, x, y) for x, y in zip(self.xs, self.ys)))
+        txt = pack_arrays(fmt, self.xs, self.ys)
         if as_hex:
             txt = hexlify(txt)
         return txt
@@ -116,8 +121,8 @@ class BaseMeasurement(object):
         if n_only:
             self.n = len(xs)
         else:
-            self.xs = array(xs)
-            self.ys = array(ys)
+            self.xs = array(xs, dtype=float)
+            self.ys = array(ys, dtype=float)
 
             # print self.name, self.xs.shape, self.ys.shape
             # print self.name, self.ys
@@ -127,7 +132,7 @@ class BaseMeasurement(object):
             endianness = self.endianness
 
         try:
-            x, y = unpack(blob, fmt='{}ff'.format(endianness))
+            x, y = unpack_array(blob, fmt='{}ff'.format(endianness))
             # x, y = zip(*[struct.unpack('{}ff'.format(endianness), blob[i:i + 8]) for i in range(0, len(blob), 8)])
             if self.reverse_unpack:
                 return y, x
@@ -186,10 +191,37 @@ class IsotopicMeasurement(BaseMeasurement):
 
     _fn = None
 
+    incremental = False
+    _running = None
+    _running_offset = None
+    _running_last = None
+
     def __init__(self, *args, **kw):
         super(IsotopicMeasurement, self).__init__(*args, **kw)
         self.filter_outliers_dict = dict()
 
+    def set_incremental(self, v):
+        """
+        v: bool. if True value and error are taken from running sums updated as data is appended
+        whenever the fit allows it
+        """
+        self.incremental = v
+        self._running = None
+
+    def append_data(self, x, y):
+        super(IsotopicMeasurement, self).append_data(x, y)
+        r = self._running
+        if r is not None:
+            if r.n == self.xs.shape[0] - 1:
+                r.add(x - self.time_zero_offset, y)
+                self._running_last = x, y
+            else:
+                self._running = None
+
+    def unpack_data(self, *args, **kw):
+        self._running = None
+        super(IsotopicMeasurement, self).unpack_data(*args, **kw)
+
     def get_linear_rsquared(self):
         from pychron.core.regression.ols_regressor import OLSRegressor
         reg = OLSRegressor(fit='linear', xs=self.offset_xs, ys=self.ys)
@@ -388,8 +420,11 @@ class IsotopicMeasurement(BaseMeasurement):
         #     return self._value
 
         if not self.use_stored_value and not self.user_defined_value and self.xs.shape[0] > 1:
-            print('prediticasd', self.regressor)
-            v = self.regressor.predict(0)
+            r = self._get_running_intercept()
+            if r is not None:
+                v = r[0]
+            else:
+                v = self.regressor.predict(0)
 
             if isnan(v) or isinf(v):
                 v = 0
@@ -405,7 +440,12 @@ class IsotopicMeasurement(BaseMeasurement):
         #     return self._error
 
         if not self.use_stored_value and not self.user_defined_error and self.xs.shape[0] > 1:
-            v = self.regressor.predict_error(0)
+            r = self._get_running_intercept()
+            if r is not None:
+                v = r[1]
+            else:
+                v = self.regressor.predict_error(0)
+
             if isnan(v) or isinf(v):
                 v = 0
             return v
@@ -438,6 +478,41 @@ class IsotopicMeasurement(BaseMeasurement):
             self.fit = fit
         return self._regressor_factory(fit)
 
+    def _get_running_intercept(self):
+        """
+        return (value, error) at t=0 from the running sums or None if not incremental or the fit needs
+        the full regressor, e.g. outlier filtering, exclusions, truncation or grouping
+        """
+        if not self.incremental:
+            return
+
+        fit = (self.fit or 'linear').lower()
+        if 'average' in fit:
+            degree = 0
+        elif fit in ('linear', 'parabolic', 'cubic'):
+            degree = fit_to_degree(fit)
+        else:
+            return
+
+        if self.truncate or self.group_data > 1 or self.filter_outliers_dict.get('filter_outliers'):
+            return
+
+        reg = self._regressor
+        if reg is not None and (reg.user_excluded or reg.ouser_excluded):
+            return
+
+        r = self._running
+        xs, ys = self.xs, self.ys
+        if r is None or r.n != xs.shape[0] or self._running_last != (xs[-1], ys[-1]) \
+                or self._running_offset != self.time_zero_offset:
+            r = RunningRegressor()
+            r.add_many(self.offset_xs, ys)
+            self._running = r
+            self._running_offset = self.time_zero_offset
+            self._running_last = xs[-1], ys[-1]
+
+        return r.intercept(degree, self.error_type)
+
     def _regressor_factory(self, fit):
         lfit = fit.lower()
 
@@ -18,7 +18,6 @@
 import logging
 import os
 
-from numpy import append as npappend
 from traits.api import Property, Dict, Str
 from traits.has_traits import HasTraits
 from uncertainties import ufloat
@@ -244,10 +243,7 @@ class IsotopeGroup(HasTraits):
             if kind == 'sniff':
                 isotope._value = signal
 
-            xs = npappend(isotope.xs, x)
-            ys = npappend(isotope.ys, signal)
-            isotope.xs = xs
-            isotope.ys = ys
+            isotope.append_data(x, signal)
             # isotope.dirty = True
 
         isotopes = self.isotopes
@@ -266,6 +262,14 @@ class IsotopeGroup(HasTraits):
                     _append(isotopes[i])
                     return True
 
+    def set_incremental(self, v):
+        """
+        v: bool. use running sums for the intercepts of the isotopes and baselines while data is being appended
+        """
+        for iso in self.itervalues():
+            iso.set_incremental(v)
+            iso.baseline.set_incremental(v)
+
     def clear_baselines(self):
         for k in self.isotopes:
             self.set_baseline(k, None, (0, 0))
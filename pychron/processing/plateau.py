@@ -17,34 +17,13 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
-from numpy import argmax, array
-from six.moves import range
+from numpy import argmax, asarray, arange, ones, triu, where, cumsum, errstate, logical_or, flatnonzero
 from traits.api import HasTraits, List, Array
 
 from pychron.core.stats.core import validate_mswd, calculate_mswd
 from pychron.pychron_constants import MAHON
 
 
-def memoize(function):
-    cache = {}
-
-    def closure(*args):
-        # return function(*args)
-        if args not in cache:
-            cache[args] = function(*args)
-        return cache[args]
-
-    return closure
-
-
-class Log():
-    def debug(self, txt):
-        pass
-        # print 'debug --- {}'.format(txt)
-
-log = Log()
-
-
 class Plateau(HasTraits):
     ages = Array
     errors = Array
@@ -62,6 +41,9 @@ class Plateau(HasTraits):
     def find_plateaus(self, method=''):
         """
             method: str either fleck 1977 or mahon 1996
+
+            every (start, end) pair is tested at once using an n x n mask for each criterion.
+            returns the longest plateau as (start, end), ties go to the lowest start, or [] if there is no plateau
         """
         if method.lower() == MAHON:
             self.use_mswd = True
@@ -75,103 +57,76 @@ class Plateau(HasTraits):
         ss = [s for i, s in enumerate(self.signals) if i not in excludes]
 
         self.total_signal = float(sum(ss))
-        # log.info(self.total_signal)
-
-        idxs = []
-        spans = []
-
-        overlap_func = memoize(self._overlap)
-        for i in range(n):
-            if i in excludes:
-                continue
-            idx = self._find_plateaus(n, i, excludes, overlap_func)
-            if idx:
-                # log.debug('found {} {}'.format(*idx))
-                idxs.append(idx)
-                spans.append(idx[1] - idx[0])
-
-        if spans:
-            return idxs[argmax(array(spans))]
-
-        return idxs
+        if not n:
+            return []
 
-    def _find_plateaus(self, n, start, excludes, overlap_func):
-        potential_end = None
-        for i in range(start, n, 1):
-            if i in excludes:
-                continue
+        included = ones(n, dtype=bool)
+        included[[i for i in excludes if 0 <= i < n]] = False
 
-            if not self.check_nsteps(start, i):
-                log.debug('{} {} nsteps failed'.format(start, i))
-                continue
+        idx = arange(n)
+        starts, ends = idx[:, None], idx[None, :]
+        valid = (ends - starts + 1 >= self.nsteps) & included[:, None] & included[None, :]
+        valid &= self._released_mask(included)
+        if self.use_overlap:
+            valid &= self._overlap_mask()
 
-            if self.use_overlap and not self.check_overlap(start, i, overlap_func):
-                log.debug('{} {} overlap failed'.format(start, i))
-                # potential_end=None
-                break
-
-            if self.use_mswd and not self.check_mswd(start, i):
-                continue
-
-            if not self.check_percent_released(start, i):
-                log.debug('{} {} percent failed'.format(start, i))
-                continue
-
-            potential_end = i
-
-        if potential_end:
-            return start, potential_end
+        if self.use_mswd:
+            ends = [self._last_mswd_end(s, valid[s]) for s in range(n)]
+        else:
+            last = n - 1 - argmax(valid[:, ::-1], axis=1)
+            ends = where(valid.any(axis=1), last, 0)
 
-    def check_percent_released(self, start, end):
-        ss = sum([(s if not i in self.excludes else 0)
-                  for i, s in enumerate(self.signals)][start:end + 1])
+        found = [(s, e) for s, e in enumerate(ends) if e]
 
-        log.debug('percent {} {} {}'.format(start, end, ss / self.total_signal))
+        if found:
+            s, e = found[argmax([e - s for s, e in found])]
+            return int(s), int(e)
 
-        return ss / self.total_signal >= self.gas_fraction/100.
+        return []
 
     def check_mswd(self, start, end):
         """
             return False if not valid
         """
-        ages = self.ages[start, end + 1]
-        errors = self.errors[start, end + 1]
+        ages = self.ages[start:end + 1]
+        errors = self.errors[start:end + 1]
         mswd = calculate_mswd(ages, errors)
         return validate_mswd(mswd, len(ages))
 
-    def check_overlap(self, start, end, overlap_func):
-        overlap_sigma = self.overlap_sigma
-        for c, i in enumerate(range(start, end, 1)):
-            for j in range(start + c, end + 1, 1):
-                if i == j:
-                    continue
-
-                try:
-                    if not overlap_func(i, j, overlap_sigma):
-                        return
-                except BaseException as e:
-                    import traceback
-                    log.debug('Overlap exception: {}'.format(e, traceback.format_exc()))
-                    continue
-        else:
-            return True
+    def _last_mswd_end(self, start, candidates):
+        for end in flatnonzero(candidates)[::-1]:
+            if self.check_mswd(start, end):
+                return end
 
-    def _overlap(self, start, end, overlap_sigma):
-        # log.debug('checking overlap {} {} '.format(start, end))
-
-        a1 = self.ages[start]
-        a2 = self.ages[end]
-        e1 = self.errors[start]
-        e2 = self.errors[end]
+    def _released_mask(self, included):
+        """
+            mask[start, end] is True if steps start..end released at least gas_fraction of the total signal.
 
-        e1 *= overlap_sigma
-        e2 *= overlap_sigma
+            each row is a running sum from its start step so the sums are accumulated in the same order as
+            summing the steps directly
+        """
+        n = len(included)
+        signals = where(included, asarray(self.signals, dtype=float)[:n], 0)
+        tri = triu(ones((n, n), dtype=bool))
+        released = cumsum(where(tri, signals, 0), axis=1)
+        with errstate(divide='ignore', invalid='ignore'):
+            return released / self.total_signal >= self.gas_fraction / 100.
+
+    def _overlap_mask(self):
+        """
+            mask[start, end] is True if every pair of steps in start..end overlaps at overlap_sigma
+        """
+        ages = asarray(self.ages, dtype=float)
+        errors = asarray(self.errors, dtype=float) * self.overlap_sigma
+        n = len(ages)
 
-        # log.debug('{}<{} {}>{}'.format(a1 - e1 , a2 + e2, a1 + e1 , a2 - e2))
-        return a1 - e1 < a2 + e2 and a1 + e1 > a2 - e2
+        lo, hi = ages - errors, ages + errors
+        bad = triu(~((lo[:, None] < hi[None, :]) & (hi[:, None] > lo[None, :])), 1)
 
-    def check_nsteps(self, start, end):
-        return (end - start) + 1 >= self.nsteps
+        # a range fails once it reaches a step j that does not overlap an earlier step k >= start
+        last_bad = where(bad.any(axis=0), n - 1 - argmax(bad[::-1], axis=0), -1)
+        fails = logical_or.accumulate(last_bad[None, :] >= arange(n)[:, None], axis=1)
+        return ~fails
 
 # ============= EOF =============================================
 
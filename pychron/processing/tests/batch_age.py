@@ -0,0 +1,153 @@
+import unittest
+
+from numpy import array, allclose, random
+from uncertainties import ufloat
+
+from pychron.processing.analyses.analysis_group import AnalysisGroup
+from pychron.processing.arar_age import ArArAge
+from pychron.processing.batch_age import calculate_analyses, calculate_f_batch, age_equation_batch
+from pychron.processing.argon_calculations import calculate_f, age_equation
+
+INTENSITIES = {'Ar40': (1000, 1), 'Ar39': (100, 0.2), 'Ar38': (2, 0.01), 'Ar37': (1, 0.01), 'Ar36': (0.2, 0.002)}
+PRODUCTION_RATIOS = {'K4039': 0.01, 'Ca3937': 7e-4, 'K3739': 0.01, 'Ca3637': 2.7e-4, 'Ca3837': 1e-5,
+                     'K3839': 0.012, 'Cl3638': 250}
+
+ATTRS = ('F', 'F_err', 'F_err_wo_irrad', 'age', 'age_err')
+
+
+def make_analysis(rng):
+    a = ArArAge()
+    a.j = ufloat(0.001, 1e-6)
+    a.position_jerr = 2e-6
+    a.timestamp = 100 * 86400
+    a.irradiation_time = 0
+    for k, (v, e) in INTENSITIES.items():
+        v *= rng.uniform(0.5, 1.5)
+        iso = a.set_isotope(k, 'H1', (v, e))
+        iso.baseline.set_uvalue((0.01, 0.001))
+        iso.blank.set_uvalue((v * 0.01, e * 0.1))
+        iso.ic_factor = ufloat(1.01, 0.001)
+
+    a.interference_corrections = {k: ufloat(v, v * 0.01, tag=k) for k, v in PRODUCTION_RATIOS.items()}
+    return a
+
+
+class BatchAgeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.RandomState(1)
+
+    def _assert_matches(self, setup=None, n=10):
+        ans = [make_analysis(self.rng) for i in range(n)]
+        for a in ans:
+            if setup:
+                setup(a)
+            a.calculate_age(force=True)
+
+        expected = array([[getattr(a, attr) for attr in ATTRS] for a in ans])
+        self.assertEqual(len(calculate_analyses(ans)), n)
+        result = array([[getattr(a, attr) for attr in ATTRS] for a in ans])
+        self.assertTrue(allclose(result, expected, rtol=1e-10, atol=0))
+
+    def test_normal(self):
+        self._assert_matches()
+
+    def test_fixed_k3739_mode(self):
+        def setup(a):
+            a.arar_constants.k3739_mode = 'Fixed'
+
+        self._assert_matches(setup)
+
+    def test_fixed_k3739(self):
+        def setup(a):
+            a.fixed_k3739 = ufloat(0.02, 0.001)
+
+        self._assert_matches(setup)
+
+    def test_abundance_sensitivity(self):
+        def setup(a):
+            a.arar_constants.abundance_sensitivity = 1e-5
+
+        self._assert_matches(setup)
+
+    def test_negative_ca(self):
+        def setup(a):
+            a.arar_constants.allow_negative_ca_correction = False
+            a.isotopes['Ar37'].set_uvalue((0.001, 0.01))
+
+        self._assert_matches(setup)
+
+    def test_missing_ic_factor(self):
+        def setup(a):
+            # DVC sets a missing ic factor to ufloat(0, e). falsy ic factors are treated as 1
+            a.isotopes['Ar36'].ic_factor = ufloat(0, 0.001)
+            a.isotopes['Ar37'].ic_factor = 0
+            a.isotopes['Ar39'].ic_factor = None
+
+        self._assert_matches(setup)
+
+    def test_correlated_inputs(self):
+        def setup(a):
+            disc = ufloat(1.01, 0.01)
+            for iso in a.isotopes.values():
+                iso.discrimination = disc
+
+        ans = [make_analysis(self.rng) for i in range(3)]
+        for a in ans:
+            setup(a)
+            a.calculate_age(force=True)
+        expected = array([[getattr(a, attr) for attr in ATTRS] for a in ans])
+
+        # analyses with a shared discrimination are calculated with the uncertainties path
+        self.assertEqual(calculate_analyses(ans), [])
+        result = array([[getattr(a, attr) for attr in ATTRS] for a in ans])
+        self.assertTrue(allclose(result, expected, rtol=1e-10, atol=0))
+
+    def test_analysis_group(self):
+        ans = [make_analysis(self.rng) for i in range(5)]
+        expected = []
+        for a in ans:
+            a.calculate_age(force=True)
+            expected.append((a.age, a.age_err))
+            a.age = 0
+            a.calculate_f()
+
+        # the ages of analyses loaded with calculate_f_only are calculated by the group
+        AnalysisGroup(analyses=ans)
+        self.assertTrue(allclose([(a.age, a.age_err) for a in ans], expected, rtol=1e-10, atol=0))
+
+    def test_j_errors(self):
+        a = make_analysis(self.rng)
+        a.calculate_age(force=True)
+        expected = a.uage_w_j_err.std_dev, a.uage_w_position_err.std_dev
+
+        calculate_analyses([a])
+        self.assertAlmostEqual(a.uage_w_j_err.std_dev, expected[0])
+        self.assertAlmostEqual(a.uage_w_position_err.std_dev, expected[1])
+
+    def test_calculate_f_only(self):
+        a = make_analysis(self.rng)
+        calculate_analyses([a], calculate_f_only=True)
+        self.assertTrue(a.F)
+        self.assertFalse(a.age)
+
+    def test_calculate_f_batch(self):
+        isotopes = [ufloat(*INTENSITIES[k]) for k in ('Ar40', 'Ar39', 'Ar38', 'Ar37', 'Ar36')]
+        prs = {k: ufloat(v, v * 0.01) for k, v in PRODUCTION_RATIOS.items()}
+        f, f_wo_irrad, _, _, _ = calculate_f(isotopes, 100, interferences=prs)
+
+        values = [[INTENSITIES[k][0] for k in ('Ar40', 'Ar39', 'Ar38', 'Ar37', 'Ar36')]]
+        errors = [[INTENSITIES[k][1] for k in ('Ar40', 'Ar39', 'Ar38', 'Ar37', 'Ar36')]]
+        fs, fes, fwes = calculate_f_batch(values, errors, decay_days=100, production_ratios=prs)
+        self.assertAlmostEqual(fs[0], f.nominal_value)
+        self.assertAlmostEqual(fes[0], f.std_dev)
+        self.assertAlmostEqual(fwes[0], f_wo_irrad.std_dev)
+
+    def test_age_equation_batch(self):
+        age = age_equation(ufloat(0.001, 1e-5), ufloat(10, 0.1))
+        ages, errs = age_equation_batch([0.001], [10], j_err=[1e-5], f_err=[0.1])
+        self.assertAlmostEqual(ages[0], age.nominal_value)
+        self.assertAlmostEqual(errs[0], age.std_dev)
+
+
+if __name__ == '__main__':
+    unittest.main()
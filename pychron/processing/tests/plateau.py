@@ -1,9 +1,15 @@
 from __future__ import absolute_import
 __author__ = 'ross'
+import json
+import os
 import unittest
 
+from numpy import array
+
 from pychron.processing.plateau import Plateau
 
+CORPUS = os.path.join(os.path.dirname(__file__), 'data', 'plateau_corpus.json')
+
 
 class PlateauTestCase(unittest.TestCase):
     def test_find_plateaus_real_fail(self):
@@ -116,6 +122,35 @@ class PlateauTestCase(unittest.TestCase):
         idx = (1, 4)
         return ages, errors, signals, exclude, idx
 
+    def test_find_plateaus_mahon(self):
+        ages = [7, 1, 1.1, 0.9, 1, 6, 7]
+        errors = [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1]
+        signals = [1, 1, 1, 1, 1, 1, 1]
+        p = Plateau(ages=ages, errors=errors, signals=signals)
+        self.assertEqual(p.find_plateaus('Mahon 1996'), (1, 4))
+
+    def test_find_plateaus_empty(self):
+        p = Plateau(ages=[], errors=[], signals=[])
+        self.assertEqual(p.find_plateaus(), [])
+
+    def test_corpus(self):
+        """
+        spectra with the plateaus found by the original step by step search
+        """
+        with open(CORPUS, 'r') as rfile:
+            cases = json.load(rfile)
+
+        for i, case in enumerate(cases):
+            p = Plateau(ages=array(case['ages']),
+                        errors=array(case['errors']),
+                        signals=array(case['signals']),
+                        excludes=case['excludes'],
+                        nsteps=case['nsteps'],
+                        overlap_sigma=case['overlap_sigma'],
+                        gas_fraction=case['gas_fraction'])
+            pidx = p.find_plateaus(case['method'])
+            self.assertEqual(list(pidx), case['plateau'], 'case {}'.format(i))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,15 +16,15 @@
 
 # ============= enthought library imports =======================
 import csv
-import hashlib
 import os
 import shutil
 
 import six
-from numpy import asarray, array, nonzero, polyval
+from numpy import asarray, array, nonzero, polyval, polyder, linspace, diff, interp
 from scipy.optimize import leastsq, brentq
 from traits.api import HasTraits, List, Str, Dict, Bool, Property, CFloat
 
+from pychron.core.file_listener import FileListener
 from pychron.core.helpers.filetools import add_extension, backup
 from pychron.loggable import Loggable
 from pychron.paths import paths
@@ -48,6 +48,26 @@ def least_squares(func, xs, ys, initial_guess):
     return ret
 
 
+# mass range searched when mapping a dac to a mass and the spacing of the dac->mass interpolation table
+MASS_LOW = 0
+MASS_HIGH = 200
+MASS_STEP = 0.01
+
+
+def make_inverse_table(p, low=MASS_LOW, high=MASS_HIGH, step=MASS_STEP):
+    """
+    return (dacs, masses) sampled from the mass->dac polynomial ``p``, dacs increasing, or None if the
+    polynomial is not monotonic between low and high
+    """
+    masses = linspace(low, high, int(round((high - low) / step)) + 1)
+    dacs = polyval(p, masses)
+    d = diff(dacs)
+    if (d > 0).all():
+        return dacs, masses
+    elif (d < 0).all():
+        return dacs[::-1], masses[::-1]
+
+
 def format_dac(dac):
     return '{:0.5f}'.format(dac) if dac != NULL_STR else ''
 
@@ -72,6 +92,9 @@ class FieldTable(Loggable):
     path = Property
     mass_cal_func = 'parabolic'
 
+    # watch the mftable for changes instead of checking the file on every mapping
+    use_file_listener = True
+
     # path = Property(depends_on='_path_dirty')
     # _path_dirty = Event
 
@@ -83,6 +106,15 @@ class FieldTable(Loggable):
         self._detectors = None
         self._test_path = None
 
+        self._mftable_stat = None
+        self._mftable_dirty = False
+        self._file_listener = None
+        self._inverse = {}
+
+        # number of times the mftable was read and stat'ed. used to verify the mappings stay off the disk
+        self.nloads = 0
+        self.nstats = 0
+
         if bind:
             self.bind_preferences()
 
@@ -113,16 +145,26 @@ class FieldTable(Loggable):
 
         _, xs, ys, p = d[detname]
         if self.polynominal_mass_func:
-            def func(x, *args):
-                c = list(p)
-                c[-1] -= dac
-                return polyval(c, x)
+            inv = self._get_inverse(detname, p)
+            if inv is None:
+                def func(x, *args):
+                    c = list(p)
+                    c[-1] -= dac
+                    return polyval(c, x)
 
-            try:
-                mass = brentq(func, 0, 200)
-                return mass
-            except ValueError as e:
-                self.debug('DAC does not map to an isotope. DAC={}, Detector={}'.format(dac, detname))
+                try:
+                    mass = brentq(func, MASS_LOW, MASS_HIGH)
+                    return mass
+                except ValueError as e:
+                    self.debug('DAC does not map to an isotope. DAC={}, Detector={}'.format(dac, detname))
+            else:
+                dacs, masses = inv
+                if dacs[0] <= dac <= dacs[-1]:
+                    mass = interp(dac, dacs, masses)
+                    # one newton step removes the interpolation error
+                    return mass - (polyval(p, mass) - dac) / polyval(polyder(p), mass)
+                else:
+                    self.debug('DAC does not map to an isotope. DAC={}, Detector={}'.format(dac, detname))
         else:
             try:
                 idx = ys.index(dac)
@@ -203,6 +245,8 @@ class FieldTable(Loggable):
                     p = None
                 d[k] = isoks, mws, ndacs, p
 
+            self._inverse = {}
+
             if save:
                 self.dump(isos, d, message)
 
@@ -241,7 +285,6 @@ class FieldTable(Loggable):
             for fi in self.items:
                 writer.writerow(fi.to_csv(detectors, fmt))
 
-        self._set_mftable_hash(p)
         self._add_to_archive(p, message='manual modification')
 
     def dump(self, isos, d, message):
@@ -263,7 +306,7 @@ class FieldTable(Loggable):
 
                 writer.writerow(a)
 
-        self._set_mftable_hash(p)
+        self._set_mftable_stat(p)
         self._add_to_archive(p, message)
 
     @property
@@ -314,10 +357,12 @@ class FieldTable(Loggable):
 
         mws = self.molweights
 
-        self._set_mftable_hash(path)
+        self.nloads += 1
+        self._set_mftable_stat(path)
+        self._watch(path)
         items = []
 
-        with open(path, 'U') as f:
+        with open(path, 'r') as f:
             reader = csv.reader(f)
             table = []
 
@@ -386,6 +431,7 @@ class FieldTable(Loggable):
                 d[k] = (isos, mws, ys, c)
 
             self._mftable = d
+            self._inverse = {}
             # self._mftable={k: (isos, mws, table[2 + i], )
             # for i, k in enumerate(detectors)}
             self._detectors = detectors
@@ -421,27 +467,62 @@ class FieldTable(Loggable):
         self.debug('================================')
 
     def _get_mftable(self):
-        if not self._mftable or not self._check_mftable_hash():
+        if not self._mftable or self._check_mftable_modified():
             self.debug('using mftable at {}'.format(self.path))
             self.load_table()
 
         return self._mftable
 
-    def _check_mftable_hash(self):
+    def _get_inverse(self, detname, p):
+        try:
+            return self._inverse[detname]
+        except KeyError:
+            inv = self._inverse[detname] = make_inverse_table(p) if p is not None else None
+            return inv
+
+    def _check_mftable_modified(self):
         """
             return True if mftable externally modified
+
+            while the file listener is running the file is only stat'ed after the listener reports a change
         """
-        # p = paths.mftable
-        current_hash = self._make_hash(self.path)
-        return self._mftable_hash != current_hash
+        listener = self._file_listener
+        if listener is not None and listener.path == self.path:
+            if not self._mftable_dirty:
+                return False
+            self._mftable_dirty = False
+
+        return self._mftable_stat != self._get_stat(self.path)
+
+    def _mftable_modified(self):
+        self._mftable_dirty = True
+
+    def _watch(self, path):
+        if not self.use_file_listener:
+            return
+
+        listener = self._file_listener
+        if listener is not None:
+            if listener.path == path:
+                return
+            listener.stop()
+
+        self._mftable_dirty = False
+        self._file_listener = FileListener(path, callback=self._mftable_modified, use_observer=True)
+
+    def stop_file_listener(self):
+        if self._file_listener is not None:
+            self._file_listener.stop()
+            self._file_listener = None
 
-    def _make_hash(self, p):
+    def _get_stat(self, p):
         if p and os.path.isfile(p):
-            with open(p, 'rb') as rfile:
-                return hashlib.md5(rfile.read())
+            self.nstats += 1
+            st = os.stat(p)
+            return st.st_mtime_ns, st.st_size
 
-    def _set_mftable_hash(self, p):
-        self._mftable_hash = self._make_hash(p)
+    def _set_mftable_stat(self, p):
+        self._mftable_stat = self._get_stat(p)
 
     def _add_to_archive(self, p, message):
         # if self.use_db_archive:
@@ -1,9 +1,27 @@
 from __future__ import absolute_import
 import os
+import shutil
+import tempfile
+import time
 import unittest
 
+from numpy import polyval
+from scipy.optimize import brentq
+
+from pychron.globals import globalv
 from pychron.spectrometer.field_table import FieldTable
 
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+TABLE = '''parabolic
+iso,H1,AX
+Ar40,5.89559,6.0067
+Ar39,5.78827,5.8969
+Ar38,5.67201,5.7793
+Ar36,5.45620,5.5607
+'''
+
 
 class Argon2CDDMFTableTestCase(unittest.TestCase):
     def setUp(self):
@@ -76,5 +94,75 @@ class MFTableTestCase(unittest.TestCase):
         self.assertNotEqual(dac, 5.8955)
 
 
+class MFTableChangeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, 'mftable.csv')
+        with open(self.path, 'w') as wfile:
+            wfile.write(TABLE)
+
+        self.mftable = FieldTable(bind=False)
+        self.mftable.molweights = {'Ar40': 39.962, 'Ar39': 38.964, 'Ar38': 37.963, 'Ar36': 35.967}
+        self.mftable._test_path = self.path
+        self.mftable.load_table()
+
+    def tearDown(self):
+        self.mftable.stop_file_listener()
+        shutil.rmtree(self.root)
+
+    def _modify(self, dac):
+        # make sure the modification time changes on file systems with coarse timestamps
+        time.sleep(0.01)
+        with open(self.path, 'w') as wfile:
+            wfile.write(TABLE.replace('6.0067', dac))
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+    def test_hops_stay_off_disk(self):
+        nloads, nstats = self.mftable.nloads, self.mftable.nstats
+        for i in range(100):
+            dac = self.mftable.map_mass_to_dac('Ar40', 'AX')
+            self.mftable.map_dac_to_mass(dac, 'AX')
+            self.mftable.get_dac('AX', 39.962)
+
+        self.assertEqual(self.mftable.nloads, nloads)
+        self.assertEqual(self.mftable.nstats, nstats)
+
+    def test_reload_on_change(self):
+        self.assertEqual(self.mftable.get_dac('AX', 39.962), 6.0067)
+        self._modify('6.1000')
+
+        # the listener polls once a second
+        st = time.time()
+        while time.time() - st < 5:
+            if self.mftable.get_dac('AX', 39.962) == 6.1:
+                break
+            time.sleep(0.1)
+
+        self.assertEqual(self.mftable.get_dac('AX', 39.962), 6.1)
+        self.assertEqual(self.mftable.nloads, 2)
+
+    def test_reload_without_listener(self):
+        self.mftable.stop_file_listener()
+        self._modify('6.1000')
+        self.assertEqual(self.mftable.get_dac('AX', 39.962), 6.1)
+
+    def test_own_write(self):
+        self.mftable.update_field_table('AX', 'Ar40', 6.0100)
+        nloads = self.mftable.nloads
+        self.mftable._mftable_modified()
+        self.assertAlmostEqual(self.mftable.get_dac('AX', 39.962), 6.01)
+        self.assertEqual(self.mftable.nloads, nloads)
+
+    def test_dac_to_mass(self):
+        _, _, _, p = self.mftable.get_table()['H1']
+        for mass in (35.967, 36.5, 38.964, 39.962):
+            dac = polyval(p, mass)
+            expected = brentq(lambda x: polyval(p, x) - dac, 0, 200)
+            self.assertAlmostEqual(self.mftable.map_dac_to_mass(dac, 'H1'), expected, places=9)
+
+        self.assertIsNone(self.mftable.map_dac_to_mass(1000, 'H1'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,8 @@ import unittest
 
 from pychron.core.helpers.tests.floatfmt import SigFigStdFmtTestCase
 from pychron.core.stats.tests.mswd_tests import MSWDTestCase
+from pychron.core.stats.tests.monte_carlo import MonteCarloTestCase
+from pychron.core.stats.tests.probability_curves import ProbabilityCurvesTestCase
 from pychron.pyscripts.tests.extraction_script import WaitForTestCase
 
 use_logger = False
@@ -28,16 +30,31 @@ def suite():
     from pychron.core.stats.tests.peak_detection_test import MultiPeakDetectionTestCase
     from pychron.core.helpers.tests.floatfmt import FloatfmtTestCase
     from pychron.core.helpers.tests.strtools import CamelCaseTestCase
+    from pychron.core.helpers.tests.binpack import BinpackTestCase
     from pychron.core.xml.tests.xml_parser import XMLParserTestCase
     from pychron.core.regression.tests.regression import OLSRegressionTest, MeanRegressionTest, \
-        FilterOLSRegressionTest, OLSRegressionTest2, TruncateRegressionTest
+        FilterOLSRegressionTest, OLSRegressionTest2, TruncateRegressionTest, OLSPredictErrorTest, RunningRegressorTest
     from pychron.core.tests.alpha_tests import AlphaTestCase
+    from pychron.core.tests.startup_profiler import StartupProfilerTestCase
 
     # DataMapper
     from pychron.data_mapper.tests.usgs_vsc_file_source import USGSVSCFileSourceUnittest, \
         USGSVSCIrradiationSourceUnittest
     from pychron.data_mapper.tests.nmgrl_legacy_source import NMGRLLegacySourceUnittest
 
+    # Dashboard
+    from pychron.dashboard.tests.scheduler import DashboardPollSchedulerTestCase
+
+    # DVC
+    from pychron.dvc.tests.raw_data import RawDataTestCase
+    from pychron.dvc.tests.cache import DVCCacheTestCase
+    from pychron.dvc.tests.persistent_cache import PersistentFileCacheTestCase
+    from pychron.dvc.tests.meta_file_cache import MetaFileCacheTestCase, MetaRepoCacheTestCase
+    from pychron.dvc.tests.chronology import ChronologyTestCase
+
+    # Envisage
+    from pychron.envisage.tests.lazy_plugin import LazyPluginTestCase
+
     # Experiment
     from pychron.experiment.tests.repository_identifier import ExperimentIdentifierTestCase
     from pychron.experiment.tests.peak_hop_parse import PeakHopYamlCase1
@@ -51,21 +68,37 @@ def suite():
     from pychron.experiment.tests.conditionals import ConditionalsTestCase, ParseConditionalsTestCase
     from pychron.experiment.tests.identifier import IdentifierTestCase
     from pychron.experiment.tests.comment_template import CommentTemplaterTestCase
+    from pychron.experiment.tests.data_writer import DataWriterTestCase
+
+    # ExtractionLine
+    from pychron.extraction_line.tests.switch_states import SwitchStatesTestCase
 
     # ExternalPipette
     from pychron.external_pipette.tests.external_pipette import ExternalPipetteTestCase
 
+    # Hardware
+    from pychron.hardware.tests.communication_scheduler import CommunicationSchedulerTestCase
+
+    # MachineVision
+    from pychron.mv.tests.threshold_search import ThresholdWindowsTestCase, ThresholdSearchTestCase
+
+    # Pipeline
+    from pychron.pipeline.tables.tests.xlsx_table_writer import XLSXTableWriterTestCase
+    from pychron.pipeline.tests.auto_pipeline import LoadAnalysesTestCase, AppendPipelineTestCase
+
     # Processing
     from pychron.processing.tests.plateau import PlateauTestCase
     from pychron.processing.tests.ratio import RatioTestCase
     from pychron.processing.tests.age_converter import AgeConverterTestCase
+    from pychron.processing.tests.incremental_age import IncrementalIsotopeTestCase, UpdateAgeTestCase
+    from pychron.processing.tests.batch_age import BatchAgeTestCase
 
     # Pyscripts
     # from pychron.pyscripts.tests.extraction_script import WaitForTestCase
     from pychron.pyscripts.tests.measurement_pyscript import InterpolationTestCase, DocstrContextTestCase
 
     # Spectrometer
-    from pychron.spectrometer.tests.mftable import MFTableTestCase, DiscreteMFTableTestCase
+    from pychron.spectrometer.tests.mftable import MFTableTestCase, DiscreteMFTableTestCase, MFTableChangeTestCase
     from pychron.spectrometer.tests.integration_time import IntegrationTimeTestCase
 
     from pychron.stage.tests.stage_map import StageMapTestCase, TransformTestCase
@@ -85,6 +118,7 @@ def suite():
         FloatfmtTestCase,
         SigFigStdFmtTestCase,
         CamelCaseTestCase,
+        BinpackTestCase,
         RatioTestCase,
         XMLParserTestCase,
         OLSRegressionTest,
@@ -93,8 +127,12 @@ def suite():
         # ExpoRegressionTest2,
         FilterOLSRegressionTest,
         OLSRegressionTest2,
+        OLSPredictErrorTest,
         TruncateRegressionTest,
         MSWDTestCase,
+        MonteCarloTestCase,
+        ProbabilityCurvesTestCase,
+        StartupProfilerTestCase,
 
         # DataMapper
         USGSVSCFileSourceUnittest,
@@ -102,6 +140,20 @@ def suite():
         # NuFileSourceUnittest,
         NMGRLLegacySourceUnittest,
 
+        # Dashboard
+        DashboardPollSchedulerTestCase,
+
+        # DVC
+        RawDataTestCase,
+        DVCCacheTestCase,
+        PersistentFileCacheTestCase,
+        MetaFileCacheTestCase,
+        MetaRepoCacheTestCase,
+        ChronologyTestCase,
+
+        # Envisage
+        LazyPluginTestCase,
+
         # Experiment
         ExperimentIdentifierTestCase,
         PeakHopYamlCase1,
@@ -117,14 +169,33 @@ def suite():
         ParseConditionalsTestCase,
         IdentifierTestCase,
         CommentTemplaterTestCase,
+        DataWriterTestCase,
+
+        # ExtractionLine
+        SwitchStatesTestCase,
 
         # ExternalPipette
         ExternalPipetteTestCase,
 
+        # Hardware
+        CommunicationSchedulerTestCase,
+
+        # MachineVision
+        ThresholdWindowsTestCase,
+        ThresholdSearchTestCase,
+
+        # Pipeline
+        XLSXTableWriterTestCase,
+        LoadAnalysesTestCase,
+        AppendPipelineTestCase,
+
         # Processing
         PlateauTestCase,
         RatioTestCase,
         AgeConverterTestCase,
+        IncrementalIsotopeTestCase,
+        UpdateAgeTestCase,
+        BatchAgeTestCase,
 
         # Pyscripts
         WaitForTestCase,
@@ -134,6 +205,7 @@ def suite():
         # Spectrometer
         MFTableTestCase,
         DiscreteMFTableTestCase,
+        MFTableChangeTestCase,
         IntegrationTimeTestCase,
 
         # Stage
@@ -0,0 +1,54 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import unittest
+
+from numpy import random
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.simple_timeit import timethis
+from pychron.processing.batch_age import calculate_analyses
+from pychron.processing.tests.batch_age import make_analysis
+
+
+class BatchAgeBenchmark(unittest.TestCase):
+    """
+    F and age for 500 analyses
+    """
+    nanalyses = 500
+
+    def setUp(self):
+        rng = random.RandomState(3)
+        self.analyses = [make_analysis(rng) for i in range(self.nanalyses)]
+
+    def _uncertainties(self):
+        for a in self.analyses:
+            a.calculate_age(force=True)
+
+    def _batch(self):
+        calculate_analyses(self.analyses)
+
+    def test_speed(self):
+        ut = timethis(self._uncertainties, msg='uncertainties', rettime=True)
+        bt = timethis(self._batch, msg='batch', rettime=True)
+        self.assertLess(bt * 5, ut)
+
+
+if __name__ == '__main__':
+    unittest.main()
+# ============= EOF =============================================
@@ -0,0 +1,85 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import struct
+import unittest
+
+from numpy import linspace, array_equal
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.simple_timeit import timethis
+from pychron.core.helpers.binpack import unpack_array, pack_arrays
+
+
+def struct_pack(xs, ys):
+    return b''.join([struct.pack('>ff', x, y) for x, y in zip(xs, ys)])
+
+
+def struct_unpack(blob):
+    return list(zip(*[struct.unpack('>ff', blob[i:i + 8]) for i in range(0, len(blob), 8)]))
+
+
+class BinpackBenchmark(unittest.TestCase):
+    """
+    decode/encode one analysis worth of data. 7 detectors x 1000 counts
+    """
+    ndetectors = 7
+    ncounts = 1000
+
+    def setUp(self):
+        self.xs = linspace(0, 500, self.ncounts)
+        self.ys = self.xs * 0.1 + 5
+        self.blob = struct_pack(self.xs, self.ys)
+
+    def _unpack_struct(self):
+        for _ in range(self.ndetectors):
+            struct_unpack(self.blob)
+
+    def _unpack_numpy(self):
+        for _ in range(self.ndetectors):
+            unpack_array(self.blob)
+
+    def _pack_struct(self):
+        for _ in range(self.ndetectors):
+            struct_pack(self.xs, self.ys)
+
+    def _pack_numpy(self):
+        for _ in range(self.ndetectors):
+            pack_arrays('>ff', self.xs, self.ys)
+
+    def test_equivalence(self):
+        self.assertEqual(pack_arrays('>ff', self.xs, self.ys), self.blob)
+        xs, ys = unpack_array(self.blob)
+        exs, eys = struct_unpack(self.blob)
+        self.assertTrue(array_equal(xs, exs))
+        self.assertTrue(array_equal(ys, eys))
+
+    def test_unpack_speed(self):
+        st = timethis(self._unpack_struct, msg='struct unpack', rettime=True)
+        nt = timethis(self._unpack_numpy, msg='numpy unpack', rettime=True)
+        self.assertLess(nt, st)
+
+    def test_pack_speed(self):
+        st = timethis(self._pack_struct, msg='struct pack', rettime=True)
+        nt = timethis(self._pack_numpy, msg='numpy pack', rettime=True)
+        self.assertLess(nt, st)
+
+
+if __name__ == '__main__':
+    unittest.main()
+# ============= EOF =============================================
@@ -0,0 +1,226 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import socket
+import time
+import unittest
+from queue import Queue
+from six.moves.socketserver import BaseRequestHandler
+from threading import Thread
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.simple_timeit import timethis
+from pychron.emulation_server import EmulationServer
+from pychron.globals import globalv
+from pychron.hardware.core.communicators.connection_pool import close_pools, get_pool
+from pychron.hardware.core.communicators.ethernet_communicator import EthernetCommunicator, TCPHandler
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+LATENCY = 0.002
+
+
+class EchoEmulator(BaseRequestHandler):
+    """
+    echo every \\r terminated command ``LATENCY`` seconds after it arrives.
+
+    commands in flight are answered independently, in order, so the delay models the round trip to a device
+    rather than the time it takes the device to process a command
+    """
+
+    def handle(self):
+        q = Queue()
+
+        def respond():
+            while 1:
+                item = q.get()
+                if item is None:
+                    break
+
+                st, cmd = item
+                time.sleep(max(0, st + LATENCY - time.time()))
+                try:
+                    self.request.sendall(cmd + b'\r')
+                except socket.error:
+                    break
+
+        t = Thread(target=respond)
+        t.start()
+
+        buf = b''
+        while 1:
+            try:
+                s = self.request.recv(1024)
+            except socket.error:
+                break
+            if not s:
+                break
+
+            buf += s
+            while b'\r' in buf:
+                cmd, buf = buf.split(b'\r', 1)
+                q.put((time.time(), cmd))
+
+        q.put(None)
+        t.join()
+
+
+def free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+class EthernetCommunicatorBenchmark(unittest.TestCase):
+    """
+    commands/sec for 4 threads sharing one device
+    """
+    nthreads = 4
+    ncommands = 50
+
+    def setUp(self):
+        self.port = free_port()
+        self.server = EmulationServer('127.0.0.1', self.port, EchoEmulator, threaded=True)
+        self.server.start(join=False)
+
+        st = time.time()
+        while time.time() - st < 2:
+            try:
+                socket.create_connection(('127.0.0.1', self.port), 0.1).close()
+                break
+            except socket.error:
+                time.sleep(0.01)
+
+    def tearDown(self):
+        close_pools()
+        self.server.stop()
+
+    def _communicator(self, **kw):
+        c = EthernetCommunicator(name='echo', host='127.0.0.1', port=self.port, kind='TCP', **kw)
+        c.simulation = False
+        return c
+
+    def _contend(self, comm):
+        results = [None] * self.nthreads
+
+        def worker(i):
+            results[i] = [comm.ask('{}:{}'.format(i, j), verbose=False)
+                          for j in range(self.ncommands)]
+
+        ts = [Thread(target=worker, args=(i,)) for i in range(self.nthreads)]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+        return results
+
+    def _rate(self, comm, msg):
+        et = timethis(self._contend, args=(comm,), msg=msg, rettime=True)
+        print('{} {:0.0f} commands/s'.format(msg, self.nthreads * self.ncommands / et))
+        return et
+
+    def _assert_responses(self, results):
+        for i, rs in enumerate(results):
+            self.assertListEqual(rs, ['{}:{}\r'.format(i, j) for j in range(self.ncommands)])
+
+    def test_responses(self):
+        for kw in ({}, {'use_pool': True, 'pool_size': 4}, {'pipelined': True}):
+            self._assert_responses(self._contend(self._communicator(**kw)))
+
+    def test_pool_speed(self):
+        lt = self._rate(self._communicator(), 'locked')
+        pt = self._rate(self._communicator(use_pool=True, pool_size=4), 'pooled')
+        self.assertLess(pt, lt)
+
+    def test_pipeline_speed(self):
+        lt = self._rate(self._communicator(), 'locked')
+        pt = self._rate(self._communicator(pipelined=True), 'pipelined')
+        self.assertLess(pt, lt)
+
+    def test_pool_shared(self):
+        a = self._communicator(use_pool=True)
+        b = self._communicator(use_pool=True)
+        a.ask('a', verbose=False)
+        b.ask('b', verbose=False)
+        pool = a._get_pool()
+        self.assertIs(pool, b._get_pool())
+        self.assertEqual(pool.nconnects, 1)
+        self.assertEqual(pool.nreuses, 1)
+
+    def test_pool_keyed_by_settings(self):
+        a = self._communicator(use_pool=True)
+        b = self._communicator(use_pool=True)
+        b.message_frame = 'L4,-,C4'
+        self.assertIsNot(a._get_pool(), b._get_pool())
+
+        a.ask('a', verbose=False)
+        h = a._get_pool().acquire()
+        self.assertFalse(h.message_frame.checksum)
+        a._get_pool().release(h)
+
+    def test_pipeline_does_not_hold_pool(self):
+        p = self._communicator(pipelined=True)
+        c = self._communicator(use_pool=True)
+        self.assertEqual(p.ask('p', verbose=False), 'p\r')
+
+        st = time.time()
+        self.assertEqual(c.ask('c', verbose=False, timeout=0.5), 'c\r')
+        self.assertLess(time.time() - st, 0.5)
+        self.assertEqual(c._get_pool().report()['open'], 1)
+
+        p.reset()
+        self.assertIsNone(p._pipeline)
+
+    def test_reconnect(self):
+        c = self._communicator(use_pool=True)
+        c.ask('a', verbose=False)
+
+        # close the pooled connection from the other end
+        pool = c._get_pool()
+        h = pool.acquire()
+        h.sock.shutdown(socket.SHUT_RDWR)
+        pool.release(h)
+        time.sleep(0.05)
+
+        self.assertEqual(c.ask('b', verbose=False), 'b\r')
+        self.assertEqual(pool.nstale, 1)
+        self.assertEqual(pool.nconnects, 2)
+
+    def test_backoff(self):
+        calls = []
+        port = free_port()
+
+        def factory():
+            calls.append(1)
+            h = TCPHandler()
+            h.open_socket(('127.0.0.1', port), timeout=0.1)
+            return h
+
+        pool = get_pool(('TCP', '127.0.0.1', port), factory)
+        self.assertIsNone(pool.acquire(0.1))
+        self.assertIsNone(pool.acquire(0.1))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(pool.nfailures, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
+# ============= EOF =============================================
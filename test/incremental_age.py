@@ -0,0 +1,72 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import unittest
+
+from numpy import linspace, random
+from uncertainties import ufloat
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.simple_timeit import timethis
+from pychron.processing.arar_age import ArArAge
+
+INTERCEPTS = {'Ar40': 1000., 'Ar39': 100., 'Ar38': 2., 'Ar37': 1., 'Ar36': 0.2}
+
+
+class IncrementalAgeBenchmark(unittest.TestCase):
+    """
+    age refresh while 400 counts of 5 parabolic isotopes with 0.1% noise are collected
+    """
+    ncounts = 400
+
+    def _age(self, incremental):
+        ag = ArArAge()
+        ag.j = ufloat(0.001, 1e-6)
+        ag.timestamp = ag.irradiation_time = 0
+        for k in INTERCEPTS:
+            ag.set_isotope(k, 'H1', (0, 0), fit='parabolic')
+        ag.set_incremental(incremental)
+        return ag
+
+    def _collect(self, ag, incremental):
+        rng = random.RandomState(7)
+        for i, x in enumerate(linspace(5, 400, self.ncounts)):
+            for k, v in INTERCEPTS.items():
+                y = v * (1 + rng.normal(0, 1e-3)) - 1e-4 * v * x + 1e-8 * v * x * x
+                ag.append_data(k, 'H1', x, y, 'signal')
+
+            if incremental:
+                ag.update_age()
+            elif not (i + 1) % 5:
+                ag.calculate_age(force=True)
+
+    def test_speed(self):
+        full = self._age(False)
+        ft = timethis(self._collect, args=(full, False), msg='full every 5 counts', rettime=True)
+
+        inc = self._age(True)
+        it = timethis(self._collect, args=(inc, True), msg='incremental every count', rettime=True)
+
+        self.assertLess(it, ft)
+        # the age is only recalculated when an intercept moves by more than the tolerance
+        self.assertAlmostEqual(inc.age, full.age, delta=1e-4 * full.age)
+
+
+if __name__ == '__main__':
+    unittest.main()
+# ============= EOF =============================================
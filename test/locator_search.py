@@ -0,0 +1,106 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import glob
+import os
+import shutil
+import tempfile
+import unittest
+
+from numpy import random, ogrid, clip, load, save
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.simple_timeit import timethis
+from pychron.globals import globalv
+from pychron.mv.locator import Locator
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+# directory of frames (.npy) saved from the autocenter camera. synthetic frames are used if not set
+FRAMES = os.environ.get('PYCHRON_MV_FRAMES')
+
+PXPERMM = 40
+DIM = 1.0
+SEARCH = dict(n=20, step=2, width=10)
+
+
+def make_frame(rng, size=256, radius=PXPERMM * DIM):
+    """
+    a dark hole a little off center on an unevenly lit, noisy tray. the uneven lighting puts the starting
+    threshold well off the hole so the full sweep tries ~200 windows per frame
+    """
+    y, x = ogrid[:size, :size]
+    cx, cy = size / 2. + rng.uniform(-4, 4), size / 2. + rng.uniform(-4, 4)
+
+    frame = 120 + 0.6 * x + rng.normal(0, 12, (size, size))
+    frame[(x - cx) ** 2 + (y - cy) ** 2 < radius ** 2] -= 70
+    return clip(frame, 0, 255).astype('uint8')
+
+
+class LocatorSearchBenchmark(unittest.TestCase):
+    """
+    autocenter the frames of a tray with the full threshold sweep and the coarse-to-fine search
+    """
+    nframes = 6
+
+    def setUp(self):
+        self.root = None
+        root = FRAMES
+        if not root:
+            root = self.root = tempfile.mkdtemp()
+            rng = random.RandomState(5)
+            for i in range(self.nframes):
+                save(os.path.join(root, 'frame{:03d}.npy'.format(i)), make_frame(rng))
+
+        self.frames = [load(p) for p in sorted(glob.glob(os.path.join(root, '*.npy')))]
+
+    def tearDown(self):
+        if self.root:
+            shutil.rmtree(self.root)
+
+    def _locate(self, **kw):
+        hint = None
+        results = []
+        for frame in self.frames:
+            loc = Locator(pxpermm=PXPERMM)
+            search = dict(SEARCH, hint=hint, **kw)
+            targets = loc._find_targets(None, frame, PXPERMM * DIM, search=search, set_image=False)
+            if loc.last_threshold is not None:
+                hint = loc.last_threshold
+            results.append(targets[0].centroid if targets else None)
+        return results
+
+    def test_speed(self):
+        st = timethis(self._locate, msg='sweep', rettime=True)
+        ct = timethis(self._locate, kwargs={'coarse_to_fine': True}, msg='coarse to fine', rettime=True)
+        self.assertLess(ct, st)
+
+    def test_found(self):
+        sweep = self._locate()
+        ctf = self._locate(coarse_to_fine=True)
+        for a, b in zip(sweep, ctf):
+            self.assertEqual(a is None, b is None)
+            if a is not None:
+                self.assertAlmostEqual(a[0], b[0], delta=3)
+                self.assertAlmostEqual(a[1], b[1], delta=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
+# ============= EOF =============================================
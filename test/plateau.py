@@ -0,0 +1,89 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import random
+import unittest
+
+from numpy import array
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.simple_timeit import timethis
+from pychron.processing.plateau import Plateau
+
+
+def loop_find_plateau(ages, errors, signals, nsteps=3, overlap_sigma=2, gas_fraction=50):
+    """
+    step by step fleck search. for every start walk the ends until a pair of steps fails to overlap
+    """
+    n = len(ages)
+    total = float(sum(signals))
+    best = []
+    for start in range(n):
+        end = None
+        for i in range(start, n):
+            if i - start + 1 < nsteps:
+                continue
+
+            if not all(ages[a] - errors[a] * overlap_sigma < ages[b] + errors[b] * overlap_sigma and
+                       ages[a] + errors[a] * overlap_sigma > ages[b] - errors[b] * overlap_sigma
+                       for a in range(start, i) for b in range(a + 1, i + 1)):
+                break
+
+            if sum(signals[start:i + 1]) / total >= gas_fraction / 100.:
+                end = i
+
+        if end and (not best or end - start > best[1] - best[0]):
+            best = start, end
+    return best
+
+
+class PlateauBenchmark(unittest.TestCase):
+    """
+    plateau search for 20 spectra of 50 steps
+    """
+    nspectra = 20
+    nsteps = 50
+
+    def setUp(self):
+        random.seed(1996)
+        self.spectra = []
+        for _ in range(self.nspectra):
+            ages = [10 + random.gauss(0, 0.5) for _ in range(self.nsteps)]
+            errors = [random.uniform(0.4, 1.2) for _ in range(self.nsteps)]
+            signals = [random.expovariate(1) for _ in range(self.nsteps)]
+            self.spectra.append((ages, errors, signals))
+
+    def _find_loop(self):
+        return [loop_find_plateau(*s) for s in self.spectra]
+
+    def _find_numpy(self):
+        return [Plateau(ages=array(a), errors=array(e), signals=array(s)).find_plateaus()
+                for a, e, s in self.spectra]
+
+    def test_equivalence(self):
+        self.assertEqual(self._find_numpy(), self._find_loop())
+
+    def test_speed(self):
+        lt = timethis(self._find_loop, msg='loop plateau', rettime=True)
+        nt = timethis(self._find_numpy, msg='numpy plateau', rettime=True)
+        self.assertLess(nt, lt)
+
+
+if __name__ == '__main__':
+    unittest.main()
+# ============= EOF =============================================
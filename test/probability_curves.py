@@ -0,0 +1,102 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import unittest
+
+from numpy import random
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.simple_timeit import timethis
+from pychron.core.stats.probability_curves import cumulative_probability, asymptotic_limits
+from pychron.core.stats.tests.probability_curves import loop_cumulative_probability
+
+N = 500
+
+
+def iterative_asymptotic_limits(cfunc, xmi, xma, max_iter=200, tol=0.1):
+    """
+    expand the window 0.5% per iteration until both ends are below tol x max
+    """
+    rx1, rx2 = None, None
+    x1, x2 = xmi, xma
+    step = 0.005 * (xma - xmi)
+    for i in range(max_iter):
+        x1 = x1 - step if rx1 is None else rx1
+        x2 = x2 + step if rx2 is None else rx2
+        step = 0.005 * (x2 - x1)
+
+        xs, ys = cfunc(x1, x2)
+        tt = tol * ys.max()
+        if rx1 is None and ys[0] < tt:
+            rx1 = x1
+        if rx2 is None and ys[-1] < tt:
+            rx2 = x2
+        if rx1 is not None and rx2 is not None:
+            break
+
+    return rx1 or x1, rx2 or x2
+
+
+class ProbabilityCurveBenchmark(unittest.TestCase):
+    """
+    ideogram with 4 groups of 1000 ages. two detrital style groups spread over 3 Ga and two tightly clustered
+    groups that need many iterations to expand the window to the asymptotic limits
+    """
+    nages = 1000
+
+    def setUp(self):
+        rng = random.RandomState(3)
+        n = self.nages
+        self.groups = [(rng.uniform(10, 3000, n), rng.uniform(1, 30, n)),
+                       (rng.uniform(10, 3000, n), rng.uniform(1, 30, n)),
+                       (rng.normal(100, 0.5, n), rng.uniform(0.5, 2, n)),
+                       (rng.normal(28.2, 0.05, n), rng.uniform(0.05, 0.2, n))]
+
+    def _loop(self):
+        for ages, errors in self.groups:
+            def cfunc(x1, x2):
+                return loop_cumulative_probability(ages, errors, x1, x2, n=N)
+
+            x1, x2 = iterative_asymptotic_limits(cfunc, ages.min(), ages.max())
+            cfunc(x1, x2)
+
+    def _vectorized(self):
+        for ages, errors in self.groups:
+            x1, x2 = asymptotic_limits(ages, errors, tol=0.1, n=N, use_cache=False)
+            cumulative_probability(ages, errors, x1, x2, n=N, use_cache=False)
+
+    def _cached(self):
+        for ages, errors in self.groups:
+            x1, x2 = asymptotic_limits(ages, errors, tol=0.1, n=N)
+            cumulative_probability(ages, errors, x1, x2, n=N)
+
+    def test_speed(self):
+        lt = timethis(self._loop, msg='loop', rettime=True)
+        vt = timethis(self._vectorized, msg='vectorized', rettime=True)
+        self.assertLess(vt, lt)
+
+    def test_replot_speed(self):
+        self._cached()
+        vt = timethis(self._vectorized, msg='vectorized', rettime=True)
+        ct = timethis(self._cached, msg='cached', rettime=True)
+        self.assertLess(ct, vt)
+
+
+if __name__ == '__main__':
+    unittest.main()
+# ============= EOF =============================================
@@ -0,0 +1,80 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import unittest
+
+from numpy import linspace, array, sqrt, allclose, random
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.simple_timeit import timethis
+from pychron.core.regression.ols_regressor import OLSRegressor
+from pychron.pychron_constants import SEM
+
+
+def loop_predict_error(reg, x):
+    """
+    one design row and triple product per point
+    """
+    sef = reg.calculate_standard_error_fit()
+    cv = array(reg.var_covar)
+
+    def calc(xi):
+        Xk = reg.get_exog(xi).T
+        return sef * sqrt(Xk.T.dot(cv).dot(Xk)[0, 0])
+
+    return [calc(xi) for xi in x]
+
+
+class PredictErrorBenchmark(unittest.TestCase):
+    """
+    error envelopes for one plot refresh. 100 isotopes x 500 points
+    """
+    nisotopes = 100
+    npts = 500
+
+    def setUp(self):
+        rng = random.default_rng(0)
+        xs = linspace(0, 400, 100)
+        self.regs = []
+        for i in range(self.nisotopes):
+            reg = OLSRegressor(xs=xs, ys=100 - 0.1 * xs + rng.normal(0, 0.5, 100),
+                               fit='parabolic' if i % 2 else 'linear')
+            reg.calculate()
+            self.regs.append(reg)
+
+        self.rx = linspace(0, 400, self.npts)
+
+    def _loop(self):
+        return [loop_predict_error(reg, self.rx) for reg in self.regs]
+
+    def _matrix(self):
+        return [reg.predict_error_matrix(self.rx, SEM) for reg in self.regs]
+
+    def test_equivalence(self):
+        for a, b in zip(self._loop(), self._matrix()):
+            self.assertTrue(allclose(a, b))
+
+    def test_speed(self):
+        lt = timethis(self._loop, msg='loop predict error', rettime=True)
+        mt = timethis(self._matrix, msg='matrix predict error', rettime=True)
+        self.assertLess(mt, lt)
+
+
+if __name__ == '__main__':
+    unittest.main()
+# ============= EOF =============================================
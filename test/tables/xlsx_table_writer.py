@@ -0,0 +1,100 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import resource
+import shutil
+import tempfile
+import unittest
+from multiprocessing import Process, Queue
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.simple_timeit import timethis
+from pychron.globals import globalv
+from pychron.paths import paths
+from pychron.pipeline.tables.tests.xlsx_table_writer import make_groups
+from pychron.pipeline.tables.xlsx_table_options import XLSXAnalysisTableWriterOptions
+from pychron.pipeline.tables.xlsx_table_writer import XLSXAnalysisTableWriter
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+NGROUPS = int(os.environ.get('PYCHRON_TABLE_NGROUPS', 30))
+NANALYSES = int(os.environ.get('PYCHRON_TABLE_NANALYSES', 100))
+
+
+def write_table(root, name, q, **kw):
+    """
+    write a table of synthetic groups and put (wall time, RSS growth in KB, file size, nformats) on ``q``.
+
+    run in a child process so the peak RSS of each table is measured separately
+    """
+    groups = make_groups(NGROUPS, NANALYSES)
+
+    options = XLSXAnalysisTableWriterOptions('xlsx_table_benchmark')
+    for k, v in kw.items():
+        setattr(options, k, v)
+
+    writer = XLSXAnalysisTableWriter()
+    writer._options = options
+    path = os.path.join(root, '{}.xlsx'.format(name))
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    et = timethis(writer._make_workbook, args=({'unknowns': groups, 'machine_unknowns': groups}, path),
+                  msg=name, rettime=True)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss
+
+    q.put((et, rss, os.path.getsize(path), len(writer._workbook.formats)))
+
+
+class XLSXTableWriterBenchmark(unittest.TestCase):
+    """
+    wall time, peak RSS and file size of a large table with the machine sheet streamed and kept in memory
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        paths.build(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, name, **kw):
+        q = Queue()
+        p = Process(target=write_table, args=(self.root, name, q), kwargs=kw)
+        p.start()
+        r = q.get()
+        p.join()
+
+        et, rss, size, nformats = r
+        print('{} {} groups x {} analyses: {:0.2f}s, peak RSS +{:0.1f} MB, {:0.2f} MB, {} formats'.format(
+            name, NGROUPS, NANALYSES, et, rss / 1024., size / 1024. ** 2, nformats))
+        return r
+
+    def test_machine_constant_memory(self):
+        _, mrss, _, mformats = self._write('in_memory', machine_constant_memory=False)
+        _, srss, _, sformats = self._write('streamed', machine_constant_memory=True)
+
+        self.assertLess(srss, mrss)
+        self.assertEqual(sformats, mformats)
+        self.assertLess(sformats, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
+# ============= EOF =============================================